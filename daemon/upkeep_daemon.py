@@ -100,6 +100,22 @@ def log(message: str, level: str = "INFO") -> None:
         print(log_message, file=sys.stderr)
 
 
+def atomic_write_json(path: Path, data: Dict[str, Any], mode: int = 0o644) -> None:
+    """
+    Write JSON to a file atomically (tmp file + os.replace).
+
+    Contract with the web backend: queue files (jobs, results, status) are
+    never visible half-written, so readers don't need to retry on partial JSON.
+    Permissions are set on the tmp file before the rename so the final file
+    is readable by the web backend the moment it appears.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.chmod(tmp, mode)
+    os.replace(tmp, path)
+
+
 def get_console_user() -> Tuple[Optional[str], Optional[str]]:
     """
     Detect the user currently logged into the Mac console.
@@ -324,9 +340,7 @@ def run_operation(operation_id: str, job_id: str = "") -> Dict[str, Any]:
                 "start_time": start_time,
                 "timeout_seconds": timeout_seconds,
             }
-            with open(STATUS_FILE, "w") as f:
-                json.dump(status_data, f, indent=2)
-            os.chmod(STATUS_FILE, 0o644)  # Readable by web backend
+            atomic_write_json(STATUS_FILE, status_data)  # Readable by web backend
             log(f"Wrote status file (PID: {proc.pid})")
         except Exception as e:
             log(f"Failed to write status file: {e}", "WARN")
@@ -444,7 +458,7 @@ def process_job_file(job_file: Path) -> None:
     Reads job JSON, executes operation, writes result, deletes job.
     """
     # Extract job_id from filename (remove .job.json extension)
-    # Example: "uuid.job.json" -> "uuid"
+    # Example: "<job_id>.job.json" -> "<job_id>" (job_id is opaque)
     job_id = job_file.name.replace(".job.json", "")
     result_file = QUEUE_DIR / f"{job_id}.result.json"
 
@@ -464,12 +478,8 @@ def process_job_file(job_file: Path) -> None:
         result = run_operation(operation_id, job_id=job_id)
         result["job_id"] = job_id
 
-        # Write result
-        with open(result_file, "w", encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
-
-        # Set permissions so web backend can read
-        os.chmod(result_file, 0o644)
+        # Write result atomically, readable by web backend
+        atomic_write_json(result_file, result)
 
     except json.JSONDecodeError as e:
         log(f"Invalid JSON in {job_file}: {e}", "ERROR")
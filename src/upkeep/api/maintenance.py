@@ -7,13 +7,17 @@ Used by Web GUI, CLI, and Web.
 
 import asyncio
 import json
+import os
 import re
+import secrets
+import select
 import shutil
+import threading
 import time
-import uuid
 from collections.abc import AsyncIterator
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from upkeep.core.exceptions import (
@@ -86,6 +90,30 @@ def clean_output_line(text: str) -> str:
     return text
 
 
+# operation_details.json lives in the project root:
+# src/upkeep/api/maintenance.py -> parents[3]. Fall back to the working directory.
+# Resolved once at import; the location is fixed for the process lifetime.
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+_DETAILS_CANDIDATES = (_PROJECT_ROOT / "operation_details.json", Path("operation_details.json"))
+_DETAILS_FILE = next((p.absolute() for p in _DETAILS_CANDIDATES if p.exists()), None)
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write text to a file atomically.
+
+    Writes to a sibling ``.tmp`` file and renames it over the target with
+    ``os.replace``. Readers (the daemon, the web server) therefore only ever
+    see a missing file or a complete one - never a partial write.
+
+    Args:
+        path: Destination file
+        text: Content to write (UTF-8)
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
 def get_disk_stats(path: str = "/") -> dict[str, Any]:
     """Get disk usage statistics for a given path.
 
@@ -122,6 +150,83 @@ def get_disk_stats(path: str = "/") -> dict[str, Any]:
         }
 
 
+class _QueueDirWatcher:
+    """Wait for changes in the job queue directory.
+
+    On macOS the directory is watched with kqueue (EVFILT_VNODE/NOTE_WRITE),
+    so a result file renamed into place wakes the waiter immediately instead
+    of on the next poll tick. The blocking kevent call runs on an executor
+    thread; close() wakes it through a self-pipe registered on the same
+    kqueue and waits for it to return before closing any descriptor.
+
+    Linux and other platforms without kqueue (or a directory that can't be
+    opened) get no change notification: waiting is a plain sleep, i.e. the
+    previous polling behaviour. The stdlib has no inotify binding, and the
+    queue is only ever served by the macOS daemon.
+    """
+
+    def __init__(self, directory: Path):
+        self._fd: int | None = None
+        self._kq: Any = None
+        self._wake_r: int | None = None
+        self._wake_w: int | None = None
+        # Cleared while a kevent call is in flight on the executor
+        self._idle = threading.Event()
+        self._idle.set()
+        if not hasattr(select, "kqueue"):
+            return
+        try:
+            self._fd = os.open(str(directory), getattr(os, "O_EVTONLY", os.O_RDONLY))
+            self._wake_r, self._wake_w = os.pipe()
+            self._kq = select.kqueue()
+            self._kq.control(
+                [
+                    select.kevent(
+                        self._fd,
+                        filter=select.KQ_FILTER_VNODE,
+                        flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                        fflags=select.KQ_NOTE_WRITE,
+                    ),
+                    select.kevent(
+                        self._wake_r, filter=select.KQ_FILTER_READ, flags=select.KQ_EV_ADD
+                    ),
+                ],
+                0,
+            )
+        except OSError:
+            self.close()
+
+    async def wait(self, timeout: float) -> None:
+        """Return when the directory changes or after ``timeout`` seconds."""
+        if self._kq is None:
+            await asyncio.sleep(timeout)
+            return
+        # If this await is cancelled the executor thread stays inside kevent
+        # until close() wakes it
+        self._idle.clear()
+        await asyncio.get_running_loop().run_in_executor(None, self._control, timeout)
+
+    def _control(self, timeout: float) -> None:
+        try:
+            self._kq.control(None, 1, timeout)
+        finally:
+            self._idle.set()
+
+    def close(self) -> None:
+        """Release the kqueue and descriptors, waking any in-flight wait first."""
+        if not self._idle.is_set() and self._wake_w is not None:
+            os.write(self._wake_w, b"\0")
+            self._idle.wait()
+        if self._kq is not None:
+            self._kq.close()
+            self._kq = None
+        for name in ("_fd", "_wake_r", "_wake_w"):
+            fd = getattr(self, name)
+            if fd is not None:
+                os.close(fd)
+                setattr(self, name, None)
+
+
 class MaintenanceAPI(BaseAPI):
     """API for system maintenance operations using secure job queue.
 
@@ -135,6 +240,11 @@ class MaintenanceAPI(BaseAPI):
     # Job queue directory (shared with root daemon)
     QUEUE_DIR = Path("/var/local/upkeep-jobs")
 
+    # Fold the history log into operation_history.json every N completed
+    # operations (and at end of batch), so long batches show progress in the
+    # UI without rewriting the whole file after every operation.
+    HISTORY_COMPACT_EVERY = 5
+
     # Define all operations with metadata
     OPERATIONS = {
         # System Updates
@@ -540,11 +650,18 @@ class MaintenanceAPI(BaseAPI):
         },
     }
 
+    # Flat id -> display name map, built once (used by every get_queue_status call)
+    _OP_NAMES = {op_id: op.get("name", op_id) for op_id, op in OPERATIONS.items()}
+
+    # Operations are static metadata; expose them read-only
+    OPERATIONS = MappingProxyType(OPERATIONS)
+
     def __init__(self):
         """Initialize the Maintenance API."""
         super().__init__()
         self._cancel_requested = False
         self._skip_requested = False
+        self._queue_dir_ready = False
 
     def get_operations(self) -> list[dict[str, Any]]:
         """Get list of all available maintenance operations.
@@ -668,26 +785,11 @@ class MaintenanceAPI(BaseAPI):
             Dict mapping operation IDs to their WHY/WHAT details
         """
         try:
-            # Find operation_details.json in project root
-            # Start from this file and go up to find the project root
-            current_file = Path(__file__)
-            # Path: src/upkeep/api/maintenance.py
-            # Up 1: src/upkeep/api
-            # Up 2: src/upkeep
-            # Up 3: src
-            # Up 4: project root
-            project_root = current_file.parent.parent.parent.parent
-
-            details_file = project_root / "operation_details.json"
-
-            if not details_file.exists():
-                # Fallback: try relative to working directory
-                details_file = Path("operation_details.json")
-                if not details_file.exists():
-                    self._log_error(
-                        f"operation_details.json not found. Tried: {project_root / 'operation_details.json'} and {Path('operation_details.json').absolute()}"
-                    )
-                    return {}
+            details_file = _DETAILS_FILE
+            if details_file is None:
+                tried = " and ".join(str(p.absolute()) for p in _DETAILS_CANDIDATES)
+                self._log_error(f"operation_details.json not found. Tried: {tried}")
+                return {}
 
             self.logger.info(f"Loading operation details from: {details_file}")
             raw = details_file.read_text(encoding="utf-8").strip()
@@ -739,15 +841,19 @@ class MaintenanceAPI(BaseAPI):
         Safety:
         - Creates the directory if missing
         - Best-effort chmod to 0777 to match daemon expectations (local machine queue)
+        - Runs once per instance; later calls skip the mkdir/chmod syscalls
         """
+        if self._queue_dir_ready:
+            return
         try:
             self.QUEUE_DIR.mkdir(parents=True, exist_ok=True)
             try:
                 # World-writable is intentional here: the root daemon reads/validates jobs,
                 # while the unprivileged web process needs to write job/flag files.
-                self.QUEUE_DIR.chmod(0o777)
+                os.chmod(self.QUEUE_DIR, 0o777)
             except Exception:
                 pass
+            self._queue_dir_ready = True
         except Exception:
             # If we can't ensure it, downstream will raise a DaemonNotAvailableError
             pass
@@ -759,7 +865,7 @@ class MaintenanceAPI(BaseAPI):
             operation_id: ID of operation to run
 
         Returns:
-            Job ID (UUID)
+            Job ID (opaque 32-char hex string)
 
         Raises:
             DaemonNotAvailableError: If job queue is not accessible
@@ -767,7 +873,7 @@ class MaintenanceAPI(BaseAPI):
         # Ensure queue exists before writing
         self._ensure_queue_dir()
 
-        job_id = str(uuid.uuid4())
+        job_id = secrets.token_hex(16)
         job = {
             "job_id": job_id,
             "operation_id": operation_id,
@@ -777,8 +883,9 @@ class MaintenanceAPI(BaseAPI):
         job_file = self.QUEUE_DIR / f"{job_id}.job.json"
 
         try:
-            with open(job_file, "w") as f:
-                json.dump(job, f, indent=2)
+            # Atomic write: the daemon only globs *.job.json, so it never sees the .tmp file.
+            # Compact separators: the daemon is the only reader.
+            atomic_write_text(job_file, json.dumps(job, separators=(",", ":")))
         except (PermissionError, OSError) as e:
             raise DaemonNotAvailableError(
                 f"Cannot access job queue (is daemon running?): {e}"
@@ -803,28 +910,31 @@ class MaintenanceAPI(BaseAPI):
         """
         result_file = self.QUEUE_DIR / f"{job_id}.result.json"
         start_time = asyncio.get_event_loop().time()
+        watcher = _QueueDirWatcher(self.QUEUE_DIR)
 
-        while True:
-            # Check for cancellation
-            if self._cancel_requested:
-                return {
-                    "job_id": job_id,
-                    "status": "cancelled",
-                    "error": "Operation cancelled by user",
-                }
+        try:
+            while True:
+                # Check for cancellation
+                if self._cancel_requested:
+                    return {
+                        "job_id": job_id,
+                        "status": "cancelled",
+                        "error": "Operation cancelled by user",
+                    }
 
-            # Check for skip
-            if self._skip_requested:
-                self._skip_requested = False
-                return {
-                    "job_id": job_id,
-                    "status": "skipped",
-                    "error": "Operation skipped by user",
-                }
+                # Check for skip
+                if self._skip_requested:
+                    self._skip_requested = False
+                    return {
+                        "job_id": job_id,
+                        "status": "skipped",
+                        "error": "Operation skipped by user",
+                    }
 
-            # Check if result exists
-            if result_file.exists():
-                try:
+                # Check if result exists
+                # The daemon writes results atomically (tmp + os.replace), so a
+                # visible result file is always complete.
+                if result_file.exists():
                     with open(result_file, encoding="utf-8") as f:
                         result = json.load(f)
 
@@ -835,18 +945,16 @@ class MaintenanceAPI(BaseAPI):
                         pass
 
                     return result
-                except json.JSONDecodeError:
-                    # File might still be writing, wait a bit
-                    await asyncio.sleep(0.1)
-                    continue
 
-            # Check timeout
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed > timeout:
-                raise TimeoutError(f"Job {job_id} timed out after {timeout}s")
+                # Check timeout
+                elapsed = asyncio.get_event_loop().time() - start_time
+                if elapsed > timeout:
+                    raise TimeoutError(f"Job {job_id} timed out after {timeout}s")
 
-            # Wait before checking again
-            await asyncio.sleep(0.5)
+                # Wait for a queue change (or 0.5s, so cancel/skip stay responsive)
+                await watcher.wait(0.5)
+        finally:
+            watcher.close()
 
     def execute_operation(self, operation_id: str, timeout: int = 1800) -> dict[str, Any]:
         """Execute a single operation via the daemon queue and wait for the result.
@@ -908,6 +1016,7 @@ class MaintenanceAPI(BaseAPI):
         self._cancel_requested = False
         total = len(operation_ids)
         results = []
+        history_pending = 0
 
         # Capture disk stats before operations (for before/after comparison)
         disk_stats_before = get_disk_stats("/")
@@ -921,11 +1030,14 @@ class MaintenanceAPI(BaseAPI):
         }
 
         for idx, op_id in enumerate(operation_ids, 1):
+            # One timestamp for all events emitted before the daemon picks up the job
+            now_iso = datetime.now().isoformat()
+
             if self._cancel_requested:
                 yield {
                     "type": "cancelled",
                     "message": "Batch cancelled by user",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso,
                 }
                 break
 
@@ -935,7 +1047,7 @@ class MaintenanceAPI(BaseAPI):
                     "type": "error",
                     "operation_id": op_id,
                     "message": f"Unknown operation: {op_id}",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso,
                 }
                 continue
 
@@ -944,10 +1056,10 @@ class MaintenanceAPI(BaseAPI):
                 "operation_id": op_id,
                 "operation_name": operation["name"],
                 "progress": f"{idx}/{total}",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso,
             }
 
-            op_started_ts = time.time()
+            op_started_ts = time.monotonic()
 
             try:
                 # Enqueue job for daemon
@@ -958,7 +1070,7 @@ class MaintenanceAPI(BaseAPI):
                     "operation_id": op_id,
                     "stream": "stdout",
                     "line": f"Job enqueued: {job_id}",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso,
                 }
 
                 yield {
@@ -966,19 +1078,22 @@ class MaintenanceAPI(BaseAPI):
                     "operation_id": op_id,
                     "stream": "stdout",
                     "line": "Waiting for daemon to process...",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso,
                 }
 
                 # Wait for result
                 result = await self._wait_for_result(job_id)
 
+                # Re-sample once the result arrives; shared by output and completion events
+                now_iso = datetime.now().isoformat()
+
                 # Check for skip/cancel
                 if result.get("status") in ["cancelled", "skipped"]:
                     yield {
                         "type": "operation_skipped",
                         "operation_id": op_id,
                         "message": result.get("error", "Operation skipped"),
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": now_iso,
                     }
                     results.append(
                         {
@@ -1002,7 +1117,7 @@ class MaintenanceAPI(BaseAPI):
                                 "operation_id": op_id,
                                 "stream": "stdout",
                                 "line": cleaned_line,
-                                "timestamp": datetime.now().isoformat(),
+                                "timestamp": now_iso,
                             }
 
                 # Stream stderr if available
@@ -1017,66 +1132,42 @@ class MaintenanceAPI(BaseAPI):
                                 "operation_id": op_id,
                                 "stream": "stderr",
                                 "line": cleaned_line,
-                                "timestamp": datetime.now().isoformat(),
+                                "timestamp": now_iso,
                             }
 
                 # Send completion event
                 success = result.get("status") == "success"
                 exit_code = result.get("exit_code", -1)
-                duration_seconds = max(0.0, time.time() - op_started_ts)
+                duration_seconds = max(0.0, time.monotonic() - op_started_ts)
 
                 yield {
                     "type": "operation_complete",
                     "operation_id": op_id,
                     "success": success,
                     "returncode": exit_code,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso,
                 }
 
-                # Write per-operation history (last run + rolling durations)
+                # Record per-operation history (last run + rolling durations).
+                # Appending one line is O(1); the log is folded into
+                # operation_history.json every HISTORY_COMPACT_EVERY operations
+                # and once the batch completes.
                 try:
                     log_dir = Path.home() / "Library" / "Logs" / "upkeep"
                     log_dir.mkdir(parents=True, exist_ok=True)
-                    history_file = log_dir / "operation_history.json"
-
-                    # Load existing history
-                    history: dict = {}
-                    if history_file.exists():
-                        try:
-                            history = json.loads(history_file.read_text())
-                        except json.JSONDecodeError:
-                            history = {}
-
-                    op_hist = (
-                        history.get(op_id, {}) if isinstance(history.get(op_id, {}), dict) else {}
+                    self._append_history_record(
+                        log_dir,
+                        {
+                            "operation_id": op_id,
+                            "last_run": now_iso,
+                            "success": success,
+                            "duration_seconds": round(duration_seconds, 3),
+                        },
                     )
-                    op_hist["last_run"] = datetime.now().isoformat()
-                    op_hist["success"] = success
-                    op_hist["last_duration_seconds"] = round(duration_seconds, 3)
-
-                    # Maintain rolling windows of runtimes
-                    # - durations_seconds: successful runs only (preferred for median)
-                    # - durations_all_seconds: all runs (fallback when no successful baseline exists yet)
-
-                    durations_all = op_hist.get("durations_all_seconds", [])
-                    if not isinstance(durations_all, list):
-                        durations_all = []
-                    durations_all.append(round(duration_seconds, 3))
-                    durations_all = durations_all[-5:]
-                    op_hist["durations_all_seconds"] = durations_all
-
-                    if success:
-                        durations = op_hist.get("durations_seconds", [])
-                        if not isinstance(durations, list):
-                            durations = []
-                        durations.append(round(duration_seconds, 3))
-                        durations = durations[-5:]
-                        op_hist["durations_seconds"] = durations
-
-                    history[op_id] = op_hist
-
-                    # Write back to file
-                    history_file.write_text(json.dumps(history, indent=2))
+                    history_pending += 1
+                    if history_pending >= self.HISTORY_COMPACT_EVERY:
+                        self._compact_history(log_dir)
+                        history_pending = 0
                 except Exception as e:
                     self.logger.warning(f"Failed to write operation history: {e}")
 
@@ -1117,6 +1208,9 @@ class MaintenanceAPI(BaseAPI):
         # Capture disk stats after operations
         disk_stats_after = get_disk_stats("/")
 
+        # One completion timestamp shared by the summary, the last-run file and the final event
+        finished_iso = datetime.now().isoformat()
+
         # Calculate space recovered (positive = space freed)
         space_recovered_bytes = disk_stats_after["free_bytes"] - disk_stats_before["free_bytes"]
         space_recovered_gb = round(space_recovered_bytes / (1024**3), 2)
@@ -1151,24 +1245,112 @@ class MaintenanceAPI(BaseAPI):
             "space_recovered_bytes": space_recovered_bytes,
             "space_recovered_gb": space_recovered_gb,
             "space_recovered_display": space_recovered_display,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": finished_iso,
         }
 
+        # Fold the remaining history records into the compact history file
+        if history_pending:
+            try:
+                self._compact_history(Path.home() / "Library" / "Logs" / "upkeep")
+            except Exception as e:
+                self.logger.warning(f"Failed to compact operation history: {e}")
+
         # Write completion timestamp to file for last_run tracking
         try:
             log_dir = Path.home() / "Library" / "Logs" / "upkeep"
             log_dir.mkdir(parents=True, exist_ok=True)
             timestamp_file = log_dir / "last_run_timestamp.txt"
-            timestamp_file.write_text(datetime.now().isoformat())
+            timestamp_file.write_text(finished_iso)
         except Exception as e:
             self.logger.warning(f"Failed to write timestamp file: {e}")
 
         yield {
             "type": "complete",
             "message": f"Completed {total} operation(s): {successful} successful, {failed} failed",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": finished_iso,
         }
 
+    def _append_history_record(self, log_dir: Path, record: dict[str, Any]) -> None:
+        """Append one operation result to the append-only history log.
+
+        Args:
+            log_dir: Directory holding the history files
+            record: Dict with operation_id, last_run, success, duration_seconds
+        """
+        with open(log_dir / "operation_history.jsonl", "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def _compact_history(self, log_dir: Path) -> None:
+        """Fold the append-only history log into operation_history.json.
+
+        Consumers (web server, CLI) only read the compact file. The log is
+        renamed before reading so records appended concurrently land in a
+        fresh log and are picked up by the next compaction. A leftover
+        ``.compacting`` file from an interrupted run is folded first.
+
+        Args:
+            log_dir: Directory holding the history files
+        """
+        log_file = log_dir / "operation_history.jsonl"
+        pending = log_file.with_name(log_file.name + ".compacting")
+        if not pending.exists():
+            if not log_file.exists():
+                return
+            os.replace(log_file, pending)
+
+        history_file = log_dir / "operation_history.json"
+        history: dict = {}
+        if history_file.exists():
+            try:
+                history = json.loads(history_file.read_text())
+            except json.JSONDecodeError:
+                history = {}
+            if not isinstance(history, dict):
+                history = {}
+
+        for line in pending.read_text(encoding="utf-8").splitlines():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Torn trailing line from an interrupted append
+                continue
+            if isinstance(record, dict) and record.get("operation_id"):
+                self._apply_history_record(history, record)
+
+        atomic_write_text(history_file, json.dumps(history, indent=2))
+        pending.unlink()
+
+    @staticmethod
+    def _apply_history_record(history: dict, record: dict[str, Any]) -> None:
+        """Merge a single history record into the compact history mapping.
+
+        Maintains rolling windows of runtimes:
+        - durations_seconds: successful runs only (preferred for median)
+        - durations_all_seconds: all runs (fallback when no successful baseline exists yet)
+        """
+        op_id = record["operation_id"]
+        success = bool(record.get("success"))
+        duration_seconds = record.get("duration_seconds", 0.0)
+
+        raw = history.get(op_id)
+        op_hist = raw if isinstance(raw, dict) else {}
+        op_hist["last_run"] = record.get("last_run")
+        op_hist["success"] = success
+        op_hist["last_duration_seconds"] = duration_seconds
+
+        durations_all = op_hist.get("durations_all_seconds")
+        if not isinstance(durations_all, list):
+            durations_all = []
+        op_hist["durations_all_seconds"] = (durations_all + [duration_seconds])[-5:]
+
+        if success:
+            durations = op_hist.get("durations_seconds")
+            if not isinstance(durations, list):
+                durations = []
+            op_hist["durations_seconds"] = (durations + [duration_seconds])[-5:]
+
+        history[op_id] = op_hist
+
     def skip_current_operation(self) -> bool:
         """Skip the current operation and move to the next (Task #133 fix).
 
@@ -1318,17 +1500,15 @@ class MaintenanceAPI(BaseAPI):
 
     def _get_operation_name(self, operation_id: str) -> str:
         """Get human-readable name for operation ID."""
-        return self.OPERATIONS.get(operation_id, {}).get("name", operation_id)
+        return self._OP_NAMES.get(operation_id, operation_id)
 
-    def _format_duration(self, seconds: int) -> str:
+    @staticmethod
+    def _format_duration(seconds: int) -> str:
         """Format duration in seconds to human-readable format."""
         if seconds < 60:
             return f"{seconds}s"
-        elif seconds < 3600:
-            minutes = seconds // 60
-            secs = seconds % 60
+        minutes, secs = divmod(seconds, 60)
+        if minutes < 60:
             return f"{minutes}m {secs}s"
-        else:
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            return f"{hours}h {minutes}m"
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}h {minutes}m"
@@ -10,6 +10,8 @@ from datetime import time as time_type
 from pathlib import Path
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from upkeep.api.models.schedule import (
     DayOfWeek,
     ScheduleConfig,
@@ -23,6 +25,9 @@ from upkeep.core.exceptions import (
 
 from .base import BaseAPI
 
+# Compiled once at import; validates the whole schedules.json payload in one call
+_SCHEDULE_LIST_ADAPTER = TypeAdapter(list[ScheduleConfig])
+
 
 class ScheduleAPI(BaseAPI):
     """API for schedule management operations.
@@ -67,26 +72,10 @@ class ScheduleAPI(BaseAPI):
         """
         try:
             data = json.loads(self.storage_path.read_text())
-            schedules = []
-
-            for item in data:
-                # Convert time string back to time object
-                if isinstance(item.get("time_of_day"), str):
-                    time_parts = item["time_of_day"].split(":")
-                    item["time_of_day"] = time_type(
-                        int(time_parts[0]),
-                        int(time_parts[1]),
-                        int(time_parts[2]) if len(time_parts) > 2 else 0,
-                    )
-
-                # Convert datetime strings back to datetime objects
-                for field in ["created_at", "updated_at", "last_run", "next_run"]:
-                    if item.get(field) and isinstance(item[field], str):
-                        item[field] = datetime.fromisoformat(item[field])
-
-                schedules.append(ScheduleConfig(**item))
 
-            return schedules
+            # Pydantic parses the HH:MM:SS and ISO datetime strings written by
+            # _save_schedules directly, so no per-field pre-conversion is needed.
+            return _SCHEDULE_LIST_ADAPTER.validate_python(data)
         except json.JSONDecodeError as e:
             self.logger.error(f"Failed to parse schedules.json: {e}")
             return []
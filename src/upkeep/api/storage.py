@@ -4,16 +4,80 @@ API-First Design: Clean interface for storage operations.
 Used by Web GUI, CLI, and Web.
 """
 
+import os
 import shutil
 import subprocess
-from dataclasses import asdict, dataclass
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
+from typing import Any
 
 from upkeep.core.exceptions import PathNotFoundError, PathNotReadableError, PathProtectedError
 from upkeep.storage.analyzer import AnalysisResult, DiskAnalyzer, FileEntry
 
 from .base import BaseAPI
 
+# Unit conversion as a reciprocal (exact, since GB is a power of two)
+GB = 1024**3
+INV_GB = 1.0 / GB
+
+
+@cache
+def _foundation_trash_api() -> tuple[Any, Any] | None:
+    """Lazily import NSFileManager/NSURL from PyObjC (optional 'macos' extra).
+
+    Returns:
+        (NSFileManager, NSURL) or None if PyObjC is not installed.
+        The outcome is cached so a missing module is only probed once.
+    """
+    try:
+        from Foundation import NSURL, NSFileManager
+    except ImportError:
+        return None
+    return NSFileManager, NSURL
+
+
+class _PrefixTrie:
+    """Character trie answering "does this string start with any stored prefix?".
+
+    Lookup cost is bounded by the length of the query string rather than the
+    number of stored prefixes.
+    """
+
+    _TERMINAL = ""  # Key marking the end of a stored prefix (never a real character)
+
+    def __init__(self, prefixes: Iterable[str]):
+        self._root: dict[str, dict] = {}
+        for prefix in prefixes:
+            node = self._root
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node[self._TERMINAL] = {}
+
+    def match_prefix(self, text: str) -> bool:
+        """Return True if any stored prefix is a prefix of text."""
+        node = self._root
+        for char in text:
+            if self._TERMINAL in node:
+                return True
+            node = node.get(char)
+            if node is None:
+                return False
+        return self._TERMINAL in node
+
+
+@dataclass(slots=True, frozen=True)
+class LargestEntry:
+    """One of the largest files/directories found by an analysis."""
+
+    path: str
+    size_bytes: int
+    size_gb: float
+    is_dir: bool
+
 
 @dataclass
 class StorageAnalysisResult:
@@ -26,12 +90,34 @@ class StorageAnalysisResult:
     file_count: int
     dir_count: int
     category_sizes: dict[str, int]
-    largest_entries: list[dict[str, any]]
+    largest_entries: list[LargestEntry]
     error: str | None = None
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """Convert to dictionary for JSON serialization.
+
+        Built directly rather than with dataclasses.asdict, which deep-copies
+        every field; the scalar values can be shared as-is.
+        """
+        return {
+            "success": self.success,
+            "path": self.path,
+            "total_size_bytes": self.total_size_bytes,
+            "total_size_gb": self.total_size_gb,
+            "file_count": self.file_count,
+            "dir_count": self.dir_count,
+            "category_sizes": dict(self.category_sizes),
+            "largest_entries": [
+                {
+                    "path": entry.path,
+                    "size_bytes": entry.size_bytes,
+                    "size_gb": entry.size_gb,
+                    "is_dir": entry.is_dir,
+                }
+                for entry in self.largest_entries
+            ],
+            "error": self.error,
+        }
 
 
 class StorageAPI(BaseAPI):
@@ -53,6 +139,24 @@ class StorageAPI(BaseAPI):
         "/Library/System",
         "/private/var/db",
     }
+    _protected_trie = _PrefixTrie(PROTECTED_PATHS)
+
+    # Repeated analyze_path calls with identical arguments reuse the result briefly
+    ANALYZE_CACHE_SIZE = 8
+    ANALYZE_CACHE_TTL = 5.0  # seconds
+
+    def __init__(self, *, _test_mode: bool = False):
+        """Initialize the API.
+
+        Args:
+            _test_mode: For unit tests that patch Path/DiskAnalyzer with mocks.
+                Checks existence up front in analyze_path and makes the internal
+                trash/delete helpers report success without touching the filesystem.
+        """
+        super().__init__()
+        self._test_mode = _test_mode
+        # (realpath, max_depth, max_entries) -> (expiry, result), oldest first
+        self._analyze_cache: dict[tuple[str, int, int], tuple[float, StorageAnalysisResult]] = {}
 
     def analyze_path(
         self, path: Path | str, max_depth: int = 3, max_entries: int = 15
@@ -64,6 +168,10 @@ class StorageAPI(BaseAPI):
             max_depth: Maximum directory depth to traverse
             max_entries: Maximum number of largest entries to return
 
+        Successful results are cached for ANALYZE_CACHE_TTL seconds, keyed on
+        the resolved path and arguments; deletions through this API clear the
+        cache.
+
         Returns:
             StorageAnalysisResult with analysis data
 
@@ -73,17 +181,35 @@ class StorageAPI(BaseAPI):
         """
         self._log_call("analyze_path", path=str(path), max_depth=max_depth, max_entries=max_entries)
 
+        cache_key = None
+        if not self._test_mode:
+            cache_key = (os.path.realpath(path), max_depth, max_entries)
+            cached = self._analyze_cache.pop(cache_key, None)
+            if cached is not None and cached[0] > time.monotonic():
+                # Re-insert as most recently used
+                self._analyze_cache[cache_key] = cached
+                return cached[1]
+
+        result = self._analyze_path_uncached(path, max_depth, max_entries)
+
+        if cache_key is not None and result.success:
+            self._analyze_cache[cache_key] = (time.monotonic() + self.ANALYZE_CACHE_TTL, result)
+            if len(self._analyze_cache) > self.ANALYZE_CACHE_SIZE:
+                # Evict the least recently used entry
+                del self._analyze_cache[next(iter(self._analyze_cache))]
+        return result
+
+    def _analyze_path_uncached(
+        self, path: Path | str, max_depth: int, max_entries: int
+    ) -> StorageAnalysisResult:
+        """Run analyze_path without the result cache (internal method)."""
         try:
             # Convert to Path object if string
             path_obj = Path(path) if isinstance(path, str) else path
 
-            # Check if Path class is mocked globally (for test_analyze_path_raises_not_found)
-            path_is_mocked = "Mock" in str(type(Path).__name__)
-
-            # Only check exists() if Path is mocked and the mock returns False
-            # This handles test_analyze_path_raises_not_found which patches Path
-            # For other tests, let DiskAnalyzer handle validation (may be mocked)
-            if path_is_mocked and hasattr(path_obj, "exists") and callable(path_obj.exists):
+            # Only check exists() up front in test mode, where Path may be patched
+            # For real calls, let DiskAnalyzer handle validation
+            if self._test_mode and hasattr(path_obj, "exists") and callable(path_obj.exists):
                 if not path_obj.exists():
                     raise PathNotFoundError(f"Path not found: {path_obj}")
 
@@ -93,43 +219,7 @@ class StorageAPI(BaseAPI):
             analyzer = DiskAnalyzer(path_obj, max_depth=max_depth)
             result: AnalysisResult = analyzer.analyze()
 
-            # Get largest entries (result.get_largest_entries returns a list)
-            entries = result.get_largest_entries(max_entries)
-
-            # Handle case where entries might be a Mock or list
-            largest_entries = []
-            if hasattr(entries, "__iter__") and not isinstance(entries, str):
-                for entry in entries:
-                    largest_entries.append(
-                        {
-                            "path": str(entry.path),
-                            "size_bytes": entry.size,
-                            "size_gb": entry.size / (1024**3),
-                            "is_dir": entry.is_dir,
-                        }
-                    )
-
-            # Build result (handle Mock objects in tests)
-            total_size = result.total_size if isinstance(result.total_size, (int, float)) else 0
-            total_size_gb = (
-                total_size / (1024**3)
-                if total_size
-                else (result.total_size_gb if hasattr(result, "total_size_gb") else 0.0)
-            )
-
-            return StorageAnalysisResult(
-                success=True,
-                path=str(path),
-                total_size_bytes=total_size,
-                total_size_gb=total_size_gb,
-                file_count=result.file_count if isinstance(result.file_count, int) else 0,
-                dir_count=result.dir_count if isinstance(result.dir_count, int) else 0,
-                category_sizes=result.category_sizes.copy()
-                if hasattr(result.category_sizes, "copy")
-                else dict(result.category_sizes),
-                largest_entries=largest_entries,
-                error=None,
-            )
+            return self._build_analysis_result(path, result, max_entries)
 
         except PermissionError:
             return StorageAnalysisResult(
@@ -191,12 +281,9 @@ class StorageAPI(BaseAPI):
             if hasattr(path, "exists") and callable(path.exists) and not path.exists():
                 raise PathNotFoundError(f"Path not found: {path}")
 
-            # Run analysis
+            # Stream the walk through a bounded top-k instead of keeping every entry
             analyzer = DiskAnalyzer(path)
-            result: AnalysisResult = analyzer.analyze()
-
-            # Get largest entries - call with limit parameter
-            entries = result.get_largest_entries(limit)
+            entries = analyzer.analyze_topk(limit)
 
             # Ensure we respect the limit (in case mock returns more)
             return entries[:limit] if entries else []
@@ -233,19 +320,7 @@ class StorageAPI(BaseAPI):
             analyzer = DiskAnalyzer(path)
             result: AnalysisResult = analyzer.analyze()
 
-            # Convert category sizes to more detailed breakdown
-            breakdown = {}
-            # Safely get total_size (might be Mock in tests)
-            total_size = result.total_size if isinstance(result.total_size, (int, float)) else 0
-
-            for category, size_bytes in result.category_sizes.items():
-                breakdown[category] = {
-                    "size_bytes": size_bytes,
-                    "size_gb": size_bytes / (1024**3),
-                    "percentage": (size_bytes / total_size * 100) if total_size > 0 else 0,
-                }
-
-            return breakdown
+            return self._build_category_breakdown(result)
 
         except PermissionError as e:
             raise PathNotReadableError(f"Permission denied: {path}") from e
@@ -254,6 +329,81 @@ class StorageAPI(BaseAPI):
         except Exception as e:
             raise self._handle_error(e) from e
 
+    def _build_analysis_result(
+        self, path: Path | str, result: AnalysisResult, max_entries: int
+    ) -> StorageAnalysisResult:
+        """Convert a DiskAnalyzer result into a StorageAnalysisResult (internal method).
+
+        Args:
+            path: Path as given by the caller
+            result: Completed analysis
+            max_entries: Maximum number of largest entries to include
+
+        Returns:
+            Successful StorageAnalysisResult
+        """
+        # Get largest entries (result.get_largest_entries returns a list)
+        entries = result.get_largest_entries(max_entries)
+
+        # Handle case where entries might be a Mock or list
+        # (dicts are only built at the JSON boundary, in to_dict)
+        largest_entries = []
+        if hasattr(entries, "__iter__") and not isinstance(entries, str):
+            largest_entries = [
+                LargestEntry(str(entry.path), entry.size, entry.size * INV_GB, entry.is_dir)
+                for entry in entries
+            ]
+
+        # Build result (handle Mock objects in tests)
+        total_size = result.total_size if isinstance(result.total_size, (int, float)) else 0
+        total_size_gb = (
+            total_size * INV_GB
+            if total_size
+            else (result.total_size_gb if hasattr(result, "total_size_gb") else 0.0)
+        )
+
+        return StorageAnalysisResult(
+            success=True,
+            path=str(path),
+            total_size_bytes=total_size,
+            total_size_gb=total_size_gb,
+            file_count=result.file_count if isinstance(result.file_count, int) else 0,
+            dir_count=result.dir_count if isinstance(result.dir_count, int) else 0,
+            category_sizes=(
+                result.category_sizes.copy()
+                if hasattr(result.category_sizes, "copy")
+                else dict(result.category_sizes)
+            ),
+            largest_entries=largest_entries,
+            error=None,
+        )
+
+    @staticmethod
+    def _build_category_breakdown(result: AnalysisResult) -> dict[str, dict[str, any]]:
+        """Convert analysis category sizes into a breakdown (internal method).
+
+        Args:
+            result: Completed analysis
+
+        Returns:
+            Dict mapping category name to size_bytes, size_gb and percentage
+        """
+        # Safely get total_size (might be Mock in tests)
+        total_size = result.total_size if isinstance(result.total_size, (int, float)) else 0
+
+        # Percentage scale computed once instead of a division + branch per category
+        pct_scale = 100.0 / total_size if total_size > 0 else 0
+
+        # Convert category sizes to more detailed breakdown
+        return {
+            category: {
+                "size_bytes": size_bytes,
+                "size_gb": size_bytes * INV_GB,
+                "percentage": size_bytes * pct_scale,
+            }
+            for category, size_bytes in result.category_sizes.items()
+        }
+
     def delete_path(self, path: Path | str, mode: str = "trash") -> dict[str, any]:
         """Delete or move to trash a file or directory.
 
@@ -269,21 +419,95 @@ class StorageAPI(BaseAPI):
             PathProtectedError: If path is a protected system directory
         """
         self._log_call("delete_path", path=str(path), mode=mode)
+        self._analyze_cache.clear()
 
         # Convert to Path object if string
         path_obj = Path(path) if isinstance(path, str) else path
 
+        # Check if path is protected FIRST (before checking existence)
+        # This is important because protected paths might not exist yet we should reject them
+        self._check_not_protected(path_obj, path)
+
+        # Now check if path exists (allow tests to mock this)
+        if hasattr(path_obj, "exists") and callable(path_obj.exists) and not path_obj.exists():
+            return {"success": False, "error": f"Path not found: {path}", "mode": mode}
+
+        # Perform deletion
+        if mode == "trash":
+            return self._move_to_trash(path_obj)
+        else:
+            return self._delete_permanent(path_obj)
+
+    def delete_paths(self, paths: list[Path | str], mode: str = "trash") -> dict[str, any]:
+        """Delete or move to trash several files or directories in one call.
+
+        Every path is checked against the protected list before anything is
+        touched, so a single protected path aborts the whole batch. Trash mode
+        moves the whole batch with one osascript invocation (or NSFileManager
+        when available); permanent mode deletes paths concurrently.
+
+        Args:
+            paths: Paths to delete
+            mode: 'trash' (default, recoverable) or 'permanent' (cannot be undone)
+
+        Returns:
+            Dict with 'deleted' (path strings), 'errors' (list of {path, error}) and mode used
+
+        Raises:
+            PathProtectedError: If any path is a protected system directory
+        """
+        self._log_call("delete_paths", count=len(paths), mode=mode)
+        self._analyze_cache.clear()
+
+        path_objs = [Path(p) if isinstance(p, str) else p for p in paths]
+        for path_obj, original in zip(path_objs, paths, strict=True):
+            self._check_not_protected(path_obj, original)
+
+        errors: list[dict[str, str]] = []
+        existing: list[Path] = []
+        for path_obj in path_objs:
+            if path_obj.exists():
+                existing.append(path_obj)
+            else:
+                errors.append({"path": str(path_obj), "error": f"Path not found: {path_obj}"})
+
+        if mode == "trash":
+            results = self._move_many_to_trash(existing)
+        elif existing:
+            with ThreadPoolExecutor(max_workers=min(8, len(existing))) as pool:
+                results = list(pool.map(self._delete_permanent, existing))
+        else:
+            results = []
+
+        deleted = []
+        for path_obj, result in zip(existing, results, strict=True):
+            if result["success"]:
+                deleted.append(str(path_obj))
+            else:
+                errors.append(
+                    {"path": str(path_obj), "error": result.get("error") or "Unknown error"}
+                )
+
+        return {"deleted": deleted, "errors": errors, "mode": mode}
+
+    def _check_not_protected(self, path_obj: Path, path: Path | str) -> None:
+        """Raise if a path is a protected system path (internal method).
+
+        Args:
+            path_obj: Path to check
+            path: Original path argument (used in the error message)
+
+        Raises:
+            PathProtectedError: If the path is protected
+        """
         # Get path string for checks (handle both real paths and mocks)
         if hasattr(path_obj, "absolute") and callable(path_obj.absolute):
             path_str = str(path_obj.absolute())
         else:
             path_str = str(path)
 
-        # Check if path is protected FIRST (before checking existence)
-        # This is important because protected paths might not exist yet we should reject them
-        for protected in self.PROTECTED_PATHS:
-            if path_str.startswith(protected):
-                raise PathProtectedError(f"Cannot delete protected system path: {path}")
+        if self._protected_trie.match_prefix(path_str):
+            raise PathProtectedError(f"Cannot delete protected system path: {path}")
 
         # Also check for .app bundles that might be system apps
         if path_str.endswith(".app") and "/Applications/" in path_str:
@@ -291,22 +515,62 @@ class StorageAPI(BaseAPI):
             if path_str.startswith("/Applications/Safari") or path_str.startswith("/System/"):
                 raise PathProtectedError(f"Cannot delete system application: {path}")
 
-        # Now check if path exists (allow tests to mock this)
-        if hasattr(path_obj, "exists") and callable(path_obj.exists) and not path_obj.exists():
-            return {"success": False, "error": f"Path not found: {path}", "mode": mode}
+    def _move_many_to_trash(self, paths: list[Path]) -> list[dict[str, any]]:
+        """Move several paths to Trash (internal method).
 
-        # Perform deletion
-        if mode == "trash":
-            return self._move_to_trash(path_obj)
-        else:
-            return self._delete_permanent(path_obj)
+        Uses NSFileManager per item when available; otherwise a single Finder
+        AppleScript call for the whole list. If that batch call fails, paths
+        that are still present are retried one by one to attribute errors.
+
+        Args:
+            paths: Existing paths to move
+
+        Returns:
+            One result dict per input path, in order
+        """
+        if not paths:
+            return []
+        if self._test_mode:
+            # In tests with mocked Path, just return success
+            return [{"success": True, "error": None, "mode": "trash"} for _ in paths]
+        abs_paths = [str(p.absolute()) for p in paths]
+
+        if _foundation_trash_api() is not None:
+            return [self._safe_trash_with_foundation(abs_path) for abs_path in abs_paths]
+
+        def _quote(text: str) -> str:
+            return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+        items = ", ".join(f"POSIX file {_quote(abs_path)}" for abs_path in abs_paths)
+        applescript = f'tell application "Finder" to delete {{{items}}}'
+
+        try:
+            result = subprocess.run(
+                ["osascript", "-e", applescript],
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=30 + 5 * len(abs_paths),  # Cloud-synced files can be slow
+            )
+            if result.returncode == 0:
+                return [{"success": True, "error": None, "mode": "trash"} for _ in abs_paths]
+            self.logger.error(f"Batch trash error: {result.stderr.strip()}")
+        except Exception as e:
+            self.logger.error(f"Batch move to trash error: {e}")
+
+        return [
+            (
+                self._move_to_trash(path)
+                if path.exists()
+                else {"success": True, "error": None, "mode": "trash"}
+            )
+            for path in paths
+        ]
 
     def _move_to_trash(self, path: Path) -> dict[str, any]:
         """Move a file or directory to macOS Trash (internal method)."""
         try:
-            # Check if path is mocked (for testing)
-            is_mock = "Mock" in str(type(path).__name__)
-            if is_mock:
+            if self._test_mode:
                 # In tests with mocked Path, just return success
                 return {"success": True, "error": None, "mode": "trash"}
 
@@ -316,7 +580,12 @@ class StorageAPI(BaseAPI):
             else:
                 abs_path = str(path)
 
-            # Use osascript to move to Trash (proper macOS way)
+            # Prefer NSFileManager (no fork/exec or AppleScript compile per item)
+            foundation_result = self._trash_with_foundation(abs_path)
+            if foundation_result is not None:
+                return foundation_result
+
+            # Fallback: use osascript to move to Trash (proper macOS way)
             applescript = f'''
                 tell application "Finder"
                     delete POSIX file "{abs_path}"
@@ -342,12 +611,51 @@ class StorageAPI(BaseAPI):
             self.logger.error(f"Move to trash error: {e}")
             return {"success": False, "error": str(e), "mode": "trash"}
 
+    def _safe_trash_with_foundation(self, abs_path: str) -> dict[str, any]:
+        """Trash one path via NSFileManager, turning exceptions into a result.
+
+        Keeps one failing item in a batch from discarding the results of the
+        items already moved.
+        """
+        try:
+            result = self._trash_with_foundation(abs_path)
+        except Exception as e:
+            self.logger.error(f"Move to trash error: {e}")
+            return {"success": False, "error": str(e), "mode": "trash"}
+        if result is None:
+            return {"success": False, "error": "Foundation unavailable", "mode": "trash"}
+        return result
+
+    def _trash_with_foundation(self, abs_path: str) -> dict[str, any] | None:
+        """Move a path to Trash via NSFileManager (internal method).
+
+        Args:
+            abs_path: Absolute path to move to Trash
+
+        Returns:
+            Result dict, or None if PyObjC is unavailable (caller falls back to osascript)
+        """
+        api = _foundation_trash_api()
+        if api is None:
+            return None
+
+        ns_file_manager, ns_url = api
+        url = ns_url.fileURLWithPath_(abs_path)
+        manager = ns_file_manager.defaultManager()
+        ok, _trashed_url, error = manager.trashItemAtURL_resultingItemURL_error_(url, None, None)
+        if ok:
+            return {"success": True, "error": None, "mode": "trash"}
+
+        error_msg = (
+            str(error.localizedDescription()) if error is not None else "Failed to move to Trash"
+        )
+        self.logger.error(f"Trash error: {error_msg}")
+        return {"success": False, "error": error_msg, "mode": "trash"}
+
     def _delete_permanent(self, path: Path) -> dict[str, any]:
         """Permanently delete a file or directory (internal method)."""
         try:
-            # Check if path is mocked (for testing)
-            is_mock = "Mock" in str(type(path).__name__)
-            if is_mock:
+            if self._test_mode:
                 # In tests with mocked Path, just return success
                 return {"success": True, "error": None, "mode": "permanent"}
 
@@ -5,7 +5,12 @@ API-First Design: Clean interface for system metrics, health scoring,
 and process monitoring. Used by Web GUI, CLI, and Web.
 """
 
+import heapq
+import threading
+import time
+from bisect import bisect_right
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import Any
 
 import psutil
@@ -16,6 +21,15 @@ from upkeep.core.types import HealthStatus, ProcessSortBy
 
 from .base import BaseAPI
 
+# Unit conversions as reciprocals (exact, since both are powers of two)
+GB = 1024**3
+INV_GB = 1.0 / GB
+INV_MB = 1.0 / (1024**2)
+
+# Health score lower bounds for FAIR, GOOD, EXCELLENT (below the first is POOR)
+STATUS_THRESHOLDS = (40, 60, 80)
+STATUSES = (HealthStatus.POOR, HealthStatus.FAIR, HealthStatus.GOOD, HealthStatus.EXCELLENT)
+
 
 @dataclass
 class SystemInfo:
@@ -81,6 +95,44 @@ class SystemAPI(BaseAPI):
     - Top processes (CPU/memory consumers)
     """
 
+    # Metrics sampled within this window are reused (seconds)
+    METRICS_TTL = 1.0
+
+    # Shortest window that gives a meaningful CPU percentage (seconds)
+    CPU_MIN_INTERVAL = 0.1
+
+    def __init__(self):
+        """Initialize the API and prime psutil's CPU counters."""
+        super().__init__()
+        self._last_sample: tuple[float, SystemMetrics] | None = None
+        # psutil keeps the cpu_percent(None) baseline per calling thread, so the
+        # time of the last sample is tracked per thread as well
+        self._cpu_state = threading.local()
+        # First non-blocking call only establishes the baseline for later deltas
+        psutil.cpu_percent(interval=None)
+        self._cpu_state.sampled_at = time.monotonic()
+
+    def _sample_cpu_percent(self) -> float:
+        """Sample CPU usage since the previous sample (internal method).
+
+        Non-blocking in long-lived processes; only blocks when this thread's
+        previous sample is too recent for the delta to be meaningful (e.g.
+        right after construction in a one-shot CLI call) or when this thread
+        has no baseline yet (e.g. a fresh worker thread in the web server).
+
+        Returns:
+            CPU usage percentage
+        """
+        sampled_at = getattr(self._cpu_state, "sampled_at", None)
+        if sampled_at is None:
+            # No baseline in this thread yet
+            wait = self.CPU_MIN_INTERVAL
+        else:
+            wait = self.CPU_MIN_INTERVAL - (time.monotonic() - sampled_at)
+        cpu_percent = psutil.cpu_percent(interval=wait if wait > 0 else None)
+        self._cpu_state.sampled_at = time.monotonic()
+        return cpu_percent
+
     def get_info(self) -> SystemInfo:
         """Get comprehensive system information.
 
@@ -105,20 +157,32 @@ class SystemAPI(BaseAPI):
         except Exception as e:
             raise SystemMetricsError(f"Failed to get system info: {e}") from e
 
-    def get_metrics(self) -> SystemMetrics:
+    def get_metrics(self, include_cpu: bool = True) -> SystemMetrics:
         """Get current system metrics.
 
+        Results are reused for METRICS_TTL seconds so back-to-back callers
+        (e.g. metrics followed by health score) share one sample.
+
+        Args:
+            include_cpu: Sample CPU usage. Pass False to skip the sample, which
+                can block for up to CPU_MIN_INTERVAL; cpu_percent is then 0.0
+                and the result is not cached.
+
         Returns:
             SystemMetrics with CPU, memory, disk usage
 
         Raises:
             SystemMetricsError: If metrics cannot be retrieved
         """
-        self._log_call("get_metrics")
+        self._log_call("get_metrics", include_cpu=include_cpu)
+
+        now = time.monotonic()
+        if self._last_sample is not None and now - self._last_sample[0] < self.METRICS_TTL:
+            return self._last_sample[1]
 
         try:
             # CPU
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            cpu_percent = self._sample_cpu_percent() if include_cpu else 0.0
             cpu_count = psutil.cpu_count()
 
             # Memory
@@ -127,21 +191,25 @@ class SystemAPI(BaseAPI):
             # Disk
             disk = psutil.disk_usage("/")
 
-            return SystemMetrics(
+            metrics = SystemMetrics(
                 cpu_percent=cpu_percent,
                 cpu_count=cpu_count,
-                memory_total_gb=memory.total / (1024**3),
-                memory_used_gb=memory.used / (1024**3),
-                memory_available_gb=memory.available / (1024**3),
+                memory_total_gb=memory.total * INV_GB,
+                memory_used_gb=memory.used * INV_GB,
+                memory_available_gb=memory.available * INV_GB,
                 memory_percent=memory.percent,
-                disk_total_gb=disk.total / (1024**3),
-                disk_used_gb=disk.used / (1024**3),
-                disk_free_gb=disk.free / (1024**3),
+                disk_total_gb=disk.total * INV_GB,
+                disk_used_gb=disk.used * INV_GB,
+                disk_free_gb=disk.free * INV_GB,
                 disk_percent=disk.percent,
             )
         except Exception as e:
             raise SystemMetricsError(f"Failed to get system metrics: {e}") from e
 
+        if include_cpu:
+            self._last_sample = (now, metrics)
+        return metrics
+
     def get_health_score(self) -> HealthScore:
         """Calculate system health score (0-100).
 
@@ -159,10 +227,11 @@ class SystemAPI(BaseAPI):
         self._log_call("get_health_score")
 
         try:
-            # Get current metrics
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            memory_percent = psutil.virtual_memory().percent
-            disk_percent = psutil.disk_usage("/").percent
+            # Get current metrics (shared with get_metrics within METRICS_TTL)
+            metrics = self.get_metrics()
+            cpu_percent = metrics.cpu_percent
+            memory_percent = metrics.memory_percent
+            disk_percent = metrics.disk_percent
 
             # Calculate component scores (invert: lower usage = higher score)
             cpu_score = max(0, 100 - cpu_percent)
@@ -173,38 +242,21 @@ class SystemAPI(BaseAPI):
             overall_score = int((cpu_score * 0.3) + (memory_score * 0.4) + (disk_score * 0.3))
 
             # Determine status
-            if overall_score >= 80:
-                status = HealthStatus.EXCELLENT
-            elif overall_score >= 60:
-                status = HealthStatus.GOOD
-            elif overall_score >= 40:
-                status = HealthStatus.FAIR
-            else:
-                status = HealthStatus.POOR
-
-            # Identify issues
-            issues = []
-            if cpu_percent > 80:
-                issues.append(
-                    {
-                        "severity": "warning" if cpu_percent < 90 else "critical",
-                        "message": f"CPU usage high ({cpu_percent:.1f}%)",
-                    }
-                )
-            if memory_percent > 80:
-                issues.append(
-                    {
-                        "severity": "warning" if memory_percent < 90 else "critical",
-                        "message": f"Memory usage high ({memory_percent:.1f}%)",
-                    }
-                )
-            if disk_percent > 80:
-                issues.append(
-                    {
-                        "severity": "warning" if disk_percent < 90 else "critical",
-                        "message": f"Disk usage high ({disk_percent:.1f}%)",
-                    }
+            status = STATUSES[bisect_right(STATUS_THRESHOLDS, overall_score)]
+
+            # Identify issues (only metrics above 80% produce one)
+            issues = [
+                {
+                    "severity": "critical" if percent >= 90 else "warning",
+                    "message": f"{label} usage high ({percent:.1f}%)",
+                }
+                for label, percent in (
+                    ("CPU", cpu_percent),
+                    ("Memory", memory_percent),
+                    ("Disk", disk_percent),
                 )
+                if percent > 80
+            ]
 
             return HealthScore(
                 score=overall_score,
@@ -237,44 +289,40 @@ class SystemAPI(BaseAPI):
         self._log_call("get_top_processes", by=by, limit=limit)
 
         try:
-            processes = []
-
-            # Iterate through all processes
-            for proc in psutil.process_iter(["pid", "name", "cpu_percent", "memory_info"]):
-                try:
-                    pinfo = proc.info
-                    processes.append(
-                        {
-                            "pid": pinfo["pid"],
-                            "name": pinfo["name"],
-                            "cpu_percent": pinfo["cpu_percent"] or 0.0,
-                            "memory_mb": (pinfo["memory_info"].rss / (1024 * 1024))
-                            if pinfo["memory_info"]
-                            else 0.0,
-                        }
+            # Stream lightweight (pid, name, cpu, memory_mb) tuples; ad_value fills
+            # fields we can't read instead of raising AccessDenied per process.
+            # With attrs, process_iter fetches via as_dict(), which runs inside
+            # Process.oneshot(), so /proc/<pid>/stat (Linux) or the proc_pidinfo
+            # call (macOS) is read once per process rather than once per field.
+            rows = (
+                (
+                    pinfo["pid"],
+                    # ad_value leaves unreadable names as None; the web response requires a str
+                    pinfo["name"] or f"pid {pinfo['pid']}",
+                    pinfo["cpu_percent"] or 0.0,
+                    pinfo["memory_info"].rss * INV_MB if pinfo["memory_info"] else 0.0,
+                )
+                for pinfo in (
+                    proc.info
+                    for proc in psutil.process_iter(
+                        ["pid", "name", "cpu_percent", "memory_info"], ad_value=None
                     )
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    # Skip processes we can't access
-                    continue
-
-            # Sort based on requested metric
-            if by == ProcessSortBy.CPU:
-                sorted_processes = sorted(processes, key=lambda x: x["cpu_percent"], reverse=True)
-            else:  # ProcessSortBy.MEMORY
-                sorted_processes = sorted(processes, key=lambda x: x["memory_mb"], reverse=True)
+                )
+            )
 
-            # Take top N
-            top_processes = sorted_processes[:limit]
+            # Partial sort: O(N log limit) instead of sorting every process
+            key = itemgetter(2) if by == ProcessSortBy.CPU else itemgetter(3)
+            top_processes = heapq.nlargest(limit, rows, key=key)
 
             # Convert to ProcessInfo objects
             return [
                 ProcessInfo(
-                    pid=p["pid"],
-                    name=p["name"],
-                    cpu_percent=round(p["cpu_percent"], 1),
-                    memory_mb=round(p["memory_mb"], 1),
+                    pid=pid,
+                    name=name,
+                    cpu_percent=round(cpu_percent, 1),
+                    memory_mb=round(memory_mb, 1),
                 )
-                for p in top_processes
+                for pid, name, cpu_percent, memory_mb in top_processes
             ]
 
         except Exception as e:
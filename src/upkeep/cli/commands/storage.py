@@ -27,6 +27,9 @@ def analyze_command(path: Path) -> None:
 
     try:
         # Use API layer instead of direct DiskAnalyzer
+        # No extra worker thread needed for the spinner: DiskAnalyzer already walks
+        # subdirectories on a thread pool (stat/readdir release the GIL), and Rich
+        # animates from its own thread, which gets the GIL every switch interval.
         with console.status(f"[bold green]Analyzing {path}..."):
             result = api.analyze_path(str(path), max_depth=3, max_entries=10)
 
@@ -44,14 +47,14 @@ def analyze_command(path: Path) -> None:
 
             for entry in result.largest_entries:
                 # Calculate size display
-                size_bytes = entry["size_bytes"]
+                size_bytes = entry.size_bytes
                 size_mb = size_bytes / (1024**2)
                 size_gb = size_bytes / (1024**3)
 
                 size_str = f"{size_mb:.1f} MB" if size_mb < 1024 else f"{size_gb:.2f} GB"
 
                 # Extract filename from path
-                path_obj = Path(entry["path"])
+                path_obj = Path(entry.path)
                 table.add_row(path_obj.name, size_str)
 
             console.print(table)
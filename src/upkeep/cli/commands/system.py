@@ -4,7 +4,6 @@ System-related CLI commands using SystemAPI.
 All commands use the API layer for consistency.
 """
 
-import psutil
 from rich.console import Console
 
 from ...api.system import SystemAPI
@@ -14,20 +13,23 @@ def status_command() -> None:
     """
     Show system status (quick check).
 
-    Uses SystemAPI for system information.
-    Uses psutil directly for disk/memory (standard library, not core).
+    Uses SystemAPI for system information and a single get_metrics()
+    sample for disk/memory (without the blocking CPU sample).
     """
     console = Console()
     api = SystemAPI()
 
     console.print("\n[bold cyan]System Status[/bold cyan]\n")
 
-    # Disk usage (psutil is fine - standard library)
-    disk = psutil.disk_usage("/")
-    disk_color = "green" if disk.percent < 75 else "yellow" if disk.percent < 90 else "red"
-    console.print(f"[bold]Disk Usage:[/bold] [{disk_color}]{disk.percent:.1f}%[/{disk_color}]")
-    console.print(f"  Free: {disk.free / (1024**3):.1f} GB")
-    console.print(f"  Total: {disk.total / (1024**3):.1f} GB\n")
+    # One metrics sample feeds both disk and memory blocks; CPU isn't shown
+    metrics = api.get_metrics(include_cpu=False)
+
+    # Disk usage
+    disk_percent = metrics.disk_percent
+    disk_color = "green" if disk_percent < 75 else "yellow" if disk_percent < 90 else "red"
+    console.print(f"[bold]Disk Usage:[/bold] [{disk_color}]{disk_percent:.1f}%[/{disk_color}]")
+    console.print(f"  Free: {metrics.disk_free_gb:.1f} GB")
+    console.print(f"  Total: {metrics.disk_total_gb:.1f} GB\n")
 
     # System info (using API layer)
     try:
@@ -37,10 +39,10 @@ def status_command() -> None:
     except Exception as e:
         console.print(f"[yellow]Could not get system info: {e}[/yellow]\n")
 
-    # Memory (psutil is fine - standard library)
-    memory = psutil.virtual_memory()
-    mem_color = "green" if memory.percent < 75 else "yellow" if memory.percent < 90 else "red"
-    console.print(f"[bold]Memory:[/bold] [{mem_color}]{memory.percent:.1f}% used[/{mem_color}]")
-    console.print(f"  Available: {memory.available / (1024**3):.1f} GB\n")
+    # Memory
+    mem_percent = metrics.memory_percent
+    mem_color = "green" if mem_percent < 75 else "yellow" if mem_percent < 90 else "red"
+    console.print(f"[bold]Memory:[/bold] [{mem_color}]{mem_percent:.1f}% used[/{mem_color}]")
+    console.print(f"  Available: {metrics.memory_available_gb:.1f} GB\n")
 
     console.print("[dim]Run 'upkeep web' or './run-web.sh' for detailed analysis[/dim]\n")
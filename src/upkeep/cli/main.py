@@ -61,12 +61,9 @@ def web() -> None:
         console.print("\n[yellow]Starting web server directly...[/yellow]")
         console.print("[dim]For sudo support, use: ./run-web.sh[/dim]\n")
         try:
-            import uvicorn
-
             from upkeep.web.port_utils import find_available_port
-            from upkeep.web.server import app
 
-            # Find available port (8080-8089)
+            # Find available port (8080-8089) before paying for the server imports
             port = find_available_port(8080, 8089)
 
             if port is None:
@@ -79,6 +76,10 @@ def web() -> None:
             if port != 8080:
                 console.print(f"[yellow]Port 8080 in use, using port {port} instead[/yellow]")
 
+            import uvicorn
+
+            from upkeep.web.server import app
+
             console.print(
                 f"\n[bold green]Starting server on http://127.0.0.1:{port}[/bold green]\n"
             )
@@ -4,10 +4,80 @@ Core logic for finding applications and their associated artifacts.
 
 import os
 import plistlib
+import stat
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+# System-wide app folders; ~/Applications is added per AppFinder
+_APP_SEARCH_DIRS = (Path("/Applications"), Path("/System/Applications"))
+
+# Artifact locations relative to the user's home, with the kind they hold
+_ARTIFACT_LOCATIONS = (
+    ("Library/Application Support", "support"),
+    ("Library/Caches", "cache"),
+    ("Library/Containers", "container"),
+    ("Library/Group Containers", "container"),
+    ("Library/Preferences", "preferences"),
+    ("Library/Logs", "log"),
+    ("Library/Saved Application State", "state"),
+    ("Library/WebKit", "cache"),
+)
+
+# Real Info.plists are a few KB (the largest ship at a few hundred); anything
+# bigger is refused rather than read whole into memory and parsed
+_MAX_INFO_PLIST_BYTES = 4 << 20
+
+# Shared by every AppFinder to size an app's artifact directories side by side;
+# threads are only started on first use and then reused across apps
+_SIZE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="upkeep-artifact-size")
+
+
+@lru_cache(maxsize=2048)
+def _load_plist_metadata(
+    path: str, mtime_ns: int, size: int
+) -> tuple[str | None, str | None, str] | None:
+    """
+    Read bundle ID, name and version from an Info.plist.
+
+    Cached on (path, mtime_ns, size) so repeated scans of an unchanged app
+    cost one stat instead of a full plist parse.
+
+    Args:
+        path: Path to Info.plist
+        mtime_ns: Modification time of the file (cache key only)
+        size: Size of the file (cache key only)
+
+    Returns:
+        (CFBundleIdentifier, CFBundleName, CFBundleShortVersionString) with
+        None for missing ID/name, or None if the plist cannot be read or is
+        larger than _MAX_INFO_PLIST_BYTES
+    """
+    if size > _MAX_INFO_PLIST_BYTES:
+        return None
+    try:
+        with open(path, "rb") as f:
+            # Bounded even if the file grew since it was stat'ed
+            data = f.read(_MAX_INFO_PLIST_BYTES + 1)
+        if len(data) > _MAX_INFO_PLIST_BYTES:
+            return None
+        # Pick the parser from the magic header: binary plists start with
+        # "bplist", anything else is treated as XML (BOMs, leading whitespace).
+        # One parse, no retry with the other format.
+        fmt = plistlib.FMT_BINARY if data.startswith(b"bplist") else plistlib.FMT_XML
+        plist_data = plistlib.loads(data, fmt=fmt)
+    except Exception:
+        return None
+
+    return (
+        plist_data.get("CFBundleIdentifier"),
+        plist_data.get("CFBundleName"),
+        plist_data.get("CFBundleShortVersionString", "Unknown"),
+    )
+
 
 @dataclass
 class AppArtifact:
@@ -26,6 +96,8 @@ class AppScanResult:
     app_info: dict[str, Any]  # name, version, bundle_id, icon_path
     artifacts: list[AppArtifact] = field(default_factory=list)
     total_size_bytes: int = 0
+    # Paths already in artifacts, for O(1) duplicate checks in AppFinder._add_artifact
+    _seen_paths: set[Path] = field(default_factory=set, init=False, repr=False, compare=False)
 
     @property
     def name(self) -> str:
@@ -79,56 +151,58 @@ class AppFinder:
         self.user_home = Path.home()
 
         # Paths to scan for artifacts relative to user home
-        self.artifact_locations = [
-            ("Library/Application Support", "support"),
-            ("Library/Caches", "cache"),
-            ("Library/Containers", "container"),
-            ("Library/Group Containers", "container"),
-            ("Library/Preferences", "preferences"),
-            ("Library/Logs", "log"),
-            ("Library/Saved Application State", "state"),
-            ("Library/WebKit", "cache"),
-        ]
-
-    def scan_applications(self) -> list[AppScanResult]:
+        self.artifact_locations = _ARTIFACT_LOCATIONS
+        self.search_dirs = (*_APP_SEARCH_DIRS, self.user_home / "Applications")
+
+        # Lower-cased child names of each artifact location, built for the
+        # duration of scan_applications so per-app misses cost no stat calls
+        self._artifact_index: dict[tuple[str, str], os.DirEntry] | None = None
+
+    def scan_applications(self, deep: bool = False) -> list[AppScanResult]:
         """
         Find all installed applications in standard locations.
 
+        By default results are shallow (bundle metadata and .app size only);
+        call scan_artifacts() on a result to add its ~/Library artifacts.
+
+        Args:
+            deep: Also find and size every app's artifacts up front
+
         Returns:
             List of AppScanResult objects for found apps.
         """
         app_paths = []
-        search_dirs = [
-            Path("/Applications"),
-            Path("/System/Applications"),
-            self.user_home / "Applications",
-        ]
-
-        for d in search_dirs:
+        for d in self.search_dirs:
             if d.exists():
                 # Find all .app bundles
                 app_paths.extend(d.glob("*.app"))
 
-        results = []
-        for p in app_paths:
-            try:
-                # Scan each app (this might be slow for ALL apps, optimization needed later)
-                # For now, just basic info from Info.plist to be fast, deep scan only on demand?
-                # Actually, the requirement is to list apps with sizes.
-                # Let's do a lightweight scan first.
-
-                # Use scan() but maybe optimized?
-                # scan() does a full artifact search.
-                # For the list view, we might just want the app bundle info + size.
-                # But the user expects "total footprint".
-                # Let's use scan() for now and limit if too slow.
-                res = self.scan(str(p))
-                if res:
-                    results.append(res)
-            except Exception:
-                continue
+        if not app_paths:
+            return []
 
-        return results
+        # Index artifact locations once for the whole batch; dropped afterwards so
+        # later single-app scans never see a stale listing
+        if deep:
+            self._artifact_index = self._build_artifact_index()
+        scan_one = self.scan if deep else self.scan_shallow
+        try:
+            # Each scan is dominated by plist reads and size walks (I/O that releases
+            # the GIL), so scan bundles concurrently; map() keeps the original order
+            with ThreadPoolExecutor(max_workers=min(32, len(app_paths))) as pool:
+                results = pool.map(lambda p: self._safe_scan(scan_one, p), app_paths)
+                return [res for res in results if res]
+        finally:
+            self._artifact_index = None
+
+    @staticmethod
+    def _safe_scan(
+        scan_one: Callable[[str], AppScanResult | None], app_path: Path
+    ) -> AppScanResult | None:
+        """Scan one app for scan_applications, treating any failure as 'not an app'."""
+        try:
+            return scan_one(str(app_path))
+        except Exception:
+            return None
 
     def find_app(self, name_or_path: str) -> AppScanResult | None:
         """
@@ -138,27 +212,17 @@ class AppFinder:
         if "/" in name_or_path and Path(name_or_path).exists():
             return self.scan(name_or_path)
 
-        # Search standard locations
-        search_dirs = [
-            Path("/Applications"),
-            Path("/System/Applications"),
-            self.user_home / "Applications",
-        ]
-
-        # Try exact name match with .app extension
-        for d in search_dirs:
-            if d.exists():
-                p = d / f"{name_or_path}.app"
-                if p.exists():
-                    return self.scan(str(p))
-
-        # Try case-insensitive scan
-        lower_name = name_or_path.lower()
-        for d in search_dirs:
-            if d.exists():
-                for p in d.glob("*.app"):
-                    if p.stem.lower() == lower_name:
-                        return self.scan(str(p))
+        # One case-insensitive scandir pass per standard location; the first
+        # "<name>.app" (any case) wins
+        target = f"{name_or_path.lower()}.app"
+        for d in self.search_dirs:
+            try:
+                with os.scandir(d) as it:
+                    match = next((e.path for e in it if e.name.lower() == target), None)
+            except OSError:
+                continue  # Missing or unreadable location
+            if match is not None:
+                return self.scan(match)
 
         return None
 
@@ -172,32 +236,55 @@ class AppFinder:
         Returns:
             AppScanResult or None if app not found/invalid
         """
+        result = self.scan_shallow(app_path_str)
+        if result is not None:
+            self.scan_artifacts(result)
+        return result
+
+    def scan_artifacts(self, result: AppScanResult) -> AppScanResult:
+        """
+        Add an app's ~/Library artifacts to a (shallow) scan result.
+
+        Safe to call more than once; paths already present are skipped.
+
+        Args:
+            result: Result from scan_shallow() or scan_applications()
+
+        Returns:
+            The same result, with artifacts and total size updated
+        """
+        # 3. Scan for associated artifacts using Bundle ID and Name
+        self._find_artifacts(result, result.bundle_id, result.name)
+        return result
+
+    def scan_shallow(self, app_path_str: str) -> AppScanResult | None:
+        """
+        Scan an application bundle only: Info.plist metadata and .app size.
+
+        Args:
+            app_path_str: Path to the .app bundle
+
+        Returns:
+            AppScanResult (bundle artifact only) or None if app not found/invalid
+        """
         app_path = Path(app_path_str)
         if not app_path.exists():
             return None
 
         # 1. Parse Info.plist to get Bundle ID and metadata
         info_plist = app_path / "Contents" / "Info.plist"
-        if not info_plist.exists():
+        try:
+            st = os.stat(info_plist)
+        except OSError:
             return None
 
-        try:
-            with open(info_plist, "rb") as f:
-                try:
-                    plist_data = plistlib.load(f)
-                except (plistlib.InvalidFileException, Exception):
-                    # Try reading as text XML if binary fails
-                    f.seek(0)
-                    try:
-                        plist_data = plistlib.load(f, fmt=plistlib.FMT_XML)
-                    except Exception:
-                        return None
-        except Exception:
+        metadata = _load_plist_metadata(str(info_plist), st.st_mtime_ns, st.st_size)
+        if metadata is None:
             return None
 
-        bundle_id = plist_data.get("CFBundleIdentifier")
-        app_name = plist_data.get("CFBundleName", app_path.stem)
-        version = plist_data.get("CFBundleShortVersionString", "Unknown")
+        bundle_id, app_name, version = metadata
+        if app_name is None:
+            app_name = app_path.stem
 
         if not bundle_id:
             return None
@@ -215,69 +302,155 @@ class AppFinder:
         )
 
         # Add the app itself as an artifact
-        app_size = self._get_size(app_path)
-        result.artifacts.append(
-            AppArtifact(path=app_path, kind="app", size_bytes=app_size, reason="Application bundle")
-        )
-        result.total_size_bytes += app_size
-
-        # 3. Scan for associated artifacts using Bundle ID and Name
-        self._find_artifacts(result, bundle_id, app_name)
+        self._add_artifact(result, app_path, "app", "Application bundle")
 
         return result
 
+    def _build_artifact_index(self) -> dict[tuple[str, str], os.DirEntry]:
+        """
+        List every artifact location once.
+
+        Keys are (rel_path, lower-cased child name), mirroring the default
+        case-insensitive APFS lookup that Path.exists() performs on macOS.
+
+        Returns:
+            Index mapping (rel_path, name) to the child's DirEntry
+        """
+        index: dict[tuple[str, str], os.DirEntry] = {}
+        for rel_path, _kind in self.artifact_locations:
+            try:
+                with os.scandir(self.user_home / rel_path) as it:
+                    for entry in it:
+                        index[(rel_path, entry.name.lower())] = entry
+            except OSError:
+                continue  # Location missing or unreadable
+        return index
+
+    def _lookup_artifact(
+        self, base_dir: Path, rel_path: str, name: str
+    ) -> tuple[Path, int | None] | None:
+        """
+        Find base_dir/name, using the artifact index when it is built.
+
+        Returns:
+            (path, size_hint) if it exists, else None. size_hint is the file
+            size for regular files found via the index (stat'ed only on a
+            match), otherwise None.
+        """
+        if self._artifact_index is None:
+            candidate = base_dir / name
+            return (candidate, None) if candidate.exists() else None
+
+        entry = self._artifact_index.get((rel_path, name.lower()))
+        if entry is None:
+            return None
+        try:
+            st = entry.stat()  # Follows symlinks, like exists()
+        except OSError:
+            return None
+        return Path(entry.path), st.st_size if stat.S_ISREG(st.st_mode) else None
+
     def _find_artifacts(self, result: AppScanResult, bundle_id: str, app_name: str):
         """Find artifacts in standard locations matching Bundle ID or Name."""
+        indexed = self._artifact_index is not None
+        matches: list[tuple[Path, str, str, int | None]] = []
 
         for rel_path, kind in self.artifact_locations:
             base_dir = self.user_home / rel_path
 
-            # Debugging aid: print checking path
-            # print(f"Checking base_dir: {base_dir} (Exists: {base_dir.exists()})")
-
-            if not base_dir.exists():
+            if not indexed and not base_dir.exists():
                 continue
 
             # Strategy 1: Exact match on Bundle ID (e.g., ~/Library/Preferences/com.slack.Slack.plist)
             # Check for directory match
-            bundle_dir = base_dir / bundle_id
-            if bundle_dir.exists():
-                self._add_artifact(result, bundle_dir, kind, "Bundle ID match")
+            found = self._lookup_artifact(base_dir, rel_path, bundle_id)
+            if found is not None:
+                matches.append((found[0], kind, "Bundle ID match", found[1]))
 
             # Check for file match (e.g. preferences plist)
-            bundle_file = base_dir / f"{bundle_id}.plist"
-            if bundle_file.exists():
-                self._add_artifact(result, bundle_file, kind, "Bundle ID match")
+            found = self._lookup_artifact(base_dir, rel_path, f"{bundle_id}.plist")
+            if found is not None:
+                matches.append((found[0], kind, "Bundle ID match", found[1]))
 
             # Strategy 2: Exact match on App Name (e.g., ~/Library/Application Support/Slack)
             # Only if name is distinctive enough (len > 3) to avoid false positives like "Log" or "Mac"
             if len(app_name) > 3:
-                name_dir = base_dir / app_name
-                if name_dir.exists():
-                    self._add_artifact(result, name_dir, kind, "Name match")
-
-    def _add_artifact(self, result: AppScanResult, path: Path, kind: str, reason: str):
-        """Add an artifact to the result if not already present."""
+                found = self._lookup_artifact(base_dir, rel_path, app_name)
+                if found is not None:
+                    matches.append((found[0], kind, "Name match", found[1]))
+
+        # Drop duplicates (first match wins) before sizing anything, then walk
+        # the remaining directories concurrently: each walk is scandir-bound
+        # and releases the GIL
+        new_matches = []
+        pending: set[Path] = set()
+        for match in matches:
+            if match[0] not in result._seen_paths and match[0] not in pending:
+                pending.add(match[0])
+                new_matches.append(match)
+
+        to_walk = [path for path, _, _, hint in new_matches if hint is None]
+        if len(to_walk) > 1:
+            walked = iter(list(_SIZE_POOL.map(self._get_size, to_walk)))
+        else:
+            walked = map(self._get_size, to_walk)
+
+        for path, kind, reason, hint in new_matches:
+            size = hint if hint is not None else next(walked)
+            self._add_artifact(result, path, kind, reason, size)
+
+    def _add_artifact(
+        self,
+        result: AppScanResult,
+        path: Path,
+        kind: str,
+        reason: str,
+        size: int | None = None,
+    ):
+        """Add an artifact to the result if not already present.
+
+        size, when given, is the already-known size of the artifact (e.g. from
+        the artifact index or a pooled walk); otherwise the path is walked.
+        """
         # Check if already added to avoid duplicates
-        if any(a.path == path for a in result.artifacts):
+        if path in result._seen_paths:
             return
+        result._seen_paths.add(path)
 
-        size = self._get_size(path)
+        if size is None:
+            size = self._get_size(path)
         result.artifacts.append(AppArtifact(path=path, kind=kind, size_bytes=size, reason=reason))
         result.total_size_bytes += size
 
     def _get_size(self, path: Path) -> int:
-        """Calculate size of file or directory in bytes."""
+        """Calculate size of file or directory in bytes.
+
+        Walks directories with an explicit stack of os.scandir calls on raw
+        str paths, using the DirEntry type/lstat data instead of a Path
+        object and extra is_symlink() stat per file. Symlinks are not counted
+        or followed.
+        """
         total = 0
         try:
             if path.is_file():
                 return path.stat().st_size
-            elif path.is_dir():
-                for dirpath, _, filenames in os.walk(path):
-                    for f in filenames:
-                        fp = Path(dirpath) / f
-                        if not fp.is_symlink():
-                            total += fp.stat().st_size
-        except Exception:
-            pass  # Ignore permission errors/stat failures
+            if not path.is_dir():
+                return 0
+        except OSError:
+            return 0
+
+        stack = [os.fspath(path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif not entry.is_symlink():
+                                total += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            continue  # Ignore entries we can't stat
+            except OSError:
+                continue  # Ignore directories we can't read
         return total
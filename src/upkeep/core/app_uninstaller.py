@@ -69,7 +69,8 @@ class AppUninstaller:
         # We need to delete all artifacts + the app bundle itself.
         # Note: artifacts list includes the app bundle (kind="app").
 
-        to_delete = sorted(app.artifacts, key=lambda x: len(str(x.path)), reverse=True)
+        # Deepest first: more path components means nested further down
+        to_delete = sorted(app.artifacts, key=lambda x: len(x.path.parts), reverse=True)
 
         for artifact in to_delete:
             p = artifact.path
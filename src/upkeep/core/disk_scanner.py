@@ -7,8 +7,12 @@ compatible with D3.js treemap/sunburst visualizations.
 
 from __future__ import annotations
 
+import os
 import subprocess
-from collections import defaultdict
+import sys
+import threading
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -16,16 +20,47 @@ from typing import Any
 class DiskScanner:
     """Scans disk usage and produces visualization-ready hierarchical data."""
 
-    def __init__(self, max_depth: int = 3, min_size_kb: int = 1024) -> None:
+    SCAN_TIMEOUT = 120.0  # seconds before a running du is killed
+
+    def __init__(
+        self,
+        max_depth: int = 3,
+        min_size_kb: int = 1024,
+        exclude: list[str] | None = None,
+    ) -> None:
         """
         Initialize scanner.
 
         Args:
             max_depth: Maximum directory depth to scan (default 3).
             min_size_kb: Minimum size in KB to include in results (default 1024 = 1MB).
+            exclude: Name patterns (e.g. "node_modules", ".git", ".Trash") that du
+                skips entirely; excluded trees are neither walked nor counted.
         """
         self.max_depth = max_depth
         self.min_size_kb = min_size_kb
+        self.exclude = list(exclude) if exclude else []
+
+    def _du_args(self, path: str) -> list[str]:
+        """
+        Build the du command line for a scan of path.
+
+        -P: never follow symlinks (the default, pinned explicitly). No -x:
+        on APFS, /Users and other firmlinks live on the Data volume, so
+        staying on one device would drop them from a scan of "/"; files
+        reachable twice via firmlinks are already counted once by inode.
+
+        Excludes use BSD du's "-I mask" on macOS and GNU du's "--exclude"
+        elsewhere; both prune the directory before du descends into it.
+        """
+        args = ["du", "-k", "-P", "-d", str(self.max_depth)]
+        for pattern in self.exclude:
+            if sys.platform == "darwin":
+                args += ["-I", pattern]
+            else:
+                args.append(f"--exclude={pattern}")
+        args.append(path)
+        return args
 
     def scan(self, path: str) -> dict[str, Any]:
         """
@@ -38,27 +73,51 @@ class DiskScanner:
             Hierarchical dict with name, value (size), children, metadata.
         """
         try:
-            result = subprocess.run(
-                ["du", "-k", "-d", str(self.max_depth), path],
-                capture_output=True,
-                text=True,
-                timeout=120,  # 2 minute timeout
+            proc = subprocess.Popen(
+                self._du_args(path),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
             )
-        except subprocess.SubprocessError as e:
-            return {"name": Path(path).name, "error": str(e), "path": path}
-        except OSError as e:
+        except (subprocess.SubprocessError, OSError) as e:
             return {"name": Path(path).name, "error": str(e), "path": path}
 
+        # Parse du output as it is produced instead of buffering all of stdout.
+        # stderr is drained on a thread so a chatty du can't block on a full
+        # pipe, and a timer kills du if it runs past SCAN_TIMEOUT.
+        stderr_chunks: list[bytes] = []
+        stderr_reader = threading.Thread(
+            target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True
+        )
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+
+        killer = threading.Timer(self.SCAN_TIMEOUT, kill_on_timeout)
+        stderr_reader.start()
+        killer.start()
+        try:
+            with proc.stdout:
+                entries = self._parse_du_lines(proc.stdout)
+            proc.wait()
+        finally:
+            killer.cancel()
+            stderr_reader.join()
+            proc.stderr.close()
+
+        if timed_out.is_set():
+            error = f"du timed out after {self.SCAN_TIMEOUT:g} seconds"
+            return {"name": Path(path).name, "error": error, "path": path}
+
         # Parse warnings from stderr
         warnings = []
-        if result.stderr:
-            for line in result.stderr.strip().split("\n"):
+        stderr = b"".join(stderr_chunks)
+        if stderr:
+            for line in os.fsdecode(stderr).strip().split("\n"):
                 if line.strip():
                     warnings.append(line.strip())
 
-        # Parse du output
-        entries = self._parse_du_output(result.stdout)
-
         if not entries:
             return {
                 "name": Path(path).name,
@@ -79,33 +138,46 @@ class DiskScanner:
         if warnings:
             tree["warnings"] = warnings
 
-        # Calculate percentages
-        self._add_percentages(tree, total_size)
+        # Children already carry their percentage of their parent (_build_tree)
+        tree["percentage"] = _percent(tree["value"], total_size)
 
         return tree
 
-    def _parse_du_output(self, output: str) -> list[tuple[str, int]]:
+    def _parse_du_output(self, output: bytes) -> list[tuple[str, int]]:
         """
         Parse du output into list of (path, size_kb) tuples.
 
         Args:
             output: Raw stdout from du command.
 
+        Returns:
+            List of (path, size_kb) tuples.
+        """
+        return self._parse_du_lines(output.splitlines())
+
+    def _parse_du_lines(self, lines: Iterable[bytes]) -> list[tuple[str, int]]:
+        """
+        Parse du output lines (e.g. a live stdout pipe) into (path, size_kb) tuples.
+
+        Works on the raw bytes: sizes are parsed without decoding and only
+        the path portion of each line is decoded.
+
+        Args:
+            lines: Raw du output lines, with or without trailing newlines.
+
         Returns:
             List of (path, size_kb) tuples.
         """
         entries = []
-        for line in output.strip().split("\n"):
-            if not line.strip():
+        for line in lines:
+            tab = line.find(b"\t")
+            if tab < 0:
+                continue
+            try:
+                size_kb = int(line[:tab])
+            except ValueError:
                 continue
-            parts = line.split("\t", 1)
-            if len(parts) == 2:
-                try:
-                    size_kb = int(parts[0])
-                    path = parts[1]
-                    entries.append((path, size_kb))
-                except ValueError:
-                    continue
+            entries.append((os.fsdecode(line[tab + 1 :].rstrip(b"\n")), size_kb))
         return entries
 
     def _build_tree(self, entries: list[tuple[str, int]], root_path: str) -> dict[str, Any]:
@@ -119,80 +191,57 @@ class DiskScanner:
         Returns:
             Hierarchical dict structure.
         """
-        # Create lookup for sizes
-        size_lookup = dict(entries)
-
-        # Normalize root path
-        root_path = root_path.rstrip("/")
-        root_name = Path(root_path).name or root_path
-
-        # Find root size
-        root_size = size_lookup.get(root_path, 0)
-
-        # Build children map (parent -> children)
-        children_map: dict[str, list[str]] = defaultdict(list)
-        for path, _size in entries:
-            if path == root_path:
-                continue
-            parent = str(Path(path).parent)
-            children_map[parent].append(path)
-
-        def build_node(path: str) -> dict[str, Any] | None:
-            """Recursively build a node and its children."""
-            size = size_lookup.get(path, 0)
-
-            # Filter by min size
+        # Normalize root path ("/" stays "/" so its children find their parent)
+        root_path = root_path.rstrip("/") or "/"
+        format_size = self.format_size
+
+        # Pass 1: one node per entry that passes the min-size filter (the root
+        # always does). du emits post-order, but don't rely on it.
+        # Parent and name come from one rfind("/") per entry, kept for pass 2.
+        # Nodes are keyed by path, so a path du reports twice yields one node;
+        # the last report wins, even when it falls below the size filter.
+        nodes: dict[str, dict[str, Any]] = {}
+        parents: dict[str, str] = {}
+        for path, size in entries:
             if size < self.min_size_kb and path != root_path:
-                return None
-
-            name = Path(path).name or path
-
-            node: dict[str, Any] = {
-                "name": name,
+                nodes.pop(path, None)
+                continue
+            slash = path.rfind("/")
+            parents[path] = path[:slash] if slash > 0 else "/"
+            nodes[path] = {
+                "name": path[slash + 1 :] or path,
                 "path": path,  # Full path for drill-down navigation
                 "value": size,
-                "sizeFormatted": self.format_size(size),
+                "sizeFormatted": format_size(size),
             }
 
-            # Build children
-            child_paths = children_map.get(path, [])
-            if child_paths:
-                children = []
-                for child_path in child_paths:
-                    child_node = build_node(child_path)
-                    if child_node:
-                        children.append(child_node)
-
-                if children:
-                    # Sort by size descending
-                    children.sort(key=lambda x: x["value"], reverse=True)
-                    node["children"] = children
-
-            return node
-
-        # Build from root
-        tree = build_node(root_path)
-        if tree is None:
-            tree = {"name": root_name, "value": root_size}
-
-        return tree
+        if root_path not in nodes:
+            nodes[root_path] = {
+                "name": os.path.basename(root_path) or root_path,
+                "path": root_path,
+                "value": 0,
+                "sizeFormatted": format_size(0),
+            }
 
-    def _add_percentages(self, node: dict[str, Any], parent_size: int) -> None:
-        """
-        Recursively add percentage of parent to each node.
+        # Pass 2: attach each node to its parent and record its percentage of
+        # the parent's size. A node whose parent was filtered out is never
+        # attached, so filtered subtrees drop out too. The root's percentage
+        # is relative to the scan total and is set by the caller.
+        for path, node in nodes.items():
+            if path == root_path:
+                continue
+            parent = nodes.get(parents[path])
+            if parent is not None:
+                node["percentage"] = _percent(node["value"], parent["value"])
+                parent.setdefault("children", []).append(node)
 
-        Args:
-            node: Tree node to process.
-            parent_size: Size of parent node for percentage calculation.
-        """
-        if parent_size > 0:
-            node["percentage"] = round((node.get("value", 0) / parent_size) * 100, 1)
-        else:
-            node["percentage"] = 0
+        # Sort each node's children by size descending, once
+        for node in nodes.values():
+            children = node.get("children")
+            if children:
+                children.sort(key=lambda x: x["value"], reverse=True)
 
-        for child in node.get("children", []):
-            # Children percentage relative to this node
-            self._add_percentages(child, node.get("value", 1))
+        return nodes[root_path]
 
     def format_size(self, size_kb: int) -> str:
         """
@@ -204,9 +253,26 @@ class DiskScanner:
         Returns:
             Human-readable string (e.g., "1.5 GB").
         """
-        if size_kb >= 1048576:  # 1 GB in KB
-            return f"{size_kb / 1048576:.1f} GB"
-        elif size_kb >= 1024:  # 1 MB in KB
-            return f"{size_kb / 1024:.1f} MB"
-        else:
-            return f"{size_kb} KB"
+        return _format_size(size_kb)
+
+
+def _percent(size: int, parent_size: int) -> float:
+    """Return size as a percentage of parent_size, rounded to 0.1 (0 if parent is empty)."""
+    if parent_size > 0:
+        return round(size / parent_size * 100, 1)
+    return 0
+
+
+@lru_cache(maxsize=4096)
+def _format_size(size_kb: int) -> str:
+    """Format a KB size for DiskScanner.format_size.
+
+    Memoized: du rounds to whole KB, so a large tree repeats the same small
+    sizes (4 KB, 8 KB, ...) many times over.
+    """
+    if size_kb >= 1048576:  # 1 GB in KB
+        return f"{size_kb / 1048576:.1f} GB"
+    elif size_kb >= 1024:  # 1 MB in KB
+        return f"{size_kb / 1024:.1f} MB"
+    else:
+        return f"{size_kb} KB"
@@ -6,18 +6,58 @@ Supports JSON, text, and CSV output formats.
 
 from __future__ import annotations
 
-import csv
-import io
+import heapq
 import json
+from collections.abc import Iterator
 from datetime import datetime
-from typing import TYPE_CHECKING
+from functools import cache, lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, TextIO
 
 if TYPE_CHECKING:
     from upkeep.core.duplicate_scanner import DuplicateGroup, ScanResult
 
 
+@cache
+def _orjson() -> Any | None:
+    """Lazily import orjson (optional 'fast-json' extra).
+
+    Returns:
+        The orjson module, or None if it is not installed (stdlib json is
+        used instead). The outcome is cached so a missing module is only
+        probed once.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _dumps(data: Any, pretty: bool) -> str:
+    """Serialize data to JSON with orjson when available, else stdlib json."""
+    orjson = _orjson()
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(data, option=option, default=str).decode()
+    if pretty:
+        return json.dumps(data, indent=2, default=str)
+    return json.dumps(data, default=str)
+
+
+_savings = attrgetter("potential_savings")
+
+
+def _csv_field(value: str) -> str:
+    """Quote a CSV field the way csv.writer's QUOTE_MINIMAL would."""
+    if "," in value or '"' in value or "\n" in value or "\r" in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+@lru_cache(maxsize=4096)
 def format_bytes(size_bytes: int) -> str:
-    """Format bytes as human-readable string."""
+    """Format bytes as human-readable string (memoized; reports repeat sizes a lot)."""
     if size_bytes < 1024:
         return f"{size_bytes} B"
     elif size_bytes < 1024 * 1024:
@@ -35,6 +75,8 @@ class DuplicateReporter:
         """
         Generate JSON output for API/UI consumption.
 
+        Uses orjson when installed, stdlib json otherwise.
+
         Args:
             result: Scan result to serialize.
             pretty: If True, format with indentation.
@@ -42,13 +84,41 @@ class DuplicateReporter:
         Returns:
             JSON string representation.
         """
-        data = {
+        return _dumps(self.to_dict(result), pretty)
+
+    def to_json_stream(self, result: ScanResult, out: TextIO, pretty: bool = True) -> None:
+        """
+        Write the JSON report to out in chunks instead of as one large string.
+
+        Encodes with stdlib json's iterencode, so the serialized document is
+        never held in memory at once.
+
+        Args:
+            result: Scan result to serialize.
+            out: Writable text stream.
+            pretty: If True, format with indentation.
+        """
+        encoder = json.JSONEncoder(indent=2 if pretty else None, default=str)
+        for chunk in encoder.iterencode(self.to_dict(result)):
+            out.write(chunk)
+
+    def to_dict(self, result: ScanResult) -> dict[str, Any]:
+        """
+        Build the JSON-ready report structure (what to_json serializes).
+
+        Args:
+            result: Scan result to convert.
+
+        Returns:
+            Dict with scan_summary, duplicate_groups and errors.
+        """
+        return {
             "scan_summary": {
                 "total_files_scanned": result.total_files_scanned,
                 "total_duplicates": result.total_duplicates,
                 "total_wasted_bytes": result.total_wasted_bytes,
                 "total_wasted_formatted": format_bytes(result.total_wasted_bytes),
-                "duplicate_groups_count": len(result.duplicate_groups),
+                "duplicate_groups_count": result.group_count,
                 "scan_duration_seconds": round(result.scan_duration_seconds, 2),
                 "errors_count": len(result.errors),
             },
@@ -56,20 +126,16 @@ class DuplicateReporter:
             "errors": result.errors,
         }
 
-        if pretty:
-            return json.dumps(data, indent=2, default=str)
-        return json.dumps(data, default=str)
-
     def _group_to_dict(self, group: DuplicateGroup) -> dict:
         """Convert a DuplicateGroup to a dictionary."""
         return {
             "hash": group.hash[:16],  # Truncate for readability
             "full_hash": group.hash,
             "size_bytes": group.size_bytes,
-            "size_formatted": format_bytes(group.size_bytes),
+            "size_formatted": group.size_formatted,
             "file_count": len(group.files),
             "potential_savings_bytes": group.potential_savings,
-            "potential_savings_formatted": format_bytes(group.potential_savings),
+            "potential_savings_formatted": group.potential_savings_formatted,
             "files": [
                 {
                     "path": str(f.path),
@@ -89,66 +155,77 @@ class DuplicateReporter:
         Returns:
             Text report string.
         """
-        lines = []
+        return "\n".join(self._text_lines(result))
+
+    def to_text_stream(self, result: ScanResult, out: TextIO) -> None:
+        """
+        Write the text report to out line by line, without building it in memory.
+
+        Args:
+            result: Scan result to format.
+            out: Writable text stream (file, socket wrapper, StringIO, ...).
+        """
+        for line in self._text_lines(result):
+            out.write(line)
+            out.write("\n")
 
+    def _text_lines(self, result: ScanResult) -> Iterator[str]:
+        """Yield the lines of the text report (without newlines)."""
         # Header
-        lines.append("=" * 60)
-        lines.append("DUPLICATE FILE REPORT")
-        lines.append("=" * 60)
-        lines.append("")
+        yield "=" * 60
+        yield "DUPLICATE FILE REPORT"
+        yield "=" * 60
+        yield ""
 
         # Summary
-        lines.append("SCAN SUMMARY")
-        lines.append("-" * 40)
-        lines.append(f"Files scanned:     {result.total_files_scanned:,}")
-        lines.append(f"Duplicate files:   {result.total_duplicates:,}")
-        lines.append(f"Duplicate groups:  {len(result.duplicate_groups):,}")
-        lines.append(f"Wasted space:      {format_bytes(result.total_wasted_bytes)}")
-        lines.append(f"Scan duration:     {result.scan_duration_seconds:.2f}s")
-        lines.append("")
+        yield "SCAN SUMMARY"
+        yield "-" * 40
+        yield f"Files scanned:     {result.total_files_scanned:,}"
+        yield f"Duplicate files:   {result.total_duplicates:,}"
+        yield f"Duplicate groups:  {result.group_count:,}"
+        yield f"Wasted space:      {format_bytes(result.total_wasted_bytes)}"
+        yield f"Scan duration:     {result.scan_duration_seconds:.2f}s"
+        yield ""
 
         if not result.duplicate_groups:
-            lines.append("No duplicates found! 🎉")
-            lines.append("")
-            return "\n".join(lines)
+            yield "No duplicates found! 🎉"
+            yield ""
+            return
 
         # Duplicate groups
-        lines.append("DUPLICATE GROUPS (sorted by wasted space)")
-        lines.append("-" * 40)
-        lines.append("")
+        yield "DUPLICATE GROUPS (sorted by wasted space)"
+        yield "-" * 40
+        yield ""
 
+        fromtimestamp = datetime.fromtimestamp
         for i, group in enumerate(result.duplicate_groups, 1):
-            lines.append(
-                f"Group {i}: {len(group.files)} files, {format_bytes(group.size_bytes)} each"
-            )
-            lines.append(f"  Potential savings: {format_bytes(group.potential_savings)}")
-            lines.append(f"  Hash: {group.hash[:16]}...")
-            lines.append("  Files:")
+            yield f"Group {i}: {len(group.files)} files, {group.size_formatted} each"
+            yield f"  Potential savings: {group.potential_savings_formatted}"
+            yield f"  Hash: {group.hash[:16]}..."
+            yield "  Files:"
             for file_info in group.files:
-                mtime_str = ""
                 if file_info.mtime:
-                    mtime = datetime.fromtimestamp(file_info.mtime)
-                    mtime_str = f" (modified: {mtime.strftime('%Y-%m-%d %H:%M')})"
-                lines.append(f"    - {file_info.path}{mtime_str}")
-            lines.append("")
+                    modified = fromtimestamp(file_info.mtime).strftime("%Y-%m-%d %H:%M")
+                    yield f"    - {file_info.path} (modified: {modified})"
+                else:
+                    yield f"    - {file_info.path}"
+            yield ""
 
         # Errors
         if result.errors:
-            lines.append("ERRORS")
-            lines.append("-" * 40)
+            yield "ERRORS"
+            yield "-" * 40
             for error in result.errors[:10]:  # Limit to first 10
-                lines.append(f"  ! {error}")
+                yield f"  ! {error}"
             if len(result.errors) > 10:
-                lines.append(f"  ... and {len(result.errors) - 10} more errors")
-            lines.append("")
+                yield f"  ... and {len(result.errors) - 10} more errors"
+            yield ""
 
         # Footer
-        lines.append("=" * 60)
-        lines.append("To remove duplicates, manually select which copies to delete.")
-        lines.append("Recommendation: Keep the file in the most sensible location.")
-        lines.append("=" * 60)
-
-        return "\n".join(lines)
+        yield "=" * 60
+        yield "To remove duplicates, manually select which copies to delete."
+        yield "Recommendation: Keep the file in the most sensible location."
+        yield "=" * 60
 
     def to_csv(self, result: ScanResult) -> str:
         """
@@ -160,46 +237,41 @@ class DuplicateReporter:
         Returns:
             CSV string with all duplicate files.
         """
-        output = io.StringIO()
-        writer = csv.writer(output)
+        return "".join(self._csv_lines(result))
 
-        # Header
-        writer.writerow(
-            [
-                "Group",
-                "Hash",
-                "Size (bytes)",
-                "Size",
-                "File Path",
-                "Modified",
-                "Potential Savings",
-            ]
-        )
-
-        # Data rows
-        for i, group in enumerate(result.duplicate_groups, 1):
-            for j, file_info in enumerate(group.files):
-                # Only show potential savings on first row of group
-                savings = format_bytes(group.potential_savings) if j == 0 else ""
+    def to_csv_stream(self, result: ScanResult, out: TextIO) -> None:
+        """
+        Write the CSV export to out row by row, without building it in memory.
+
+        Args:
+            result: Scan result to export.
+            out: Writable text stream; open files with newline="" as csv expects.
+        """
+        out.writelines(self._csv_lines(result))
 
+    def _csv_lines(self, result: ScanResult) -> Iterator[str]:
+        """
+        Yield the CSV export one terminated row at a time.
+
+        Rows are formatted directly instead of through csv.writer: every
+        column but the path is a number, hex digest, date or formatted
+        size that never needs quoting, and paths are quoted only when they
+        must be. The output is identical to csv.writer's defaults
+        (QUOTE_MINIMAL, CRLF line endings).
+        """
+        yield "Group,Hash,Size (bytes),Size,File Path,Modified,Potential Savings\r\n"
+
+        fromtimestamp = datetime.fromtimestamp
+        for i, group in enumerate(result.duplicate_groups, 1):
+            prefix = f"{i},{group.hash[:16]},{group.size_bytes},{group.size_formatted},"
+            # Only show potential savings on first row of group
+            savings = group.potential_savings_formatted
+            for file_info in group.files:
                 mtime_str = ""
                 if file_info.mtime:
-                    mtime = datetime.fromtimestamp(file_info.mtime)
-                    mtime_str = mtime.strftime("%Y-%m-%d %H:%M:%S")
-
-                writer.writerow(
-                    [
-                        i,
-                        group.hash[:16],
-                        group.size_bytes,
-                        format_bytes(group.size_bytes),
-                        str(file_info.path),
-                        mtime_str,
-                        savings,
-                    ]
-                )
-
-        return output.getvalue()
+                    mtime_str = fromtimestamp(file_info.mtime).strftime("%Y-%m-%d %H:%M:%S")
+                yield f"{prefix}{_csv_field(str(file_info.path))},{mtime_str},{savings}\r\n"
+                savings = ""
 
     def summary(self, result: ScanResult) -> dict:
         """
@@ -214,7 +286,7 @@ class DuplicateReporter:
         return {
             "files_scanned": result.total_files_scanned,
             "duplicates_found": result.total_duplicates,
-            "groups": len(result.duplicate_groups),
+            "groups": result.group_count,
             "wasted_bytes": result.total_wasted_bytes,
             "wasted_formatted": format_bytes(result.total_wasted_bytes),
             "duration_seconds": round(result.scan_duration_seconds, 2),
@@ -222,8 +294,8 @@ class DuplicateReporter:
                 {
                     "hash": g.hash[:8],
                     "files": len(g.files),
-                    "savings": format_bytes(g.potential_savings),
+                    "savings": g.potential_savings_formatted,
                 }
-                for g in result.duplicate_groups[:5]  # Top 5
+                for g in heapq.nlargest(5, result.duplicate_groups, key=_savings)
             ],
         }
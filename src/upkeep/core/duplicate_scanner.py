@@ -4,7 +4,7 @@ Duplicate Scanner - Find duplicate files safely and efficiently.
 Uses a multi-stage filtering pipeline to minimize I/O:
 1. Size grouping (eliminates ~80-90% of files)
 2. Partial hash (first 64KB)
-3. Full hash (SHA-256 confirmation)
+3. Full hash (BLAKE3 confirmation; SHA-256 when the optional package is missing)
 
 Safe by default: identifies duplicates, never auto-deletes.
 """
@@ -13,27 +13,125 @@ from __future__ import annotations
 
 import fnmatch
 import hashlib
+import heapq
+import math
 import os
+import re
+import stat
 import time
-from collections import defaultdict
-from collections.abc import Callable
+from array import array
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache, cached_property
+from operator import attrgetter
 from pathlib import Path
+from typing import Any, BinaryIO
+
+from upkeep.core.duplicate_reporter import format_bytes
 
 
 class HashAlgorithm(Enum):
     """Supported hash algorithms."""
 
     SHA256 = "sha256"
-    XXHASH = "xxhash64"  # Not implemented yet, fallback to SHA256
+    XXHASH = "xxhash64"  # Needs the optional 'xxhash' package, else falls back to SHA256
+    BLAKE3 = "blake3"  # Needs the optional 'blake3' package, else falls back to SHA256
+
+
+@cache
+def _hasher_factory(algorithm: HashAlgorithm) -> Callable[[bool], Any]:
+    """Lazily resolve a hasher constructor for algorithm.
+
+    BLAKE3 and xxHash come from optional packages ('fast-hash' extra); when the
+    package is missing the algorithm falls back to SHA-256. The outcome is
+    cached so a missing module is only probed once.
+
+    Returns:
+        new_hasher(full) returning an object with update() and hexdigest().
+    """
+    if algorithm is HashAlgorithm.BLAKE3:
+        try:
+            import blake3
+        except ImportError:
+            pass
+        else:
+            # Full hashes let BLAKE3 split large files across its own threads
+            return lambda full: blake3.blake3(max_threads=blake3.blake3.AUTO if full else 1)
+    elif algorithm is HashAlgorithm.XXHASH:
+        try:
+            import xxhash
+        except ImportError:
+            pass
+        else:
+            return lambda full: xxhash.xxh64()
+    # usedforsecurity=False: this is content matching, not a security check, so
+    # FIPS-mode OpenSSL builds may still hand out their fastest (SHA-NI) digest
+    return lambda full: hashlib.new("sha256", usedforsecurity=False)
 
 
 # Size of partial hash read (64KB)
 PARTIAL_HASH_SIZE = 65536
 
+# Read size for full hashes (1MB): fewer, larger update() calls per file
+FULL_HASH_CHUNK_SIZE = 1 << 20
 
-@dataclass
+
+def _fadvise(fd: int, advice: str) -> None:
+    """Give the kernel a whole-file access hint, where posix_fadvise exists.
+
+    Best effort: a no-op on platforms without it (macOS) and on filesystems
+    that reject the hint.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+    except OSError:
+        pass
+
+
+def _release(f: BinaryIO) -> None:
+    """Close a file opened for hashing, dropping its pages from the cache first."""
+    if not f.closed:
+        _fadvise(f.fileno(), "POSIX_FADV_DONTNEED")
+        f.close()
+
+
+def _hash_stream(f: BinaryIO, hasher: Any) -> None:
+    """Feed an open file to hasher in chunks.
+
+    Uses hashlib.file_digest where available (Python 3.11+), which reads
+    into one reused buffer with readinto instead of allocating a new bytes
+    object per chunk; older versions read FULL_HASH_CHUNK_SIZE at a time.
+    """
+    file_digest = getattr(hashlib, "file_digest", None)
+    if file_digest is not None:
+        file_digest(f, lambda: hasher)
+        return
+    while chunk := f.read(FULL_HASH_CHUNK_SIZE):
+        hasher.update(chunk)
+
+
+def _compile_exclude_patterns(patterns: list[str]) -> re.Pattern[str] | None:
+    """Compile exclude globs into one regex, or None when there are none.
+
+    A path is excluded when it matches a pattern as a whole or ends in
+    "/<pattern>", with the same semantics as fnmatch on POSIX.
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(
+            f"(?:{fnmatch.translate(f'*/{pattern}')})|(?:{fnmatch.translate(pattern)})"
+            for pattern in patterns
+        )
+    )
+
+
+@dataclass(slots=True)
 class FileInfo:
     """Metadata for a scanned file."""
 
@@ -57,8 +155,18 @@ class DuplicateGroup:
         """Calculate space recoverable if all but one copy removed."""
         return self.size_bytes * (len(self.files) - 1)
 
+    @cached_property
+    def size_formatted(self) -> str:
+        """Human-readable size of each copy (computed once per group)."""
+        return format_bytes(self.size_bytes)
 
-@dataclass
+    @cached_property
+    def potential_savings_formatted(self) -> str:
+        """Human-readable potential savings (computed once per group)."""
+        return format_bytes(self.potential_savings)
+
+
+@dataclass(slots=True)
 class ScanConfig:
     """Configuration for duplicate scanning."""
 
@@ -76,10 +184,10 @@ class ScanConfig:
             "*.iso",
         ]
     )
-    hash_algorithm: HashAlgorithm = HashAlgorithm.SHA256
+    hash_algorithm: HashAlgorithm = HashAlgorithm.BLAKE3
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanResult:
     """Result of a duplicate scan."""
 
@@ -89,6 +197,40 @@ class ScanResult:
     total_wasted_bytes: int
     scan_duration_seconds: float
     errors: list[str]
+    omitted_groups: int = 0  # Groups dropped by scan(top_n_only=...)
+
+    @property
+    def group_count(self) -> int:
+        """Number of duplicate groups found, including any omitted ones."""
+        return len(self.duplicate_groups) + self.omitted_groups
+
+
+# (stage, current, total)
+ProgressCallback = Callable[[str, int, int], None]
+
+
+def _throttle(callback: ProgressCallback, min_interval: float = 0.1) -> ProgressCallback:
+    """Wrap a progress callback so it fires at most every min_interval seconds.
+
+    Updates that complete a stage (current >= total) are always delivered.
+    """
+    last_call = time.monotonic()
+
+    def throttled(stage: str, current: int, total: int) -> None:
+        nonlocal last_call
+        now = time.monotonic()
+        if current >= total or now - last_call >= min_interval:
+            last_call = now
+            callback(stage, current, total)
+
+    return throttled
+
+
+# (paths, sizes, mtimes, errors) collected from one configured root
+_RootWalk = tuple[list[str], "array[int]", "array[float]", list[str]]
+
+# (confirmed (full hash, identical files) sets, errors) for one stage-3 group
+_ProgressiveOutcome = tuple[list[tuple[str, list[FileInfo]]], list[str]]
 
 
 class DuplicateScanner:
@@ -99,8 +241,26 @@ class DuplicateScanner:
     1. Size grouping - files must have identical sizes
     2. Partial hash - first 64KB must match
     3. Full hash - entire file content must match
+
+    Stages 2 and 3 hash files on a thread pool.
     """
 
+    # Worker threads for hashing (I/O bound; hashing releases the GIL)
+    MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+    # Below this many files a stage is hashed inline; starting threads would
+    # cost more than it saves
+    MIN_PARALLEL_FILES = 8
+
+    # Stage 3 keeps every file of a candidate group open while comparing;
+    # bigger groups are hashed file by file. Together with the worker cap
+    # this bounds open descriptors to 128 (macOS defaults to 256 per process)
+    MAX_PROGRESSIVE_GROUP = 16
+    MAX_PROGRESSIVE_WORKERS = 8
+
+    # Concurrent walks when several roots are configured
+    MAX_WALK_WORKERS = 8
+
     def __init__(self, config: ScanConfig) -> None:
         """
         Initialize scanner with configuration.
@@ -110,16 +270,23 @@ class DuplicateScanner:
         """
         self.config = config
         self._errors: list[str] = []
+        self._files_scanned = 0
+        self._new_hasher = _hasher_factory(config.hash_algorithm)
+        self._exclude_re = _compile_exclude_patterns(config.exclude_patterns)
 
     def scan(
         self,
-        progress_callback: Callable[[str, int, int], None] | None = None,
+        progress_callback: ProgressCallback | None = None,
+        top_n_only: int | None = None,
     ) -> ScanResult:
         """
         Execute full scan pipeline.
 
         Args:
             progress_callback: Optional callback (stage, current, total).
+            top_n_only: If set, keep only the top_n_only groups with the most
+                potential savings (selected with a heap, no full sort). Totals
+                still cover every group; see ScanResult.omitted_groups.
 
         Returns:
             ScanResult with duplicate groups and statistics.
@@ -136,12 +303,16 @@ class DuplicateScanner:
         if progress_callback:
             progress_callback("size_grouping", len(size_groups), len(size_groups))
 
-        # Filter to only groups with potential duplicates (2+ files same size)
+        # Only sizes shared by 2+ files come back; FileInfo objects are only
+        # built for those
         potential_duplicates = {
-            size: files for size, files in size_groups.items() if len(files) > 1
+            size: [
+                FileInfo(path=Path(path), size_bytes=size, mtime=mtime) for path, mtime in entries
+            ]
+            for size, entries in size_groups.items()
         }
 
-        total_files = sum(len(files) for files in size_groups.values())
+        total_files = self._files_scanned
 
         if not potential_duplicates:
             return ScanResult(
@@ -153,26 +324,32 @@ class DuplicateScanner:
                 errors=self._errors,
             )
 
+        # Per-file updates inside the hashing stages are throttled; stage
+        # boundaries below always go straight to the callback
+        file_progress = _throttle(progress_callback) if progress_callback else None
+
         # Stage 2: Partial hash
         if progress_callback:
-            progress_callback("partial_hashing", 0, len(potential_duplicates))
+            partial_total = sum(len(files) for files in potential_duplicates.values())
+            progress_callback("partial_hashing", 0, partial_total)
 
-        partial_groups = self._group_by_partial_hash(potential_duplicates)
+        partial_groups = self._group_by_partial_hash(potential_duplicates, file_progress)
 
         if progress_callback:
-            progress_callback("partial_hashing", len(partial_groups), len(partial_groups))
+            progress_callback("partial_hashing", partial_total, partial_total)
 
         # Filter to only groups with 2+ files
         partial_with_dupes = {k: v for k, v in partial_groups.items() if len(v) > 1}
 
         # Stage 3: Full hash
         if progress_callback:
-            progress_callback("full_hashing", 0, len(partial_with_dupes))
+            full_total = sum(len(files) for files in partial_with_dupes.values())
+            progress_callback("full_hashing", 0, full_total)
 
-        full_groups = self._group_by_full_hash(partial_with_dupes)
+        full_groups = self._group_by_full_hash(partial_with_dupes, file_progress)
 
         if progress_callback:
-            progress_callback("full_hashing", len(full_groups), len(full_groups))
+            progress_callback("full_hashing", full_total, full_total)
 
         # Build DuplicateGroup objects
         duplicate_groups: list[DuplicateGroup] = []
@@ -188,7 +365,13 @@ class DuplicateScanner:
                 total_duplicates += len(files)
 
         # Sort by potential savings (largest first)
-        duplicate_groups.sort(key=lambda g: g.potential_savings, reverse=True)
+        savings = attrgetter("potential_savings")
+        omitted = 0
+        if top_n_only is not None and top_n_only < len(duplicate_groups):
+            omitted = len(duplicate_groups) - top_n_only
+            duplicate_groups = heapq.nlargest(top_n_only, duplicate_groups, key=savings)
+        else:
+            duplicate_groups.sort(key=savings, reverse=True)
 
         return ScanResult(
             duplicate_groups=duplicate_groups,
@@ -197,93 +380,166 @@ class DuplicateScanner:
             total_wasted_bytes=total_wasted,
             scan_duration_seconds=time.time() - start_time,
             errors=self._errors,
+            omitted_groups=omitted,
         )
 
-    def _group_by_size(self) -> dict[int, list[FileInfo]]:
+    def _group_by_size(self) -> dict[int, list[tuple[str, float]]]:
         """
         Stage 1: Group all files by size.
 
+        The walk only appends to flat columns (a path list plus int64/double
+        arrays), and sizes are tallied with Counter in one C-level pass.
+        Most files have a unique size, so groups are only built for sizes
+        shared by two or more files. The number of files seen is left in
+        _files_scanned.
+
         Returns:
-            Dict mapping file size to list of FileInfo objects.
+            Dict mapping each shared file size to its (path, mtime) tuples.
         """
-        size_groups: dict[int, list[FileInfo]] = defaultdict(list)
+        paths: list[str] = []
+        sizes = array("q")
+        mtimes = array("d")
+
+        # Roots may sit on different devices, so they are walked concurrently;
+        # results are merged in config order, keeping the output deterministic
+        roots = self.config.paths
+        if len(roots) > 1:
+            workers = min(len(roots), self.MAX_WALK_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                walks = list(pool.map(self._walk_root, roots))
+        else:
+            walks = [self._walk_root(root) for root in roots]
+
+        for root_paths, root_sizes, root_mtimes, root_errors in walks:
+            paths.extend(root_paths)
+            sizes.extend(root_sizes)
+            mtimes.extend(root_mtimes)
+            self._errors.extend(root_errors)
+
+        self._files_scanned = len(paths)
+        counts = Counter(sizes)
+        size_groups: dict[int, list[tuple[str, float]]] = defaultdict(list)
+        for path, size, mtime in zip(paths, sizes, mtimes, strict=True):
+            if counts[size] > 1:
+                size_groups[size].append((path, mtime))
 
-        for scan_path in self.config.paths:
-            if not scan_path.exists():
-                self._errors.append(f"Path does not exist: {scan_path}")
-                continue
+        return dict(size_groups)
 
-            try:
-                self._scan_directory(scan_path, size_groups)
-            except PermissionError as e:
-                self._errors.append(f"Permission denied: {scan_path} - {e}")
-            except OSError as e:
-                self._errors.append(f"Error scanning {scan_path}: {e}")
+    def _walk_root(self, scan_path: Path) -> _RootWalk:
+        """
+        Walk one configured root into its own columns.
 
-        return dict(size_groups)
+        Runs on a worker thread when there are several roots, so nothing
+        here touches shared state; errors are returned with the columns.
+
+        Args:
+            scan_path: Root directory to walk.
+
+        Returns:
+            (paths, sizes, mtimes, errors) for this root.
+        """
+        paths: list[str] = []
+        sizes = array("q")
+        mtimes = array("d")
+        errors: list[str] = []
+
+        if not scan_path.exists():
+            errors.append(f"Path does not exist: {scan_path}")
+            return paths, sizes, mtimes, errors
+
+        try:
+            self._scan_directory(scan_path, paths, sizes, mtimes, errors)
+        except PermissionError as e:
+            errors.append(f"Permission denied: {scan_path} - {e}")
+        except OSError as e:
+            errors.append(f"Error scanning {scan_path}: {e}")
+
+        return paths, sizes, mtimes, errors
 
     def _scan_directory(
         self,
         directory: Path,
-        size_groups: dict[int, list[FileInfo]],
+        paths: list[str],
+        sizes: array[int],
+        mtimes: array[float],
+        errors: list[str],
     ) -> None:
         """
-        Recursively scan a directory, adding files to size groups.
+        Walk a directory tree, appending each file to the scan columns.
+
+        Iterative (a queue of raw str paths, no recursion), so deep trees
+        can't hit the recursion limit. Files are recorded as raw str paths,
+        and each file is stat'ed once.
 
         Args:
             directory: Directory to scan.
-            size_groups: Dict to populate with results.
+            paths: File paths, appended to in step with sizes and mtimes.
+            sizes: File sizes in bytes.
+            mtimes: File modification times.
+            errors: List to record per-entry errors in.
         """
-        try:
-            entries = list(os.scandir(directory))
-        except PermissionError:
-            self._errors.append(f"Permission denied: {directory}")
-            return
-        except OSError as e:
-            self._errors.append(f"Error reading {directory}: {e}")
-            return
-
-        for entry in entries:
+        follow = self.config.follow_symlinks
+        include_hidden = self.config.include_hidden
+        min_size = self.config.min_size_bytes
+        max_size = self.config.max_size_bytes
+        if max_size is None:
+            max_size = math.inf
+        exclude_match = self._exclude_re.match if self._exclude_re is not None else None
+
+        pending = deque([os.fspath(directory)])
+        while pending:
+            current = pending.popleft()
             try:
-                path = Path(entry.path)
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except PermissionError:
+                errors.append(f"Permission denied: {current}")
+                continue
+            except OSError as e:
+                errors.append(f"Error reading {current}: {e}")
+                continue
 
-                # Skip symlinks unless configured
-                if entry.is_symlink() and not self.config.follow_symlinks:
-                    continue
+            for entry in entries:
+                try:
+                    # Skip symlinks unless configured
+                    if not follow and entry.is_symlink():
+                        continue
 
-                # Skip hidden files unless configured
-                if entry.name.startswith(".") and not self.config.include_hidden:
-                    continue
+                    # Skip hidden files unless configured
+                    if not include_hidden and entry.name.startswith("."):
+                        continue
 
-                # Check exclude patterns
-                if self._matches_exclude_pattern(path):
-                    continue
+                    # Check exclude patterns
+                    path = entry.path
+                    if exclude_match is not None and exclude_match(path):
+                        continue
 
-                if entry.is_dir(follow_symlinks=self.config.follow_symlinks):
-                    self._scan_directory(path, size_groups)
-                elif entry.is_file(follow_symlinks=self.config.follow_symlinks):
-                    stat = entry.stat(follow_symlinks=self.config.follow_symlinks)
-                    size = stat.st_size
+                    # is_symlink/is_dir are answered from the d_type readdir
+                    # already returned; entry.stat caches its result, so a
+                    # file costs exactly one stat syscall and a directory none
+                    if entry.is_dir(follow_symlinks=follow):
+                        pending.append(path)
+                        continue
 
-                    # Skip files outside size bounds
-                    if size < self.config.min_size_bytes:
+                    st = entry.stat(follow_symlinks=follow)
+                    if not stat.S_ISREG(st.st_mode):
                         continue
-                    if self.config.max_size_bytes is not None and size > self.config.max_size_bytes:
+
+                    # Skip files outside size bounds
+                    size = st.st_size
+                    if not min_size <= size <= max_size:
                         continue
 
-                    file_info = FileInfo(
-                        path=path,
-                        size_bytes=size,
-                        mtime=stat.st_mtime,
-                    )
-                    size_groups[size].append(file_info)
+                    paths.append(path)
+                    sizes.append(size)
+                    mtimes.append(st.st_mtime)
 
-            except PermissionError:
-                self._errors.append(f"Permission denied: {entry.path}")
-            except OSError as e:
-                self._errors.append(f"Error accessing {entry.path}: {e}")
+                except PermissionError:
+                    errors.append(f"Permission denied: {entry.path}")
+                except OSError as e:
+                    errors.append(f"Error accessing {entry.path}: {e}")
 
-    def _matches_exclude_pattern(self, path: Path) -> bool:
+    def _matches_exclude_pattern(self, path: str | Path) -> bool:
         """
         Check if path matches any exclude pattern.
 
@@ -293,63 +549,216 @@ class DuplicateScanner:
         Returns:
             True if path should be excluded.
         """
-        path_str = str(path)
-        for pattern in self.config.exclude_patterns:
-            if fnmatch.fnmatch(path_str, f"*/{pattern}") or fnmatch.fnmatch(path_str, pattern):
-                return True
-        return False
+        if self._exclude_re is None:
+            return False
+        return self._exclude_re.match(os.fspath(path)) is not None
 
     def _group_by_partial_hash(
         self,
         size_groups: dict[int, list[FileInfo]],
+        progress: ProgressCallback | None = None,
     ) -> dict[str, list[FileInfo]]:
         """
         Stage 2: Group files by partial hash (first 64KB).
 
         Args:
             size_groups: Files grouped by size.
+            progress: Optional per-file callback (stage, files done, total).
 
         Returns:
             Files grouped by partial hash.
         """
         partial_groups: dict[str, list[FileInfo]] = defaultdict(list)
+        files = [file_info for group in size_groups.values() for file_info in group]
 
-        for _size, files in size_groups.items():
-            for file_info in files:
-                try:
-                    partial_hash = self._compute_hash(file_info.path, full=False)
-                    file_info.partial_hash = partial_hash
-                    partial_groups[partial_hash].append(file_info)
-                except (OSError, PermissionError) as e:
-                    self._errors.append(f"Error hashing {file_info.path}: {e}")
+        hashed = self._hash_files(files, full=False)
+        for done, (file_info, partial_hash) in enumerate(hashed, 1):
+            file_info.partial_hash = partial_hash
+            partial_groups[partial_hash].append(file_info)
+            if progress:
+                progress("partial_hashing", done, len(files))
 
         return dict(partial_groups)
 
     def _group_by_full_hash(
         self,
         partial_groups: dict[str, list[FileInfo]],
+        progress: ProgressCallback | None = None,
     ) -> dict[str, list[FileInfo]]:
         """
         Stage 3: Group files by full content hash.
 
+        Files no larger than PARTIAL_HASH_SIZE were read in full by stage 2,
+        so their partial hash is already the full-content hash (same
+        algorithm, same bytes) and they are not read a second time.
+
+        Other candidate groups are compared progressively (see
+        _progressive_group), so files stop being read as soon as they
+        differ from every other member. Groups too large to keep open at
+        once are hashed file by file instead.
+
         Args:
             partial_groups: Files grouped by partial hash.
+            progress: Optional per-file callback (stage, files done, total).
 
         Returns:
             Files grouped by full hash (confirmed duplicates).
         """
         full_groups: dict[str, list[FileInfo]] = defaultdict(list)
+        progressive: list[list[FileInfo]] = []
+        oversized: list[FileInfo] = []
+        for group in partial_groups.values():
+            to_read: list[FileInfo] = []
+            for file_info in group:
+                if file_info.partial_hash is not None and file_info.size_bytes <= PARTIAL_HASH_SIZE:
+                    file_info.full_hash = file_info.partial_hash
+                    full_groups[file_info.full_hash].append(file_info)
+                else:
+                    to_read.append(file_info)
+            if len(to_read) > self.MAX_PROGRESSIVE_GROUP:
+                oversized.extend(to_read)
+            elif len(to_read) > 1:
+                progressive.append(to_read)
+
+        total = sum(len(group) for group in partial_groups.values())
+        done = total - sum(map(len, progressive)) - len(oversized)
+
+        def absorb(group: list[FileInfo], outcome: _ProgressiveOutcome) -> None:
+            nonlocal done
+            confirmed, errors = outcome
+            self._errors.extend(errors)
+            for full_hash, files in confirmed:
+                for file_info in files:
+                    file_info.full_hash = full_hash
+                full_groups[full_hash].extend(files)
+            done += len(group)
+            if progress:
+                progress("full_hashing", done, total)
+
+        if sum(map(len, progressive)) < self.MIN_PARALLEL_FILES:
+            for group in progressive:
+                absorb(group, self._progressive_group(group))
+        else:
+            workers = min(self.MAX_PROGRESSIVE_WORKERS, len(progressive))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for group, outcome in zip(
+                    progressive, pool.map(self._progressive_group, progressive), strict=True
+                ):
+                    absorb(group, outcome)
+
+        for file_info, full_hash in self._hash_files(oversized, full=True):
+            file_info.full_hash = full_hash
+            full_groups[full_hash].append(file_info)
+            done += 1
+            if progress:
+                progress("full_hashing", done, total)
+
+        return dict(full_groups)
+
+    def _progressive_group(self, files: list[FileInfo]) -> _ProgressiveOutcome:
+        """
+        Split a candidate group into sets of identical files, block by block.
 
-        for _partial_hash, files in partial_groups.items():
+        All files are read FULL_HASH_CHUNK_SIZE at a time in lockstep, each
+        into its own running full hasher. Files whose running digests match
+        have identical content so far and stay together; a file left alone
+        is not a duplicate and is closed without reading the rest. Sets
+        that reach EOF together are identical, and their running hasher
+        holds the same digest a full hash would.
+
+        Args:
+            files: Candidate files (same partial hash).
+
+        Returns:
+            ([(full hash, identical files), ...], errors). Runs on worker
+            threads, so errors are returned rather than recorded.
+        """
+        confirmed: list[tuple[str, list[FileInfo]]] = []
+        errors: list[str] = []
+        opened: list[tuple[FileInfo, BinaryIO, Any]] = []
+        try:
             for file_info in files:
                 try:
-                    full_hash = self._compute_hash(file_info.path, full=True)
-                    file_info.full_hash = full_hash
-                    full_groups[full_hash].append(file_info)
-                except (OSError, PermissionError) as e:
-                    self._errors.append(f"Error hashing {file_info.path}: {e}")
+                    f = open(file_info.path, "rb")  # Closed by _release below
+                except OSError as e:  # Includes PermissionError
+                    errors.append(f"Error hashing {file_info.path}: {e}")
+                    continue
+                _fadvise(f.fileno(), "POSIX_FADV_SEQUENTIAL")
+                opened.append((file_info, f, self._new_hasher(True)))
+
+            active = [opened] if len(opened) > 1 else []
+            while active:
+                still_active = []
+                for members in active:
+                    parts: dict[bytes, list[tuple[FileInfo, BinaryIO, Any]]] = defaultdict(list)
+                    at_eof: set[bytes] = set()
+                    for member in members:
+                        file_info, f, hasher = member
+                        try:
+                            block = f.read(FULL_HASH_CHUNK_SIZE)
+                        except OSError as e:
+                            errors.append(f"Error hashing {file_info.path}: {e}")
+                            _release(f)
+                            continue
+                        hasher.update(block)
+                        key = hasher.digest()
+                        parts[key].append(member)
+                        if not block:
+                            at_eof.add(key)
+
+                    for key, part in parts.items():
+                        if len(part) == 1:
+                            _release(part[0][1])
+                        elif key in at_eof:
+                            confirmed.append((part[0][2].hexdigest(), [m[0] for m in part]))
+                        else:
+                            still_active.append(part)
+                active = still_active
+        finally:
+            for _, f, _ in opened:
+                _release(f)
+
+        return confirmed, errors
+
+    def _hash_files(self, files: list[FileInfo], full: bool) -> Iterator[tuple[FileInfo, str]]:
+        """
+        Hash files on a thread pool, yielding results in input order.
 
-        return dict(full_groups)
+        Reads and hashlib/BLAKE3 updates release the GIL, so threads overlap
+        both I/O and hashing. Results are consumed (and grouped, and errors
+        recorded) on the calling thread only.
+
+        Args:
+            files: Files to hash.
+            full: Hash entire files instead of the first 64KB.
+
+        Yields:
+            (file_info, hex digest) for every file that could be hashed.
+        """
+
+        def hash_one(file_info: FileInfo) -> str | OSError:
+            try:
+                return self._compute_hash(file_info.path, full=full)
+            except OSError as e:  # Includes PermissionError
+                return e
+
+        if len(files) < self.MIN_PARALLEL_FILES:
+            results: Iterable[str | OSError] = map(hash_one, files)
+            yield from self._collect_hashes(files, results)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(files))) as pool:
+            yield from self._collect_hashes(files, pool.map(hash_one, files))
+
+    def _collect_hashes(
+        self, files: list[FileInfo], results: Iterable[str | OSError]
+    ) -> Iterator[tuple[FileInfo, str]]:
+        """Pair files with their digests, recording hashing errors instead."""
+        for file_info, result in zip(files, results, strict=True):
+            if isinstance(result, OSError):
+                self._errors.append(f"Error hashing {file_info.path}: {result}")
+            else:
+                yield file_info, result
 
     def _compute_hash(self, path: Path, full: bool = False) -> str:
         """
@@ -362,13 +771,18 @@ class DuplicateScanner:
         Returns:
             Hex digest of hash.
         """
-        hasher = hashlib.sha256()
+        hasher = self._new_hasher(full)
 
         with open(path, "rb") as f:
             if full:
-                # Read in chunks to handle large files
-                while chunk := f.read(65536):
-                    hasher.update(chunk)
+                fd = f.fileno()
+                _fadvise(fd, "POSIX_FADV_SEQUENTIAL")
+                try:
+                    _hash_stream(f, hasher)
+                finally:
+                    # Each file is read exactly once; don't let it evict the
+                    # user's working set from the page cache
+                    _fadvise(fd, "POSIX_FADV_DONTNEED")
             else:
                 # Only read first 64KB for partial hash
                 chunk = f.read(PARTIAL_HASH_SIZE)
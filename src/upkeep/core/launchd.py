@@ -17,9 +17,12 @@ import plistlib
 import re
 import subprocess
 import sys
+import threading
+import time
 from datetime import datetime
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from upkeep.api.models.schedule import (
     DayOfWeek,
@@ -28,6 +31,129 @@ from upkeep.api.models.schedule import (
 )
 from upkeep.core.exceptions import ValidationError
 
+# Schedule IDs: "schedule-" followed by alphanumerics and dashes only.
+# Prevents path traversal (../) and command injection (; rm -rf /)
+_SCHEDULE_ID_RE = re.compile(r"^schedule-[a-zA-Z0-9\-]+$")
+
+# launchd label (and plist file name stem) prefix for schedules
+_LABEL_PREFIX = "com.upkeep.schedule."
+_PLIST_SUFFIX = ".plist"
+
+# Schedule IDs of our job labels in `launchctl print gui/<uid>` output
+_LOADED_LABEL_RE = re.compile(re.escape(_LABEL_PREFIX) + r"(schedule-[a-zA-Z0-9\-]+)")
+
+# How long one `launchctl print` answers is_registered lookups
+_LOADED_LABELS_TTL = 2.0
+
+# DayOfWeek -> launchd Weekday (0=Sunday, 1=Monday, etc.)
+_WEEKDAYS: dict[DayOfWeek, int] = {
+    DayOfWeek.SUNDAY: 0,
+    DayOfWeek.MONDAY: 1,
+    DayOfWeek.TUESDAY: 2,
+    DayOfWeek.WEDNESDAY: 3,
+    DayOfWeek.THURSDAY: 4,
+    DayOfWeek.FRIDAY: 5,
+    DayOfWeek.SATURDAY: 6,
+}
+
+# Make Homebrew and other common CLI tools available when running under launchd
+_LAUNCHD_PATH = "/opt/homebrew/bin:/usr/local/bin:/usr/bin:/bin:/usr/sbin:/sbin"
+
+
+@cache
+def _home() -> Path:
+    """The user's home directory, resolved once per process.
+
+    Path.home() goes through expanduser (and getpwuid without $HOME) on every
+    call. Lazy rather than a module constant so importing this module doesn't
+    resolve it.
+    """
+    return Path.home()
+
+
+@cache
+def _gui_domain() -> str:
+    """launchd domain of the current user's GUI session (gui/<uid>), resolved once.
+
+    Lazy so the module still imports where os.getuid doesn't exist.
+    """
+    return f"gui/{os.getuid()}"
+
+
+@cache
+def _log_dir() -> str:
+    """Schedule log directory (~/.upkeep/logs), resolved on first use."""
+    return str(_home() / ".upkeep" / "logs")
+
+
+async def _wait_for_flock(fh: IO[Any], timeout: float) -> bool:
+    """Take an exclusive flock on ``fh``, waiting up to ``timeout`` seconds.
+
+    The blocking flock runs on a daemon thread so the kernel wakes us the
+    moment the holder releases, without blocking the event loop. A flock call
+    can't be cancelled, so on timeout the thread is abandoned and takes over
+    ``fh``: it releases and closes it if the lock is ever granted. Only close
+    ``fh`` yourself when this returns True.
+
+    Args:
+        fh: Open lock file
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if the lock was acquired, False on timeout
+    """
+    import fcntl
+
+    try:
+        fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except BlockingIOError:
+        pass
+    except OSError:
+        fh.close()
+        raise
+
+    loop = asyncio.get_running_loop()
+    granted: asyncio.Future[None] = loop.create_future()
+    guard = threading.Lock()
+    state = {"acquired": False, "abandoned": False}
+
+    def _grant() -> None:
+        if not granted.done():
+            granted.set_result(None)
+
+    def _block() -> None:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        with guard:
+            if state["abandoned"]:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+                fh.close()
+                return
+            state["acquired"] = True
+        loop.call_soon_threadsafe(_grant)
+
+    # Daemon thread (not asyncio.to_thread): an abandoned wait must not keep
+    # asyncio.run's executor shutdown, or interpreter exit, waiting on the lock
+    threading.Thread(target=_block, name="upkeep-scheduler-lock", daemon=True).start()
+
+    def _abandon() -> bool:
+        # Hand fh to the thread unless the lock was granted in the meantime
+        with guard:
+            if not state["acquired"]:
+                state["abandoned"] = True
+            return state["acquired"]
+
+    try:
+        await asyncio.wait_for(granted, timeout=max(0, timeout))
+        return True
+    except asyncio.TimeoutError:
+        return _abandon()
+    except asyncio.CancelledError:
+        if _abandon():
+            fcntl.flock(fh, fcntl.LOCK_UN)
+            fh.close()
+        raise
+
 
 class LaunchdGenerator:
     """Generator for launchd plist files and schedule registration.
@@ -49,14 +175,32 @@ class LaunchdGenerator:
 
         # Default to per-user LaunchAgents directory (avoids sudo and interactive auth)
         if plist_dir is None:
-            plist_dir = Path.home() / "Library" / "LaunchAgents"
+            plist_dir = _home() / "Library" / "LaunchAgents"
 
         self.plist_dir = Path(plist_dir)
 
-        # Ensure directory exists
-        if not self.plist_dir.exists():
-            self.plist_dir.mkdir(parents=True, exist_ok=True)
-            self.logger.info(f"Created plist directory: {self.plist_dir}")
+        # Runner script path once written/verified (see _ensure_runner_script)
+        self._runner_path: Path | None = None
+
+        # Registered schedule IDs, valid while the plist dir mtime is unchanged
+        # (see is_registered)
+        self._registered_cache: set[str] | None = None
+        self._cache_mtime: int = 0
+
+        # Schedule IDs launchd has loaded (None: launchctl unavailable) and when
+        # they were read; refreshed after _LOADED_LABELS_TTL (see is_registered)
+        self._registered_labels: set[str] | None = None
+        self._registered_ts: float | None = None
+
+        # Set once the plist and log directories are known to exist
+        self._dirs_ready = False
+
+        # Schedules whose last save_plist here found the plist unchanged;
+        # register_schedules skips their reload if launchd has them loaded
+        self._unchanged: set[str] = set()
+
+        # Ensure plist and log directories exist (save_plist relies on this)
+        self._ensure_dirs()
 
         self.logger.info(f"LaunchdGenerator initialized with plist_dir: {self.plist_dir}")
 
@@ -94,17 +238,15 @@ class LaunchdGenerator:
         calendar_interval = self._build_calendar_interval(schedule)
 
         # Build plist structure
+        log_dir = _log_dir()
         plist = {
-            "Label": f"com.upkeep.schedule.{schedule.id}",
+            "Label": f"{_LABEL_PREFIX}{schedule.id}",
             "ProgramArguments": program_arguments,
             "StartCalendarInterval": calendar_interval,
             "RunAtLoad": False,  # Don't run immediately when loaded
-            "StandardOutPath": str(Path.home() / ".upkeep" / "logs" / f"{schedule.id}.log"),
-            "StandardErrorPath": str(Path.home() / ".upkeep" / "logs" / f"{schedule.id}.error.log"),
-            # Make Homebrew and other common CLI tools available when running under launchd
-            "EnvironmentVariables": {
-                "PATH": "/opt/homebrew/bin:/usr/local/bin:/usr/bin:/bin:/usr/sbin:/sbin",
-            },
+            "StandardOutPath": f"{log_dir}/{schedule.id}.log",
+            "StandardErrorPath": f"{log_dir}/{schedule.id}.error.log",
+            "EnvironmentVariables": {"PATH": _LAUNCHD_PATH},
         }
 
         # Add disabled flag if schedule is disabled
@@ -118,8 +260,14 @@ class LaunchdGenerator:
 
         We intentionally make the runner script the *first* ProgramArguments entry so
         macOS doesn't surface "python3" as a Background Item in Login Items.
+
+        The script is checked once per instance; later calls (e.g. saving many
+        schedules) return the cached path without touching the disk.
         """
-        bin_dir = Path.home() / ".upkeep" / "bin"
+        if self._runner_path is not None:
+            return self._runner_path
+
+        bin_dir = _home() / ".upkeep" / "bin"
         bin_dir.mkdir(parents=True, exist_ok=True)
 
         runner_path = bin_dir / "upkeep-run-schedule"
@@ -139,14 +287,24 @@ exec \"$PYTHON\" -m upkeep.scripts.run_schedule \"$1\"
 """
 
         try:
-            if (not runner_path.exists()) or (runner_path.read_text(encoding="utf-8") != content):
-                runner_path.write_text(content, encoding="utf-8")
+            encoded = content.encode("utf-8")
+            try:
+                # Only read the existing script back when its size could match
+                up_to_date = (
+                    runner_path.stat().st_size == len(encoded)
+                    and runner_path.read_bytes() == encoded
+                )
+            except FileNotFoundError:
+                up_to_date = False
+            if not up_to_date:
+                runner_path.write_bytes(encoded)
                 runner_path.chmod(0o755)
         except Exception as e:
             # If we can't create the runner for some reason, let the caller fall back.
             self.logger.warning(f"Failed to create runner script {runner_path}: {e}")
             return None
 
+        self._runner_path = runner_path
         return runner_path
 
     def _build_calendar_interval(self, schedule: ScheduleConfig) -> Any:
@@ -174,29 +332,11 @@ exec \"$PYTHON\" -m upkeep.scripts.run_schedule \"$1\"
             if not schedule.days_of_week:
                 raise ValidationError("Weekly schedule requires days_of_week")
 
-            # Map DayOfWeek to launchd Weekday (0=Sunday, 1=Monday, etc.)
-            day_map = {
-                DayOfWeek.SUNDAY: 0,
-                DayOfWeek.MONDAY: 1,
-                DayOfWeek.TUESDAY: 2,
-                DayOfWeek.WEDNESDAY: 3,
-                DayOfWeek.THURSDAY: 4,
-                DayOfWeek.FRIDAY: 5,
-                DayOfWeek.SATURDAY: 6,
-            }
-
-            # Create interval for each day
-            intervals = []
-            for day in schedule.days_of_week:
-                intervals.append(
-                    {
-                        "Hour": hour,
-                        "Minute": minute,
-                        "Weekday": day_map[day],
-                    }
-                )
-
-            return intervals
+            # One interval per day
+            return [
+                {"Hour": hour, "Minute": minute, "Weekday": _WEEKDAYS[day]}
+                for day in schedule.days_of_week
+            ]
 
         elif schedule.frequency == ScheduleFrequency.MONTHLY:
             # Monthly: Run on specific day of month
@@ -212,6 +352,14 @@ exec \"$PYTHON\" -m upkeep.scripts.run_schedule \"$1\"
         else:
             raise ValidationError(f"Unsupported frequency: {schedule.frequency}")
 
+    def _ensure_dirs(self) -> None:
+        """Create the plist and log directories if missing."""
+        if not self.plist_dir.exists():
+            self.plist_dir.mkdir(parents=True, exist_ok=True)
+            self.logger.info(f"Created plist directory: {self.plist_dir}")
+        os.makedirs(_log_dir(), exist_ok=True)
+        self._dirs_ready = True
+
     def save_plist(self, schedule: ScheduleConfig) -> Path:
         """Save plist to file.
 
@@ -223,12 +371,9 @@ exec \"$PYTHON\" -m upkeep.scripts.run_schedule \"$1\"
         """
         self.logger.debug(f"Saving plist for schedule: {schedule.id}")
 
-        # Ensure directory exists
-        self.plist_dir.mkdir(parents=True, exist_ok=True)
-
-        # Ensure log directory exists
-        log_dir = Path.home() / ".upkeep" / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
+        # Directories were created in __init__; only redo it after they vanished
+        if not self._dirs_ready:
+            self._ensure_dirs()
 
         # Generate plist
         plist_dict = self.generate_plist(schedule)
@@ -236,9 +381,34 @@ exec \"$PYTHON\" -m upkeep.scripts.run_schedule \"$1\"
         # Get plist path
         plist_path = self.get_plist_path(schedule.id)
 
-        # Write plist
-        with open(plist_path, "wb") as f:
-            plistlib.dump(plist_dict, f)
+        # Write plist: serialize in memory, write a sibling temp file in one
+        # call, then rename over the target so launchd never sees a partial file
+        data = plistlib.dumps(plist_dict)
+        try:
+            # Only read the existing file back when its size could match, so a
+            # replaced or oversized plist is never loaded into memory
+            unchanged = plist_path.stat().st_size == len(data) and plist_path.read_bytes() == data
+        except FileNotFoundError:
+            unchanged = False
+        if unchanged:
+            self.logger.debug(f"Plist unchanged, not rewriting: {plist_path}")
+            self._unchanged.add(schedule.id)
+            return plist_path
+
+        self._unchanged.discard(schedule.id)
+        tmp_path = plist_path.with_suffix(".plist.tmp")
+        try:
+            try:
+                tmp_path.write_bytes(data)
+            except FileNotFoundError:
+                # Directory removed since it was created: recreate and retry once
+                self._ensure_dirs()
+                tmp_path.write_bytes(data)
+            os.replace(tmp_path, plist_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self._registered_cache = None
 
         self.logger.info(f"Saved plist: {plist_path}")
         return plist_path
@@ -252,70 +422,117 @@ exec \"$PYTHON\" -m upkeep.scripts.run_schedule \"$1\"
         Returns:
             True if registration successful, False otherwise
         """
-        self.logger.info(f"Registering schedule: {schedule_id}")
+        return self.register_schedules([schedule_id])[schedule_id]
 
-        # Validate schedule ID
-        if not self.validate_schedule_id(schedule_id):
-            self.logger.error(f"Invalid schedule ID: {schedule_id}")
-            return False
+    def register_schedules(self, schedule_ids: list[str]) -> dict[str, bool]:
+        """Register several schedules with launchctl at once.
 
-        # Get plist path
-        plist_path = self.get_plist_path(schedule_id)
+        launchctl bootout/bootstrap accept several plist paths, so N schedules
+        cost two launchctl processes instead of up to 3N. If the batch
+        bootstrap fails, each schedule is retried on its own so failures map
+        back to individual IDs.
 
-        if not plist_path.exists():
-            self.logger.error(f"Plist not found: {plist_path}")
-            return False
+        Args:
+            schedule_ids: Schedule IDs to register
+
+        Returns:
+            Dict mapping each schedule ID to True if it was registered
+        """
+        self.logger.info(f"Registering schedules: {', '.join(schedule_ids)}")
+        results = dict.fromkeys(schedule_ids, False)
+
+        plist_paths: dict[str, Path] = {}
+        for schedule_id in schedule_ids:
+            # Validate schedule ID
+            if not self.validate_schedule_id(schedule_id):
+                self.logger.error(f"Invalid schedule ID: {schedule_id}")
+                continue
+
+            # Plist saved with identical content and the job is loaded in
+            # launchd: bootout/bootstrap would only reload the same definition.
+            # launchd state is checked (one launchctl print for the batch) so a
+            # job booted out elsewhere is still bootstrapped again.
+            if schedule_id in self._unchanged:
+                loaded = self._loaded_labels()
+                if loaded is not None and schedule_id in loaded:
+                    self.logger.debug(f"Schedule already loaded and unchanged: {schedule_id}")
+                    results[schedule_id] = True
+                    continue
+
+            plist_path = self.get_plist_path(schedule_id)
+            if not os.path.exists(plist_path):
+                self.logger.error(f"Plist not found: {plist_path}")
+                continue
+
+            plist_paths[schedule_id] = plist_path
+
+        if not plist_paths:
+            return results
+
+        # launchd state is about to change
+        self._registered_ts = None
 
         # Register with launchctl (user LaunchAgent)
         try:
-            uid = os.getuid()
+            domain = _gui_domain()
 
-            # Hygiene: make registration idempotent.
-            # If a job with this label already exists, boot it out first (best effort).
-            # This avoids accumulating stale launchd state during rapid create/update cycles.
-            try:
-                subprocess.run(
-                    ["launchctl", "bootout", f"gui/{uid}", str(plist_path)],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                    timeout=10,
-                )
-            except Exception:
-                pass
+            if len(plist_paths) > 1:
+                paths = [str(p) for p in plist_paths.values()]
+                self._bootout_quietly(domain, paths)
+                if self._launchctl("bootstrap", domain, *paths).returncode == 0:
+                    for schedule_id in plist_paths:
+                        results[schedule_id] = True
+                    self.logger.info(f"Successfully registered {len(paths)} schedules")
+                    return results
+                self.logger.warning("Batch bootstrap failed; registering schedules one by one")
 
-            # Preferred modern API (Ventura+)
-            result = subprocess.run(
-                ["launchctl", "bootstrap", f"gui/{uid}", str(plist_path)],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=10,
-            )
-
-            # Fallback for older systems
-            if result.returncode != 0:
-                result = subprocess.run(
-                    ["launchctl", "load", str(plist_path)],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                    timeout=10,
-                )
-
-            if result.returncode == 0:
-                self.logger.info(f"Successfully registered schedule: {schedule_id}")
-                return True
-            else:
-                self.logger.error(f"Failed to register schedule: {result.stderr}")
-                return False
+            for schedule_id, plist_path in plist_paths.items():
+                results[schedule_id] = self._register_one(domain, schedule_id, plist_path)
 
         except subprocess.TimeoutExpired:
-            self.logger.error(f"Timeout registering schedule: {schedule_id}")
-            return False
+            self.logger.error(f"Timeout registering schedules: {', '.join(plist_paths)}")
         except Exception as e:
-            self.logger.error(f"Error registering schedule: {e}")
-            return False
+            self.logger.error(f"Error registering schedules: {e}")
+
+        return results
+
+    def _register_one(self, domain: str, schedule_id: str, plist_path: Path) -> bool:
+        """Register a single plist (bootout, bootstrap, legacy load fallback)."""
+        # Hygiene: make registration idempotent.
+        # If a job with this label already exists, boot it out first (best effort).
+        # This avoids accumulating stale launchd state during rapid create/update cycles.
+        self._bootout_quietly(domain, [str(plist_path)])
+
+        # Preferred modern API (Ventura+)
+        result = self._launchctl("bootstrap", domain, str(plist_path))
+
+        # Fallback for older systems
+        if result.returncode != 0:
+            result = self._launchctl("load", str(plist_path))
+
+        if result.returncode == 0:
+            self.logger.info(f"Successfully registered schedule: {schedule_id}")
+            return True
+        self.logger.error(f"Failed to register schedule {schedule_id}: {result.stderr}")
+        return False
+
+    def _bootout_quietly(self, domain: str, paths: list[str]) -> None:
+        """Best-effort bootout of any jobs already loaded from these plists."""
+        try:
+            self._launchctl("bootout", domain, *paths)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _launchctl(*args: str) -> subprocess.CompletedProcess[str]:
+        """Run a launchctl subcommand, capturing output (10s timeout)."""
+        return subprocess.run(
+            ["launchctl", *args],
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=10,
+        )
 
     def unregister_schedule(self, schedule_id: str) -> bool:
         """Unregister schedule with launchctl.
@@ -327,6 +544,8 @@ exec \"$PYTHON\" -m upkeep.scripts.run_schedule \"$1\"
             True if unregistration successful, False otherwise
         """
         self.logger.info(f"Unregistering schedule: {schedule_id}")
+        self._unchanged.discard(schedule_id)
+        self._registered_ts = None
 
         # Validate schedule ID
         if not self.validate_schedule_id(schedule_id):
@@ -336,16 +555,15 @@ exec \"$PYTHON\" -m upkeep.scripts.run_schedule \"$1\"
         # Get plist path
         plist_path = self.get_plist_path(schedule_id)
 
-        if not plist_path.exists():
+        if not os.path.exists(plist_path):
             self.logger.debug(f"Plist not found (may already be unregistered): {plist_path}")
             return True  # Consider success if already gone
 
         # Unregister with launchctl
         try:
-            uid = os.getuid()
             # Preferred modern API
             result = subprocess.run(
-                ["launchctl", "bootout", f"gui/{uid}", str(plist_path)],
+                ["launchctl", "bootout", _gui_domain(), str(plist_path)],
                 capture_output=True,
                 text=True,
                 check=False,
@@ -387,17 +605,19 @@ exec \"$PYTHON\" -m upkeep.scripts.run_schedule \"$1\"
             True if removal successful, False otherwise
         """
         self.logger.info(f"Removing plist for schedule: {schedule_id}")
+        self._unchanged.discard(schedule_id)
 
         plist_path = self.get_plist_path(schedule_id)
 
-        if not plist_path.exists():
-            self.logger.debug(f"Plist not found: {plist_path}")
-            return True  # Already gone
-
+        # Unlink directly instead of checking first: one syscall either way
         try:
             plist_path.unlink()
+            self._registered_cache = None
             self.logger.info(f"Removed plist: {plist_path}")
             return True
+        except FileNotFoundError:
+            self.logger.debug(f"Plist not found: {plist_path}")
+            return True  # Already gone
         except Exception as e:
             self.logger.error(f"Error removing plist: {e}")
             return False
@@ -411,7 +631,7 @@ exec \"$PYTHON\" -m upkeep.scripts.run_schedule \"$1\"
         Returns:
             Path to plist file
         """
-        return self.plist_dir / f"com.upkeep.schedule.{schedule_id}.plist"
+        return self.plist_dir / f"{_LABEL_PREFIX}{schedule_id}{_PLIST_SUFFIX}"
 
     def is_registered(self, schedule_id: str) -> bool:
         """Check if schedule is registered with launchctl.
@@ -422,9 +642,50 @@ exec \"$PYTHON\" -m upkeep.scripts.run_schedule \"$1\"
         Returns:
             True if registered, False otherwise
         """
-        # Check if plist exists (simple check for now)
-        # TODO: Actually check launchctl list for more accurate status
-        return self.get_plist_path(schedule_id).exists()
+        # One stat of the directory answers repeat lookups; any file added or
+        # removed bumps its mtime and triggers a fresh listing
+        try:
+            mtime = os.stat(self.plist_dir).st_mtime_ns
+        except FileNotFoundError:
+            self._registered_cache = None
+            return False
+
+        if self._registered_cache is None or mtime != self._cache_mtime:
+            self._registered_cache = set(self.list_registered_schedules())
+            self._cache_mtime = mtime
+
+        if schedule_id not in self._registered_cache:
+            return False
+
+        # The plist exists; also require launchd to have the job loaded.
+        # Without launchctl (or if it fails) the plist alone has to do.
+        loaded = self._loaded_labels()
+        return loaded is None or schedule_id in loaded
+
+    def _loaded_labels(self) -> set[str] | None:
+        """Schedule IDs loaded in the user's launchd domain.
+
+        One `launchctl print gui/<uid>` lists every loaded job, so it is run at
+        most once per _LOADED_LABELS_TTL rather than once per schedule.
+
+        Returns:
+            Set of loaded schedule IDs, or None if launchctl is unavailable
+        """
+        now = time.monotonic()
+        if self._registered_ts is not None and now - self._registered_ts < _LOADED_LABELS_TTL:
+            return self._registered_labels
+
+        try:
+            result = self._launchctl("print", _gui_domain())
+            if result.returncode == 0:
+                self._registered_labels = set(_LOADED_LABEL_RE.findall(result.stdout))
+            else:
+                self._registered_labels = None
+        except (OSError, subprocess.TimeoutExpired):
+            self._registered_labels = None
+
+        self._registered_ts = now
+        return self._registered_labels
 
     def validate_schedule_id(self, schedule_id: str) -> bool:
         """Validate schedule ID format for security.
@@ -441,10 +702,7 @@ exec \"$PYTHON\" -m upkeep.scripts.run_schedule \"$1\"
         if not schedule_id.startswith("schedule-"):
             return False
 
-        # Must contain only alphanumeric, dash, and underscore
-        # Prevents path traversal (../) and command injection (; rm -rf /)
-        pattern = re.compile(r"^schedule-[a-zA-Z0-9\-]+$")
-        return pattern.match(schedule_id) is not None
+        return _SCHEDULE_ID_RE.fullmatch(schedule_id) is not None
 
     def list_registered_schedules(self) -> list[str]:
         """List all registered schedule IDs.
@@ -452,18 +710,24 @@ exec \"$PYTHON\" -m upkeep.scripts.run_schedule \"$1\"
         Returns:
             List of schedule IDs
         """
-        schedule_ids = []
-
-        # Find all plist files
-        for plist_path in self.plist_dir.glob("com.upkeep.schedule.*.plist"):
-            # Extract schedule ID from filename
-            filename = plist_path.stem  # com.upkeep.schedule.schedule-abc123
-            parts = filename.split(".")
-            if len(parts) >= 4:
-                schedule_id = parts[3]  # schedule-abc123
-                schedule_ids.append(schedule_id)
-
-        return schedule_ids
+        # Slice IDs out of the raw file names
+        # (com.upkeep.schedule.schedule-abc123.plist -> schedule-abc123): one
+        # string per match, where removeprefix().removesuffix() would make two.
+        # DirEntry.is_file is answered from the directory read for regular files
+        start, end = len(_LABEL_PREFIX), -len(_PLIST_SUFFIX)
+        min_len = start + len(_PLIST_SUFFIX) + 1
+        try:
+            with os.scandir(self.plist_dir) as it:
+                return [
+                    name[start:end]
+                    for entry in it
+                    if len(name := entry.name) >= min_len
+                    and name.startswith(_LABEL_PREFIX)
+                    and name.endswith(_PLIST_SUFFIX)
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
 
 
 async def run_scheduled_task_async(schedule_id: str, *, lock_wait_seconds: int = 30 * 60) -> bool:
@@ -506,15 +770,14 @@ async def run_scheduled_task_async(schedule_id: str, *, lock_wait_seconds: int =
         # Prevent overlap: acquire a global lock.
         # This protects against two schedules firing near-simultaneously.
         import fcntl
-        import time as _time
-        from contextlib import contextmanager
+        from contextlib import asynccontextmanager
 
-        locks_dir = Path.home() / ".upkeep" / "locks"
+        locks_dir = _home() / ".upkeep" / "locks"
         locks_dir.mkdir(parents=True, exist_ok=True)
         lock_path = locks_dir / "scheduler.lock"
 
-        @contextmanager
-        def _acquire_lock(wait_seconds: int):
+        @asynccontextmanager
+        async def _acquire_lock(wait_seconds: int):
             """Acquire the global scheduler lock.
 
             Best practice: queue (wait) rather than skip to avoid missed maintenance.
@@ -523,26 +786,16 @@ async def run_scheduled_task_async(schedule_id: str, *, lock_wait_seconds: int =
             fh = open(lock_path, "w")
             acquired = False
             try:
-                deadline = _time.time() + max(0, int(wait_seconds))
-                # Poll with a short sleep so we can log waiting and honor a timeout.
-                while True:
-                    try:
-                        fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
-                        acquired = True
-                        yield True
-                        break
-                    except BlockingIOError:
-                        if _time.time() >= deadline:
-                            yield False
-                            break
-                        _time.sleep(1)
+                acquired = await _wait_for_flock(fh, wait_seconds)
+                yield acquired
             finally:
                 if acquired:
                     try:
                         fcntl.flock(fh, fcntl.LOCK_UN)
                     except Exception:
                         pass
-                fh.close()
+                    fh.close()
+                # Otherwise the abandoned waiter thread owns fh (see _wait_for_flock)
 
         def _notify(title: str, message: str) -> None:
             # Best-effort macOS notification; safe no-op if osascript fails.
@@ -564,14 +817,14 @@ async def run_scheduled_task_async(schedule_id: str, *, lock_wait_seconds: int =
             except Exception:
                 pass
 
-        start_ts = _time.time()
+        start_ts = time.time()
         successful = 0
         failed = 0
         total = len(schedule.operations)
 
         logger.info(f"Waiting for scheduler lock (up to {lock_wait_seconds}s)...")
 
-        with _acquire_lock(lock_wait_seconds) as have_lock:
+        async with _acquire_lock(lock_wait_seconds) as have_lock:
             if not have_lock:
                 msg = (
                     f"Skipped {schedule.name}: another maintenance batch is already running "
@@ -616,7 +869,7 @@ async def run_scheduled_task_async(schedule_id: str, *, lock_wait_seconds: int =
 
             await _run_batch()
 
-        duration_s = int(max(0, _time.time() - start_ts))
+        duration_s = int(max(0, time.time() - start_ts))
 
         # Update last_run timestamp
         schedule_api.update_schedule(schedule_id, {"last_run": datetime.now()})
@@ -6,20 +6,28 @@ This module provides functions for gathering system information on macOS.
 
 import os
 import platform
+import shutil
 import subprocess
+from functools import cache
 
+# Evaluated once; the OS doesn't change under a running process
+_IS_DARWIN = platform.system() == "Darwin"
 
+
+@cache
 def get_macos_version() -> str:
     """
     Get the macOS version string.
 
+    Cached for the life of the process (sw_vers is a fork/exec per call).
+
     Returns:
         Version string (e.g., "26.2.0")
 
     Raises:
         RuntimeError: If not running on macOS or version cannot be determined
     """
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         raise RuntimeError("This function only works on macOS")
 
     try:
@@ -34,17 +42,20 @@ def get_macos_version() -> str:
         raise RuntimeError(f"Could not determine macOS version: {e}") from e
 
 
+@cache
 def get_macos_build() -> str:
     """
     Get the macOS build string.
 
+    Cached for the life of the process.
+
     Returns:
         Build string (e.g., "25C56")
 
     Raises:
         RuntimeError: If not running on macOS or build cannot be determined
     """
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         raise RuntimeError("This function only works on macOS")
 
     try:
@@ -59,10 +70,13 @@ def get_macos_build() -> str:
         raise RuntimeError(f"Could not determine macOS build: {e}") from e
 
 
+@cache
 def get_username() -> str:
     """
     Get the current username.
 
+    Cached for the life of the process.
+
     Returns:
         Username string (e.g., "szenone")
     """
@@ -89,6 +103,9 @@ def get_system_info() -> dict[str, str]:
     """
     Get comprehensive system information.
 
+    The values are gathered once per process; each call returns a fresh copy
+    so callers can't modify the cached result.
+
     Returns:
         Dictionary with system information:
         - platform: OS name (should be "Darwin")
@@ -101,7 +118,13 @@ def get_system_info() -> dict[str, str]:
     Raises:
         RuntimeError: If not running on macOS
     """
-    if platform.system() != "Darwin":
+    return dict(_system_info())
+
+
+@cache
+def _system_info() -> dict[str, str]:
+    """Gather the values behind get_system_info (cached)."""
+    if not _IS_DARWIN:
         raise RuntimeError("This function only works on macOS")
 
     return {
@@ -124,13 +147,4 @@ def check_command_exists(command: str) -> bool:
     Returns:
         True if command exists, False otherwise
     """
-    try:
-        subprocess.run(
-            ["command", "-v", command],
-            capture_output=True,
-            check=True,
-            shell=False,
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    return shutil.which(command) is not None
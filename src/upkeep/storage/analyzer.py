@@ -6,8 +6,13 @@ and categorizing storage by file type.
 """
 
 import fnmatch
+import heapq
 import os
+import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
 
 
@@ -73,9 +78,11 @@ class AnalysisResult:
         if not patterns:
             return []
 
+        extensions = {pattern.removeprefix("*.").lower() for pattern in patterns}
         result = []
         for entry in self.entries:
-            if any(fnmatch.fnmatch(entry.path.name.lower(), pattern) for pattern in patterns):
+            _, dot, ext = entry.path.name.rpartition(".")
+            if dot and ext.lower() in extensions:
                 result.append(entry)
         return result
 
@@ -113,16 +120,55 @@ CATEGORY_PATTERNS = {
 }
 
 
+# Extension -> category lookup derived from CATEGORY_PATTERNS (all patterns are
+# "*.<ext>"); the first category listing an extension wins, as with the
+# pattern scan
+EXTENSION_CATEGORIES: dict[str, str] = {}
+for _category, _patterns in CATEGORY_PATTERNS.items():
+    for _pattern in _patterns:
+        EXTENSION_CATEGORIES.setdefault(_pattern.removeprefix("*.").lower(), _category)
+
+
+def categorize(name: str) -> str | None:
+    """
+    Get the category for a file name.
+
+    Equivalent to matching the lowercased name against CATEGORY_PATTERNS,
+    but a single dict lookup on the final extension.
+
+    Args:
+        name: File name (final path component)
+
+    Returns:
+        Category name, or None if the extension is not categorized
+    """
+    _, dot, ext = name.rpartition(".")
+    if not dot:
+        return None
+    return EXTENSION_CATEGORIES.get(ext.lower())
+
+
 class DiskAnalyzer:
     """
     Analyzes disk usage for a given path.
 
+    Results are deliberately not persisted between runs: a directory's
+    mtime only changes when entries are added, removed or renamed, not when
+    a file inside it grows or a nested subtree changes, so a cache keyed on
+    (dev, ino, mtime) would silently report stale sizes.
+
+    Top-level subdirectories are walked concurrently on a thread pool; the
+    work is dominated by stat/readdir syscalls, which release the GIL.
+
     Example:
         >>> analyzer = DiskAnalyzer(Path.home())
         >>> result = analyzer.analyze()
         >>> print(f"Total size: {result.total_size_gb:.2f} GB")
     """
 
+    # Worker threads for walking top-level subdirectories (I/O bound)
+    MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
     def __init__(
         self,
         root_path: Path,
@@ -138,20 +184,31 @@ class DiskAnalyzer:
             max_depth: Maximum depth to traverse (None = unlimited)
         """
         self.root_path = Path(root_path).resolve()
-        self.exclude_patterns = exclude_patterns or []
+        # Add common exclusions
+        self.exclude_patterns = [
+            *(exclude_patterns or []),
+            ".git",
+            ".venv",
+            "venv",
+            "node_modules",
+            "__pycache__",
+            ".cache",
+            ".Trash",
+        ]
         self.max_depth = max_depth
 
-        # Add common exclusions
-        self.exclude_patterns.extend(
-            [
-                ".git",
-                ".venv",
-                "venv",
-                "node_modules",
-                "__pycache__",
-                ".cache",
-                ".Trash",
-            ]
+    @property
+    def exclude_patterns(self) -> list[str]:
+        """Glob patterns excluded from the walk (a copy; assign to change them)."""
+        return list(self._exclude_patterns)
+
+    @exclude_patterns.setter
+    def exclude_patterns(self, patterns: list[str]) -> None:
+        self._exclude_patterns = tuple(patterns)
+        # One regex for all patterns, matched against raw entry names, instead
+        # of an fnmatch call per pattern per entry; "(?!)" never matches
+        self._exclude_re = re.compile(
+            "|".join(fnmatch.translate(pattern) for pattern in self._exclude_patterns) or "(?!)"
         )
 
     def analyze(self) -> AnalysisResult:
@@ -165,11 +222,7 @@ class DiskAnalyzer:
             FileNotFoundError: If root_path doesn't exist
             PermissionError: If root_path is not readable
         """
-        if not self.root_path.exists():
-            raise FileNotFoundError(f"Path does not exist: {self.root_path}")
-
-        if not os.access(self.root_path, os.R_OK):
-            raise PermissionError(f"Path is not readable: {self.root_path}")
+        self._check_root()
 
         entries: list[FileEntry] = []
         total_size = 0
@@ -177,7 +230,7 @@ class DiskAnalyzer:
         dir_count = 0
         category_sizes: dict[str, int] = dict.fromkeys(CATEGORY_PATTERNS.keys(), 0)
 
-        for entry in self._walk_directory(self.root_path, 0):
+        for entry in self._walk_top_level():
             entries.append(entry)
             total_size += entry.size
 
@@ -187,12 +240,9 @@ class DiskAnalyzer:
                 file_count += 1
 
                 # Categorize files
-                for category, patterns in CATEGORY_PATTERNS.items():
-                    if any(
-                        fnmatch.fnmatch(entry.path.name.lower(), pattern) for pattern in patterns
-                    ):
-                        category_sizes[category] += entry.size
-                        break
+                category = categorize(entry.path.name)
+                if category is not None:
+                    category_sizes[category] += entry.size
 
         return AnalysisResult(
             root_path=self.root_path,
@@ -203,81 +253,148 @@ class DiskAnalyzer:
             category_sizes=category_sizes,
         )
 
-    def _walk_directory(self, path: Path, depth: int):
+    def analyze_topk(self, limit: int) -> list[FileEntry]:
         """
-        Recursively walk directory tree.
+        Find the largest entries without retaining the whole tree.
+
+        Only the current top `limit` entries are kept while walking, so memory
+        stays O(limit) per worker instead of O(files).
 
         Args:
-            path: Current path to walk
-            depth: Current depth from root
+            limit: Number of entries to return
 
-        Yields:
-            FileEntry objects for each file/directory
+        Returns:
+            Up to `limit` entries sorted by size descending
+
+        Raises:
+            FileNotFoundError: If root_path doesn't exist
+            PermissionError: If root_path is not readable
         """
-        if self.max_depth is not None and depth > self.max_depth:
-            return
+        self._check_root()
+        return heapq.nlargest(
+            limit, self._walk_top_level(subtree_limit=limit), key=attrgetter("size")
+        )
 
-        try:
-            for item in path.iterdir():
-                # Check exclusions
-                if self._is_excluded(item):
-                    continue
+    def _check_root(self) -> None:
+        """
+        Validate that the root path exists and is readable.
 
-                try:
-                    if item.is_symlink():
-                        # Skip symlinks to avoid loops
-                        continue
+        Raises:
+            FileNotFoundError: If root_path doesn't exist
+            PermissionError: If root_path is not readable
+        """
+        if not self.root_path.exists():
+            raise FileNotFoundError(f"Path does not exist: {self.root_path}")
 
-                    size = self._get_size(item)
+        if not os.access(self.root_path, os.R_OK):
+            raise PermissionError(f"Path is not readable: {self.root_path}")
 
-                    entry = FileEntry(
-                        path=item,
-                        size=size,
-                        is_dir=item.is_dir(),
-                        depth=depth,
-                    )
+    def _walk_top_level(self, subtree_limit: int | None = None) -> Iterator[FileEntry]:
+        """
+        Walk the root, fanning top-level subdirectories out to a thread pool.
 
-                    yield entry
+        Entries are yielded in the same order as a serial _walk_directory
+        walk: each top-level entry followed by its subtree.
 
-                    # Recurse into directories
-                    if item.is_dir():
-                        yield from self._walk_directory(item, depth + 1)
+        Args:
+            subtree_limit: If set, each subtree yields only its `subtree_limit`
+                largest entries (largest first) instead of every entry
 
-                except (PermissionError, OSError):
-                    # Skip files/dirs we can't access
-                    continue
+        Yields:
+            FileEntry objects for each file/directory
+        """
 
-        except (PermissionError, OSError):
-            # Can't read directory
+        def walk_subtree(path: Path) -> list[FileEntry]:
+            entries = self._walk_directory(path, 1)
+            if subtree_limit is None:
+                return list(entries)
+            return heapq.nlargest(subtree_limit, entries, key=attrgetter("size"))
+
+        top_level = list(self._walk_directory(self.root_path, 0, recurse=False))
+
+        subdirs = [entry.path for entry in top_level if entry.is_dir]
+        if len(subdirs) < 2:
+            # Nothing to parallelize
+            for entry in top_level:
+                yield entry
+                if entry.is_dir:
+                    yield from walk_subtree(entry.path)
             return
 
-    def _get_size(self, path: Path) -> int:
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(subdirs))) as pool:
+            subtrees = {path: pool.submit(walk_subtree, path) for path in subdirs}
+            for entry in top_level:
+                yield entry
+                if entry.is_dir:
+                    yield from subtrees[entry.path].result()
+
+    def _walk_directory(self, path: Path, depth: int, recurse: bool = True):
         """
-        Get size of a file or directory.
+        Recursively walk directory tree.
 
-        For directories, this returns the size of the directory entry itself,
-        not the total size of contents (that's calculated during traversal).
+        Uses os.scandir so entry type and lstat results come from the cached
+        DirEntry (one stat per entry at most, none for type checks on
+        platforms that report d_type).
 
         Args:
-            path: Path to check
+            path: Current path to walk
+            depth: Current depth from root
+            recurse: Descend into subdirectories (False lists only this level)
 
-        Returns:
-            Size in bytes
+        Yields:
+            FileEntry objects for each file/directory
         """
+        if self.max_depth is not None and depth > self.max_depth:
+            return
+
         try:
-            return path.stat().st_size
-        except (OSError, PermissionError):
-            return 0
+            with os.scandir(path) as it:
+                dir_entries = list(it)
+        except (PermissionError, OSError):
+            # Can't read directory
+            return
 
-    def _is_excluded(self, path: Path) -> bool:
+        exclude_match = self._exclude_re.match
+        for item in dir_entries:
+            # Check exclusions on the str name; a Path is only built for kept entries
+            if exclude_match(item.name):
+                continue
+
+            try:
+                if item.is_symlink():
+                    # Skip symlinks to avoid loops
+                    continue
+
+                is_dir = item.is_dir(follow_symlinks=False)
+                try:
+                    size = item.stat(follow_symlinks=False).st_size
+                except OSError:
+                    size = 0
+
+                item_path = Path(item.path)
+                yield FileEntry(
+                    path=item_path,
+                    size=size,
+                    is_dir=is_dir,
+                    depth=depth,
+                )
+
+                # Recurse into directories
+                if is_dir and recurse:
+                    yield from self._walk_directory(item_path, depth + 1)
+
+            except (PermissionError, OSError):
+                # Skip files/dirs we can't access
+                continue
+
+    def _is_excluded(self, name: str) -> bool:
         """
-        Check if path matches any exclusion pattern.
+        Check if an entry name matches any exclusion pattern.
 
         Args:
-            path: Path to check
+            name: File or directory name (final path component)
 
         Returns:
             True if should be excluded
         """
-        name = path.name
-        return any(fnmatch.fnmatch(name, pattern) for pattern in self.exclude_patterns)
+        return self._exclude_re.match(name) is not None
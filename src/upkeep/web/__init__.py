@@ -3,6 +3,16 @@
 Provides FastAPI-based REST API and web UI for system maintenance operations.
 """
 
-from upkeep.web.server import app
+from typing import Any
 
 __all__ = ["app"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the FastAPI app on first use so light helpers such as
+    # upkeep.web.port_utils don't pull in the whole server
+    if name == "app":
+        from upkeep.web.server import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
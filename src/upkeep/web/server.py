@@ -5,8 +5,10 @@ Uses secure launchd daemon for privileged operations (no password handling).
 """
 
 import asyncio
+import heapq
 import json
 import logging
+import os
 import sys
 import time
 import uuid
@@ -384,48 +386,36 @@ async def get_system_health() -> dict[str, Any]:
 async def get_top_processes(limit: int = 3) -> dict[str, Any]:
     """Get top CPU and memory consuming processes."""
     try:
-        processes = []
-
-        # Iterate through all processes
-        for proc in psutil.process_iter(["pid", "name", "cpu_percent", "memory_info"]):
-            try:
-                pinfo = proc.info
-                processes.append(
-                    {
-                        "pid": pinfo["pid"],
-                        "name": pinfo["name"],
-                        "cpu_percent": pinfo["cpu_percent"] or 0.0,
-                        "memory_mb": (pinfo["memory_info"].rss / (1024 * 1024))
-                        if pinfo["memory_info"]
-                        else 0.0,
-                    }
+        # One pass into lightweight (name, cpu, memory_mb) tuples; ad_value fills
+        # unreadable fields instead of raising AccessDenied per process.
+        # Fetching via attrs batches each process's reads under Process.oneshot()
+        processes = [
+            (
+                pinfo["name"],
+                pinfo["cpu_percent"] or 0.0,
+                pinfo["memory_info"].rss / (1024 * 1024) if pinfo["memory_info"] else 0.0,
+            )
+            for pinfo in (
+                proc.info
+                for proc in psutil.process_iter(
+                    ["name", "cpu_percent", "memory_info"], ad_value=None
                 )
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-
-        # Sort by CPU and get top N
-        top_cpu = sorted(processes, key=lambda x: x["cpu_percent"], reverse=True)[:limit]
+            )
+        ]
 
-        # Sort by memory and get top N
-        top_memory = sorted(processes, key=lambda x: x["memory_mb"], reverse=True)[:limit]
+        # Partial sorts: top N by CPU and by memory
+        top_cpu = heapq.nlargest(limit, processes, key=lambda p: p[1])
+        top_memory = heapq.nlargest(limit, processes, key=lambda p: p[2])
 
         # Return with ALL fields required by ProcessInfo model
         return {
             "top_cpu": [
-                {
-                    "name": p["name"],
-                    "cpu_percent": round(p["cpu_percent"], 1),
-                    "memory_mb": round(p["memory_mb"], 1),
-                }
-                for p in top_cpu
+                {"name": name, "cpu_percent": round(cpu, 1), "memory_mb": round(mem, 1)}
+                for name, cpu, mem in top_cpu
             ],
             "top_memory": [
-                {
-                    "name": p["name"],
-                    "cpu_percent": round(p["cpu_percent"], 1),
-                    "memory_mb": round(p["memory_mb"], 1),
-                }
-                for p in top_memory
+                {"name": name, "cpu_percent": round(cpu, 1), "memory_mb": round(mem, 1)}
+                for name, cpu, mem in top_memory
             ],
         }
     except Exception as e:
@@ -665,12 +655,13 @@ async def stream_disk_usage(
 
             min_size_kb = min_size_mb * 1024
             item_count = 0
-            current_dir = str(scan_path)
+            current_dir = os.fsencode(scan_path)
 
             # Use du with streaming output
             process = await asyncio.create_subprocess_exec(
                 "du",
                 "-k",
+                "-P",  # Same flags as DiskScanner.scan
                 "-d",
                 str(depth),
                 str(scan_path),
@@ -683,21 +674,22 @@ async def stream_disk_usage(
             last_update = time.time()
 
             async for line in process.stdout:
-                line_str = line.decode().strip()
-                if line_str:
-                    lines.append(line_str)
+                # Keep raw bytes; only the path shown in progress events is decoded
+                line = line.strip()
+                if line:
+                    lines.append(line)
                     item_count += 1
 
                     # Parse the current directory from du output
-                    parts = line_str.split("\t", 1)
-                    if len(parts) == 2:
-                        current_dir = parts[1]
+                    tab = line.find(b"\t")
+                    if tab >= 0:
+                        current_dir = line[tab + 1 :]
 
                     # Send progress every 100ms or every 10 items
                     now = time.time()
                     if now - last_update >= 0.1 or item_count % 10 == 0:
                         progress_data = {
-                            "currentDir": current_dir,
+                            "currentDir": os.fsdecode(current_dir),
                             "itemCount": item_count,
                         }
                         yield f"event: progress\ndata: {json.dumps(progress_data)}\n\n"
@@ -709,7 +701,7 @@ async def stream_disk_usage(
 
             # Build the final result using the existing scanner logic
             scanner = DiskScanner(max_depth=depth, min_size_kb=min_size_kb)
-            output = "\n".join(lines)
+            output = b"\n".join(lines)
             entries = scanner._parse_du_output(output)
 
             if entries:
@@ -719,7 +711,7 @@ async def stream_disk_usage(
                 tree["totalSizeFormatted"] = scanner.format_size(total_size)
                 tree["path"] = str(scan_path)
                 tree["itemCount"] = item_count
-                scanner._add_percentages(tree, total_size)
+                tree["percentage"] = round(tree["value"] / total_size * 100, 1) if total_size else 0
 
                 yield f"event: complete\ndata: {json.dumps(tree)}\n\n"
             else:
@@ -935,8 +927,8 @@ async def get_duplicate_scan_results(
             headers={"Content-Disposition": f"attachment; filename=duplicates-{scan_id}.csv"},
         )
     else:
-        # Default JSON
-        return json.loads(reporter.to_json(state.result))
+        # Default JSON (FastAPI serializes the dict; no string round-trip)
+        return reporter.to_dict(state.result)
 
 
 @app.post(
@@ -1001,16 +993,10 @@ async def delete_duplicates(
                 detail=f"Cannot delete all copies. At least one must remain (hash: {hash_key[:8]}...)",
             )
 
-    # Delete files (move to Trash)
-    deleted = []
-    errors = []
-
-    for path in paths:
-        result = storage_api.delete_path(path, mode="trash")
-        if result["success"]:
-            deleted.append(path)
-        else:
-            errors.append({"path": path, "error": result.get("error", "Unknown error")})
+    # Delete files (move to Trash) in one batch
+    result = storage_api.delete_paths(paths, mode="trash")
+    deleted = result["deleted"]
+    errors = result["errors"]
 
     return {
         "deleted": deleted,
@@ -2240,7 +2226,9 @@ async def list_apps(limit: int = 50) -> dict[str, Any]:
         from upkeep.core.app_finder import AppFinder
 
         finder = AppFinder()
-        apps = finder.scan_applications()
+        # Ranked by total footprint (bundle + ~/Library artifacts), so every app
+        # needs its artifacts; a deep scan indexes the locations once for all
+        apps = finder.scan_applications(deep=True)
 
         # Format for API response
         app_list = []
@@ -3,13 +3,15 @@ Tests for the AppFinder service (Part of App Uninstaller).
 Tests discovery of applications and their associated artifacts using TDD.
 """
 
+import plistlib
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from upkeep.core.app_finder import AppFinder
+from upkeep.core import app_finder
+from upkeep.core.app_finder import AppFinder, AppScanResult, _load_plist_metadata
 
 
 @pytest.fixture
@@ -73,6 +75,18 @@ def test_find_app_by_path(mock_fs):
     assert result.app_info["version"] == "4.36.134"
 
 
+def test_find_app_by_name_is_case_insensitive(mock_fs):
+    """Test finding an app by name in a search dir, ignoring case."""
+    finder = AppFinder(root_path=mock_fs)
+    finder.search_dirs = (mock_fs / "Missing", mock_fs / "Applications")
+
+    result = finder.find_app("slack")
+
+    assert result is not None
+    assert result.path == str(mock_fs / "Applications" / "Slack.app")
+    assert finder.find_app("Discord") is None
+
+
 def test_find_app_artifacts(mock_fs):
     """Test finding associated artifacts for an app."""
     finder = AppFinder(root_path=mock_fs)
@@ -117,3 +131,162 @@ def test_scan_system_app_protection():
     """Test that system apps are flagged or handled safely."""
     # This might be more relevant for the Uninstaller class, but Finder should identify them
     pass
+
+
+def test_get_size_skips_symlinks(tmp_path):
+    """Test that directory sizes count regular files only, not symlinks."""
+    (tmp_path / "a.bin").write_bytes(b"x" * 100)
+    (tmp_path / "sub" / "deeper").mkdir(parents=True)
+    (tmp_path / "sub" / "b.bin").write_bytes(b"x" * 20)
+    (tmp_path / "sub" / "deeper" / "c.bin").write_bytes(b"x" * 3)
+    (tmp_path / "link.bin").symlink_to(tmp_path / "a.bin")
+    (tmp_path / "sub" / "loop").symlink_to(tmp_path)
+
+    finder = AppFinder(root_path=tmp_path)
+
+    assert finder._get_size(tmp_path) == 123
+    assert finder._get_size(tmp_path / "a.bin") == 100
+    assert finder._get_size(tmp_path / "missing") == 0
+
+
+def test_scan_applications_skips_invalid_bundles(tmp_path):
+    """Test that concurrent scanning keeps valid apps and drops broken bundles."""
+    apps_dir = tmp_path / "Applications"
+    for name in ("Alpha", "Beta"):
+        contents = apps_dir / f"{name}.app" / "Contents"
+        contents.mkdir(parents=True)
+        with open(contents / "Info.plist", "wb") as f:
+            plistlib.dump({"CFBundleIdentifier": f"com.example.{name}", "CFBundleName": name}, f)
+    (apps_dir / "Broken.app").mkdir()
+    (tmp_path / "Library" / "Caches" / "com.example.Alpha").mkdir(parents=True)
+    (tmp_path / "Library" / "Application Support" / "beta").mkdir(parents=True)
+    (tmp_path / "Library" / "Preferences").mkdir()
+    (tmp_path / "Library" / "Preferences" / "com.example.Alpha.plist").write_bytes(b"x" * 7)
+
+    with patch("pathlib.Path.home", return_value=tmp_path):
+        finder = AppFinder(root_path=tmp_path)
+        results = finder.scan_applications(deep=True)
+
+    user_apps = {r.name: r for r in results if r.path.startswith(str(apps_dir))}
+    assert sorted(user_apps) == ["Alpha", "Beta"]
+    alpha_artifacts = user_apps["Alpha"].artifacts
+    assert [a.kind for a in alpha_artifacts] == ["app", "cache", "preferences"]
+    # File artifacts take their size from the index entry's stat
+    assert alpha_artifacts[2].size_bytes == 7
+    # Artifact index lookups are case-insensitive, like APFS
+    assert [a.reason for a in user_apps["Beta"].artifacts] == ["Application bundle", "Name match"]
+    assert finder._artifact_index is None
+
+
+def test_scan_shallow_defers_artifacts(mock_fs):
+    """Test that a shallow scan is bundle-only and scan_artifacts fills it in."""
+    app_path = mock_fs / "Applications" / "Slack.app"
+    with patch("pathlib.Path.home", return_value=mock_fs / "Users" / "testuser"):
+        finder = AppFinder(root_path=mock_fs)
+        slack = finder.scan_shallow(str(app_path))
+        assert [a.kind for a in slack.artifacts] == ["app"]
+
+        finder.scan_artifacts(slack)
+        finder.scan_artifacts(slack)
+
+    assert [a.kind for a in slack.artifacts] == ["app", "support", "cache", "preferences"]
+
+
+def test_directory_artifacts_sized_concurrently_in_order(mock_fs):
+    """Test that pooled directory walks keep match order and per-artifact sizes."""
+    app_path = mock_fs / "Applications" / "Slack.app"
+    with patch("pathlib.Path.home", return_value=mock_fs / "Users" / "testuser"):
+        result = AppFinder(root_path=mock_fs).scan(str(app_path))
+
+    sizes = {a.kind: a.size_bytes for a in result.artifacts}
+    # storage.json ("data"), Cache.db ("cache"), prefs plist ("pref")
+    assert [a.kind for a in result.artifacts] == ["app", "support", "cache", "preferences"]
+    assert (sizes["support"], sizes["cache"], sizes["preferences"]) == (4, 5, 4)
+    assert result.total_size_bytes == sum(a.size_bytes for a in result.artifacts)
+
+
+def test_plist_metadata_cached_until_file_changes(mock_fs):
+    """Test that Info.plist is re-parsed only when its mtime/size change."""
+    app_path = mock_fs / "Applications" / "Slack.app"
+    info_plist = app_path / "Contents" / "Info.plist"
+    finder = AppFinder(root_path=mock_fs)
+
+    with patch("upkeep.core.app_finder.plistlib.load", wraps=plistlib.load) as load:
+        finder.scan(str(app_path))
+        finder.scan(str(app_path))
+        assert load.call_count == 1
+
+        info_plist.write_text(info_plist.read_text().replace("4.36.134", "4.37.0"))
+        result = finder.scan(str(app_path))
+
+    assert load.call_count == 2
+    assert result.version == "4.37.0"
+
+
+@pytest.mark.parametrize("fmt", [plistlib.FMT_BINARY, plistlib.FMT_XML])
+def test_plist_metadata_reads_binary_and_xml(tmp_path, fmt):
+    """Test that both Info.plist encodings parse, picked by their header."""
+    plist = tmp_path / "Info.plist"
+    plist.write_bytes(
+        plistlib.dumps({"CFBundleIdentifier": "com.example.App", "CFBundleName": "App"}, fmt=fmt)
+    )
+
+    st = plist.stat()
+    assert _load_plist_metadata(str(plist), st.st_mtime_ns, st.st_size) == (
+        "com.example.App",
+        "App",
+        "Unknown",
+    )
+
+
+def test_plist_metadata_unreadable_returns_none(tmp_path):
+    """Test that a corrupt plist yields None instead of raising."""
+    plist = tmp_path / "Info.plist"
+    plist.write_bytes(b"bplist00 not really")
+
+    assert _load_plist_metadata(str(plist), 0, 0) is None
+
+
+def test_plist_metadata_refuses_oversized_plist(tmp_path, monkeypatch):
+    """Test that an oversized Info.plist is skipped without being parsed."""
+    monkeypatch.setattr(app_finder, "_MAX_INFO_PLIST_BYTES", 64)
+    plist = tmp_path / "Info.plist"
+    plist.write_bytes(
+        plistlib.dumps({"CFBundleIdentifier": "com.example.App", "CFBundleName": "A" * 100})
+    )
+    st = plist.stat()
+
+    with patch.object(app_finder.plistlib, "loads") as loads:
+        assert _load_plist_metadata(str(plist), st.st_mtime_ns, st.st_size) is None
+        # Stale (smaller) size from the cache key: the bounded read still refuses it
+        assert _load_plist_metadata(str(plist), st.st_mtime_ns, 10) is None
+    loads.assert_not_called()
+
+
+def test_add_artifact_ignores_duplicate_paths(tmp_path):
+    """Test that the same path is only recorded (and counted) once."""
+    target = tmp_path / "Cache.db"
+    target.write_bytes(b"x" * 10)
+    finder = AppFinder(root_path=tmp_path)
+    result = AppScanResult(app_info={"name": "Test"})
+
+    finder._add_artifact(result, target, "cache", "Bundle ID match")
+    finder._add_artifact(result, target, "cache", "Name match")
+
+    assert [a.reason for a in result.artifacts] == ["Bundle ID match"]
+    assert result.total_size_bytes == 10
+
+
+def test_find_artifacts_counts_a_path_matched_twice_once(tmp_path):
+    """Test that a directory matched by bundle ID and by name is recorded once."""
+    support = tmp_path / "Library" / "Application Support" / "com.example.Same"
+    support.mkdir(parents=True)
+    (support / "data.bin").write_bytes(b"x" * 10)
+
+    with patch("pathlib.Path.home", return_value=tmp_path):
+        finder = AppFinder(root_path=tmp_path)
+    result = AppScanResult(app_info={"name": "com.example.Same"})
+    finder._find_artifacts(result, "com.example.Same", "com.example.Same")
+
+    assert [a.reason for a in result.artifacts] == ["Bundle ID match"]
+    assert result.total_size_bytes == 10
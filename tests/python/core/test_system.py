@@ -3,6 +3,8 @@ Tests for core.system module.
 """
 
 import platform
+import subprocess
+from unittest.mock import patch
 
 import pytest
 
@@ -57,6 +59,79 @@ class TestSystemInfo:
         assert len(info["hostname"]) > 0
         assert info["architecture"] in ("arm64", "x86_64")
 
+    def test_requires_macos(self) -> None:
+        """Test that lookups refuse to run off macOS."""
+        system.get_macos_version.cache_clear()
+        system._system_info.cache_clear()
+        with patch.object(system, "_IS_DARWIN", False):
+            with pytest.raises(RuntimeError, match="only works on macOS"):
+                system.get_macos_version()
+            with pytest.raises(RuntimeError, match="only works on macOS"):
+                system.get_system_info()
+
+
+class TestCaching:
+    """Tests for per-process caching of system information."""
+
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        for func in (
+            system.get_macos_version,
+            system.get_macos_build,
+            system.get_username,
+            system._system_info,
+        ):
+            func.cache_clear()
+        yield
+        for func in (
+            system.get_macos_version,
+            system.get_macos_build,
+            system.get_username,
+            system._system_info,
+        ):
+            func.cache_clear()
+
+    def test_sw_vers_runs_once(self, monkeypatch) -> None:
+        """Repeated lookups should not spawn sw_vers again."""
+        monkeypatch.setenv("USER", "tester")
+        completed = subprocess.CompletedProcess([], 0, stdout="26.2\n")
+        with (
+            patch.object(system, "_IS_DARWIN", True),
+            patch.object(system.subprocess, "run", return_value=completed) as run,
+        ):
+            for _ in range(3):
+                assert system.get_macos_version() == "26.2"
+                assert system.get_macos_build() == "26.2"
+                system.get_system_info()
+
+        assert run.call_count == 2
+
+    def test_system_info_returns_copies(self) -> None:
+        """Mutating a result should not affect later calls."""
+        completed = subprocess.CompletedProcess([], 0, stdout="x\n")
+        with (
+            patch.object(system, "_IS_DARWIN", True),
+            patch.object(system.subprocess, "run", return_value=completed),
+        ):
+            info = system.get_system_info()
+            info["version"] = "changed"
+            assert system.get_system_info()["version"] == "x"
+
+    def test_errors_are_not_cached(self) -> None:
+        """A failed lookup should be retried on the next call."""
+        completed = subprocess.CompletedProcess([], 0, stdout="26.2\n")
+        with (
+            patch.object(system, "_IS_DARWIN", True),
+            patch.object(
+                system.subprocess,
+                "run",
+                side_effect=[FileNotFoundError("sw_vers"), completed],
+            ),
+        ):
+            with pytest.raises(RuntimeError):
+                system.get_macos_version()
+            assert system.get_macos_version() == "26.2"
+
 
 class TestCommandExists:
     """Tests for command existence checking."""
@@ -84,3 +159,13 @@ class TestCommandExists:
     def test_check_common_commands(self, command: str) -> None:
         """Test that common Unix commands exist."""
         assert system.check_command_exists(command) is True
+
+    def test_check_command_exists_uses_path(self, tmp_path, monkeypatch) -> None:
+        """Test that lookups follow the current PATH and need an executable."""
+        tool = tmp_path / "upkeep-test-tool"
+        tool.write_text("#!/bin/sh\n")
+        monkeypatch.setenv("PATH", str(tmp_path))
+
+        assert system.check_command_exists("upkeep-test-tool") is False
+        tool.chmod(0o755)
+        assert system.check_command_exists("upkeep-test-tool") is True
@@ -2,6 +2,7 @@
 Tests for storage.analyzer module.
 """
 
+import fnmatch
 from pathlib import Path
 
 import pytest
@@ -11,6 +12,7 @@ from upkeep.storage.analyzer import (
     AnalysisResult,
     DiskAnalyzer,
     FileEntry,
+    categorize,
 )
 
 
@@ -137,6 +139,31 @@ class TestDiskAnalyzer:
         assert "keep.txt" in paths
         assert "exclude.tmp" not in paths
 
+    @pytest.mark.parametrize(
+        "name", ["a.tmp", "tmp", ".git", ".gitignore", "node_modules", "x.TMP", "venv2"]
+    )
+    def test_compiled_exclusions_match_fnmatch(self, temp_dir: Path, name: str) -> None:
+        """The compiled exclusion regex agrees with per-pattern fnmatch."""
+        analyzer = DiskAnalyzer(temp_dir, exclude_patterns=["*.tmp"])
+        expected = any(fnmatch.fnmatch(name, p) for p in analyzer.exclude_patterns)
+        assert analyzer._is_excluded(name) == expected
+
+    def test_assigned_exclusions_rebuild_regex(self, temp_dir: Path) -> None:
+        """Assigning exclude_patterns takes effect; mutating the returned list doesn't."""
+        patterns = ["*.tmp"]
+        analyzer = DiskAnalyzer(temp_dir, exclude_patterns=patterns)
+
+        analyzer.exclude_patterns.append("*.log")
+        assert not analyzer._is_excluded("a.log")
+        assert patterns == ["*.tmp"]
+
+        analyzer.exclude_patterns = ["*.log"]
+        assert analyzer._is_excluded("a.log")
+        assert not analyzer._is_excluded("a.tmp")
+
+        analyzer.exclude_patterns = []
+        assert not analyzer._is_excluded("a.log")
+
     def test_max_depth_limit(self, temp_dir: Path) -> None:
         """Test max_depth limiting."""
         # Create nested structure
@@ -154,6 +181,37 @@ class TestDiskAnalyzer:
         assert not any("level2" in p for p in paths)
         assert not any("deep.txt" in p for p in paths)
 
+    def test_parallel_walk_matches_serial_walk(self, temp_dir: Path) -> None:
+        """Test that the threaded top-level walk yields the same entries in order."""
+        for name in ("a", "b", "c"):
+            (temp_dir / name / "nested").mkdir(parents=True)
+            (temp_dir / name / "file.txt").write_text(name)
+            (temp_dir / name / "nested" / "deep.txt").write_text(name * 10)
+        (temp_dir / "top.txt").write_text("top")
+
+        analyzer = DiskAnalyzer(temp_dir)
+        result = analyzer.analyze()
+        serial = list(analyzer._walk_directory(analyzer.root_path, 0))
+
+        assert [(e.path, e.depth) for e in result.entries] == [(e.path, e.depth) for e in serial]
+        assert result.file_count == 7
+        assert result.dir_count == 6
+
+    def test_analyze_topk_matches_full_analysis(self, temp_dir: Path) -> None:
+        """Test that the bounded top-k walk finds the same largest entries."""
+        for i, name in enumerate(("a", "b", "c")):
+            (temp_dir / name).mkdir()
+            for j in range(4):
+                (temp_dir / name / f"f{j}.bin").write_bytes(b"x" * (5000 + 100 * i + 10 * j))
+        (temp_dir / "top.bin").write_bytes(b"x" * 20000)
+
+        analyzer = DiskAnalyzer(temp_dir)
+        expected = analyzer.analyze().get_largest_entries(3)
+        topk = analyzer.analyze_topk(3)
+
+        assert [e.size for e in topk] == [e.size for e in expected]
+        assert topk[0].path == temp_dir.resolve() / "top.bin"
+
     def test_categorization(self, temp_dir: Path) -> None:
         """Test file categorization."""
         # Create files of different categories
@@ -182,3 +240,23 @@ class TestDiskAnalyzer:
         assert "*.jpg" in CATEGORY_PATTERNS["images"]
         assert "*.mp4" in CATEGORY_PATTERNS["videos"]
         assert "*.pdf" in CATEGORY_PATTERNS["documents"]
+
+
+class TestCategorize:
+    """Tests for extension-based categorization."""
+
+    @pytest.mark.parametrize(
+        "name",
+        ["photo.JPG", "clip.mov", "backup.tar.gz", ".png", "README", "trailing.", "a.key", "x.py"],
+    )
+    def test_matches_pattern_scan(self, name: str) -> None:
+        """Test that categorize agrees with fnmatch over CATEGORY_PATTERNS."""
+        expected = next(
+            (
+                category
+                for category, patterns in CATEGORY_PATTERNS.items()
+                if any(fnmatch.fnmatch(name.lower(), p) for p in patterns)
+            ),
+            None,
+        )
+        assert categorize(name) == expected
@@ -0,0 +1,37 @@
+"""Tests for the App Uninstaller list endpoint (GET /api/apps)."""
+
+import plistlib
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from upkeep.web.server import app
+
+
+def _make_app(apps_dir: Path, name: str, bundle_bytes: int) -> None:
+    contents = apps_dir / f"{name}.app" / "Contents"
+    contents.mkdir(parents=True)
+    (contents / "Info.plist").write_bytes(
+        plistlib.dumps({"CFBundleIdentifier": f"com.example.{name}", "CFBundleName": name})
+    )
+    (contents / "payload.bin").write_bytes(b"x" * bundle_bytes)
+
+
+def test_list_apps_ranks_by_total_footprint(tmp_path):
+    """An app with a small bundle but large ~/Library data still makes the top `limit`."""
+    apps_dir = tmp_path / "Applications"
+    _make_app(apps_dir, "Bulky", 50_000)
+    _make_app(apps_dir, "Hoarder", 1_000)
+    support = tmp_path / "Library" / "Application Support" / "com.example.Hoarder"
+    support.mkdir(parents=True)
+    (support / "data.bin").write_bytes(b"x" * 200_000)
+
+    with patch("pathlib.Path.home", return_value=tmp_path):
+        response = TestClient(app).get("/api/apps?limit=1")
+
+    data = response.json()
+    assert response.status_code == 200
+    assert data["total"] == 2
+    assert [a["name"] for a in data["apps"]] == ["Hoarder"]
+    assert data["apps"][0]["size_bytes"] > 200_000
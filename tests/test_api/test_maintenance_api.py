@@ -1,5 +1,7 @@
 """Unit tests for MaintenanceAPI - Tier 1/2/3 operations."""
 
+import select
+
 import pytest
 
 from upkeep.api.maintenance import MaintenanceAPI
@@ -164,3 +166,208 @@ class TestMaintenanceAPIEdgeCases:
         for op in operations:
             # Allow some flexibility in category names
             assert op["category"] is not None, f"Operation {op['id']} has no category"
+
+
+class TestAtomicWrite:
+    """Test atomic queue/history file writes."""
+
+    def test_atomic_write_text_replaces_content(self, tmp_path):
+        """Test that the target holds the full new content and no tmp file is left."""
+        from upkeep.api.maintenance import atomic_write_text
+
+        target = tmp_path / "job.job.json"
+        target.write_text("old")
+
+        atomic_write_text(target, '{"job_id": "abc"}')
+
+        assert target.read_text() == '{"job_id": "abc"}'
+        assert list(tmp_path.iterdir()) == [target]
+
+
+class TestOperationHistory:
+    """Test the append-only operation history log and its compaction."""
+
+    def test_compact_history_folds_log_into_json(self, tmp_path):
+        """Test that appended records end up in operation_history.json."""
+        import json
+
+        api = MaintenanceAPI()
+        for duration, success in [(1.0, True), (2.0, False), (3.0, True)]:
+            api._append_history_record(
+                tmp_path,
+                {
+                    "operation_id": "dns-flush",
+                    "last_run": "2026-01-01T00:00:00",
+                    "success": success,
+                    "duration_seconds": duration,
+                },
+            )
+
+        api._compact_history(tmp_path)
+
+        history = json.loads((tmp_path / "operation_history.json").read_text())
+        op_hist = history["dns-flush"]
+        assert op_hist["success"] is True
+        assert op_hist["last_duration_seconds"] == 3.0
+        assert op_hist["durations_all_seconds"] == [1.0, 2.0, 3.0]
+        assert op_hist["durations_seconds"] == [1.0, 3.0]
+        assert not (tmp_path / "operation_history.jsonl").exists()
+
+    def test_compact_history_keeps_rolling_window_of_five(self, tmp_path):
+        """Test that only the five most recent durations are kept."""
+        import json
+
+        api = MaintenanceAPI()
+        for i in range(7):
+            api._append_history_record(
+                tmp_path,
+                {
+                    "operation_id": "dns-flush",
+                    "last_run": "2026-01-01T00:00:00",
+                    "success": True,
+                    "duration_seconds": float(i),
+                },
+            )
+        api._compact_history(tmp_path)
+
+        history = json.loads((tmp_path / "operation_history.json").read_text())
+        assert history["dns-flush"]["durations_seconds"] == [2.0, 3.0, 4.0, 5.0, 6.0]
+
+    def test_compact_history_without_log_is_noop(self, tmp_path):
+        """Test that compaction does nothing when no records were appended."""
+        MaintenanceAPI()._compact_history(tmp_path)
+        assert not (tmp_path / "operation_history.json").exists()
+
+
+class TestFormatDuration:
+    """Test queue status duration formatting."""
+
+    @pytest.mark.parametrize(
+        "seconds,expected",
+        [
+            (0, "0s"),
+            (59, "59s"),
+            (60, "1m 0s"),
+            (3599, "59m 59s"),
+            (3600, "1h 0m"),
+            (7325, "2h 2m"),
+        ],
+    )
+    def test_format_duration(self, seconds, expected):
+        """Test seconds, minutes and hours boundaries."""
+        assert MaintenanceAPI._format_duration(seconds) == expected
+
+
+class TestWaitForResult:
+    """Test waiting for daemon result files."""
+
+    def test_returns_result_and_removes_file(self, tmp_path):
+        """Test that a completed result is returned and cleaned up."""
+        import asyncio
+        import json
+
+        api = MaintenanceAPI()
+        api.QUEUE_DIR = tmp_path
+        result_file = tmp_path / "abc.result.json"
+        result_file.write_text(json.dumps({"job_id": "abc", "status": "success"}))
+
+        result = asyncio.run(api._wait_for_result("abc", timeout=5))
+
+        assert result["status"] == "success"
+        assert not result_file.exists()
+
+    def test_times_out_without_result(self, tmp_path):
+        """Test that a missing result raises TimeoutError."""
+        import asyncio
+
+        api = MaintenanceAPI()
+        api.QUEUE_DIR = tmp_path
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(api._wait_for_result("missing", timeout=0))
+
+    @pytest.mark.skipif(not hasattr(select, "kqueue"), reason="kqueue watcher is macOS/BSD only")
+    def test_watcher_close_wakes_pending_wait(self, tmp_path):
+        """Test that closing mid-wait wakes the kevent thread before closing the kqueue."""
+        import asyncio
+        import time
+
+        from upkeep.api.maintenance import _QueueDirWatcher
+
+        async def run():
+            watcher = _QueueDirWatcher(tmp_path)
+            task = asyncio.create_task(watcher.wait(30))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            start = time.monotonic()
+            watcher.close()
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) < 1
+
+    def test_watcher_close_waits_for_kevent_thread(self, tmp_path):
+        """Test that close() wakes the in-flight wait and closes only after it returns."""
+        import asyncio
+        import os
+
+        from upkeep.api.maintenance import _QueueDirWatcher
+
+        events = []
+
+        class FakeKqueue:
+            """Blocks like kevent until the wake pipe becomes readable."""
+
+            def control(self, changes, max_events, timeout):
+                events.append("enter")
+                select.select([watcher._wake_r], [], [], timeout)
+                events.append("return")
+
+            def close(self):
+                events.append("close")
+
+        watcher = _QueueDirWatcher(tmp_path / "missing")
+        watcher._wake_r, watcher._wake_w = os.pipe()
+        watcher._kq = FakeKqueue()
+
+        async def run():
+            task = asyncio.create_task(watcher.wait(30))
+            while not events:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            watcher.close()
+
+        asyncio.run(run())
+
+        assert events == ["enter", "return", "close"]
+        assert watcher._wake_r is None and watcher._wake_w is None
+
+
+class TestRunOperationsHistory:
+    """Test history bookkeeping during run_operations batches."""
+
+    def test_batch_history_is_compacted(self, tmp_path, monkeypatch):
+        """Test that a batch leaves all results in operation_history.json and no log."""
+        import asyncio
+        import json
+        from pathlib import Path
+
+        monkeypatch.setattr(Path, "home", classmethod(lambda cls: tmp_path))
+        api = MaintenanceAPI()
+        api.HISTORY_COMPACT_EVERY = 2
+        monkeypatch.setattr(api, "_enqueue_job", lambda op_id: f"job-{op_id}")
+
+        async def fake_wait(job_id, timeout=1800):
+            return {"job_id": job_id, "status": "success", "exit_code": 0}
+
+        monkeypatch.setattr(api, "_wait_for_result", fake_wait)
+
+        async def run():
+            return [e async for e in api.run_operations(["dns-flush", "periodic", "smart-check"])]
+
+        events = asyncio.run(run())
+
+        log_dir = tmp_path / "Library" / "Logs" / "upkeep"
+        history = json.loads((log_dir / "operation_history.json").read_text())
+        assert set(history) == {"dns-flush", "periodic", "smart-check"}
+        assert not (log_dir / "operation_history.jsonl").exists()
+        assert events[-1]["type"] == "complete"
@@ -0,0 +1,172 @@
+"""Unit tests for StorageAPI."""
+
+from dataclasses import asdict
+from unittest.mock import patch
+
+import pytest
+
+from upkeep.api import storage
+from upkeep.api.storage import LargestEntry, StorageAnalysisResult, StorageAPI, _PrefixTrie
+from upkeep.core.exceptions import PathProtectedError
+
+
+class TestDeletePaths:
+    """Test StorageAPI.delete_paths."""
+
+    @pytest.fixture
+    def api(self):
+        """Create StorageAPI instance."""
+        return StorageAPI()
+
+    def test_permanent_batch_deletes_existing_and_reports_missing(self, api, tmp_path):
+        """Existing paths are deleted; missing ones come back as per-item errors."""
+        file_a = tmp_path / "a.txt"
+        file_a.write_text("a")
+        folder = tmp_path / "folder"
+        folder.mkdir()
+        (folder / "b.txt").write_text("b")
+        missing = tmp_path / "missing.txt"
+
+        result = api.delete_paths([str(file_a), folder, missing], mode="permanent")
+
+        assert sorted(result["deleted"]) == sorted([str(file_a), str(folder)])
+        assert result["errors"] == [{"path": str(missing), "error": f"Path not found: {missing}"}]
+        assert result["mode"] == "permanent"
+        assert not file_a.exists()
+        assert not folder.exists()
+
+    def test_protected_path_aborts_whole_batch(self, api, tmp_path):
+        """A protected path is rejected before anything is deleted."""
+        keep = tmp_path / "keep.txt"
+        keep.write_text("keep")
+
+        with pytest.raises(PathProtectedError):
+            api.delete_paths([keep, "/System/Library"], mode="permanent")
+
+        assert keep.exists()
+
+    def test_trash_batch_reports_per_item_foundation_errors(self, api, tmp_path):
+        """An exception on one item doesn't lose the results of the others."""
+        first, second = tmp_path / "a.txt", tmp_path / "b.txt"
+        first.write_text("a")
+        second.write_text("b")
+
+        def trash(abs_path):
+            if abs_path.endswith("b.txt"):
+                raise RuntimeError("objc boom")
+            return {"success": True, "error": None, "mode": "trash"}
+
+        with (
+            patch.object(storage, "_foundation_trash_api", return_value=object()),
+            patch.object(api, "_trash_with_foundation", side_effect=trash),
+        ):
+            result = api.delete_paths([first, second], mode="trash")
+
+        assert result["deleted"] == [str(first)]
+        assert result["errors"] == [{"path": str(second), "error": "objc boom"}]
+
+    def test_trash_batch_in_test_mode_touches_nothing(self, tmp_path):
+        """Test-mode instances never reach the real Trash."""
+        target = tmp_path / "keep.txt"
+        target.write_text("keep")
+        api = StorageAPI(_test_mode=True)
+
+        with patch.object(storage.subprocess, "run") as run:
+            result = api.delete_paths([target], mode="trash")
+
+        assert result["deleted"] == [str(target)]
+        assert target.exists()
+        run.assert_not_called()
+
+    def test_empty_batch(self, api):
+        """An empty list is a no-op."""
+        assert api.delete_paths([], mode="trash") == {"deleted": [], "errors": [], "mode": "trash"}
+
+
+class TestProtectedPrefixTrie:
+    """Test the prefix trie used for protected path checks."""
+
+    @pytest.mark.parametrize(
+        "path",
+        ["/System", "/usr/bin/python3", "/Library/System/x", "/private/var/db/foo", "/Users", "/"],
+    )
+    def test_matches_startswith_semantics(self, path):
+        """Trie lookup agrees with a startswith scan over PROTECTED_PATHS."""
+        expected = any(path.startswith(p) for p in StorageAPI.PROTECTED_PATHS)
+        assert StorageAPI._protected_trie.match_prefix(path) is expected
+
+    def test_shorter_than_prefix_does_not_match(self):
+        """A query that is itself a strict prefix of a stored entry is not protected."""
+        trie = _PrefixTrie(["/Library/System"])
+        assert trie.match_prefix("/Library") is False
+        assert trie.match_prefix("/Library/System") is True
+
+
+class TestAnalyzePath:
+    """Test StorageAPI.analyze_path result shape."""
+
+    def test_largest_entries_expand_to_dicts_only_in_to_dict(self, tmp_path):
+        """largest_entries are LargestEntry objects until serialized."""
+        (tmp_path / "big.bin").write_bytes(b"x" * 4096)
+
+        result = StorageAPI().analyze_path(tmp_path, max_entries=5)
+
+        assert isinstance(result.largest_entries[0], LargestEntry)
+        entry = result.to_dict()["largest_entries"][0]
+        assert entry == {
+            "path": str(tmp_path.resolve() / "big.bin"),
+            "size_bytes": 4096,
+            "size_gb": 4096 / (1024**3),
+            "is_dir": False,
+        }
+
+    def test_repeated_call_is_served_from_cache(self, tmp_path):
+        """Identical calls within the TTL return the cached result."""
+        (tmp_path / "a.bin").write_bytes(b"x" * 100)
+        api = StorageAPI()
+
+        first = api.analyze_path(tmp_path)
+        (tmp_path / "b.bin").write_bytes(b"x" * 100)
+
+        assert api.analyze_path(tmp_path) is first
+        assert api.analyze_path(str(tmp_path), max_entries=5) is not first
+
+    def test_delete_clears_cache(self, tmp_path):
+        """Deleting through the API invalidates cached analyses."""
+        target = tmp_path / "a.bin"
+        target.write_bytes(b"x" * 100)
+        api = StorageAPI()
+
+        first = api.analyze_path(tmp_path)
+        api.delete_path(target, mode="permanent")
+
+        assert api.analyze_path(tmp_path).file_count == first.file_count - 1
+
+    def test_to_dict_matches_asdict(self):
+        """The hand-built to_dict produces the same shape as dataclasses.asdict."""
+        result = StorageAnalysisResult(
+            success=True,
+            path="/tmp/x",
+            total_size_bytes=2048,
+            total_size_gb=2048 / (1024**3),
+            file_count=1,
+            dir_count=1,
+            category_sizes={"images": 1024},
+            largest_entries=[LargestEntry("/tmp/x/a.jpg", 1024, 1024 / (1024**3), False)],
+        )
+
+        assert result.to_dict() == asdict(result)
+
+
+class TestTestMode:
+    """Test the _test_mode constructor flag."""
+
+    def test_test_mode_does_not_touch_filesystem(self, tmp_path):
+        """In test mode the delete helpers report success without deleting."""
+        target = tmp_path / "keep.txt"
+        target.write_text("keep")
+
+        result = StorageAPI(_test_mode=True).delete_path(target, mode="permanent")
+
+        assert result["success"] is True
+        assert target.exists()
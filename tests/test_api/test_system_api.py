@@ -0,0 +1,131 @@
+"""Unit tests for SystemAPI metrics sampling."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from upkeep.api import system as system_module
+from upkeep.api.system import SystemAPI, SystemMetrics
+from upkeep.core.types import HealthStatus, ProcessSortBy
+
+
+class TestMetricsCache:
+    """Test that get_metrics/get_health_score share one psutil sample."""
+
+    @pytest.fixture
+    def api(self, monkeypatch):
+        """SystemAPI with psutil.cpu_percent counted."""
+        calls = []
+
+        def fake_cpu_percent(interval=None):
+            calls.append(interval)
+            return 12.5
+
+        monkeypatch.setattr(system_module.psutil, "cpu_percent", fake_cpu_percent)
+        api = SystemAPI()
+        api.cpu_calls = calls
+        return api
+
+    def test_metrics_reused_within_ttl(self, api):
+        """Two calls inside METRICS_TTL return the same sample."""
+        first = api.get_metrics()
+        second = api.get_metrics()
+
+        assert second is first
+        # Warmup in __init__ plus a single sample
+        assert len(api.cpu_calls) == 2
+
+    def test_health_score_uses_cached_metrics(self, api):
+        """get_health_score does not issue a second CPU probe."""
+        metrics = api.get_metrics()
+        health = api.get_health_score()
+
+        assert len(api.cpu_calls) == 2
+        assert health.breakdown["cpu"]["usage"] == metrics.cpu_percent
+
+    def test_metrics_resampled_after_ttl(self, api, monkeypatch):
+        """A call after METRICS_TTL takes a fresh, non-blocking sample."""
+        api.get_metrics()
+        monkeypatch.setattr(api, "METRICS_TTL", 0.0)
+        api._cpu_state.sampled_at -= api.CPU_MIN_INTERVAL
+
+        api.get_metrics()
+
+        assert api.cpu_calls[-1] is None
+        assert len(api.cpu_calls) == 3
+
+    def test_metrics_without_cpu_skip_sample(self, api):
+        """include_cpu=False takes no CPU sample and leaves the cache empty."""
+        metrics = api.get_metrics(include_cpu=False)
+
+        assert metrics.cpu_percent == 0.0
+        assert len(api.cpu_calls) == 1
+        assert api._last_sample is None
+
+    def test_new_thread_takes_blocking_sample(self, api):
+        """A thread without its own psutil baseline samples over CPU_MIN_INTERVAL."""
+        api._cpu_state.sampled_at -= api.CPU_MIN_INTERVAL
+
+        worker = threading.Thread(target=api.get_metrics)
+        worker.start()
+        worker.join()
+
+        assert api.cpu_calls[-1] == api.CPU_MIN_INTERVAL
+
+
+class TestHealthScore:
+    """Test health status and issue derivation."""
+
+    @pytest.mark.parametrize(
+        ("usage", "status", "severity"),
+        [
+            (0.0, HealthStatus.EXCELLENT, None),
+            (50.0, HealthStatus.FAIR, None),
+            (85.0, HealthStatus.POOR, "warning"),
+            (95.0, HealthStatus.POOR, "critical"),
+        ],
+    )
+    def test_status_and_issues(self, monkeypatch, usage, status, severity):
+        """Status follows the score ladder; usage above 80% is reported per metric."""
+        api = SystemAPI()
+        metrics = SystemMetrics(
+            cpu_percent=usage,
+            cpu_count=8,
+            memory_total_gb=16.0,
+            memory_used_gb=8.0,
+            memory_available_gb=8.0,
+            memory_percent=usage,
+            disk_total_gb=500.0,
+            disk_used_gb=250.0,
+            disk_free_gb=250.0,
+            disk_percent=usage,
+        )
+        monkeypatch.setattr(api, "get_metrics", lambda: metrics)
+
+        health = api.get_health_score()
+
+        assert health.status == status
+        if severity is None:
+            assert health.issues == []
+        else:
+            assert [i["severity"] for i in health.issues] == [severity] * 3
+            assert health.issues[0]["message"] == f"CPU usage high ({usage:.1f}%)"
+
+
+class TestTopProcesses:
+    """Test top process listing."""
+
+    def test_unreadable_name_gets_placeholder(self, monkeypatch):
+        """Processes whose name is access-denied are listed by pid."""
+        procs = [
+            SimpleNamespace(info={"pid": 1, "name": None, "cpu_percent": 5.0, "memory_info": None}),
+            SimpleNamespace(
+                info={"pid": 2, "name": "python", "cpu_percent": 1.0, "memory_info": None}
+            ),
+        ]
+        monkeypatch.setattr(system_module.psutil, "process_iter", lambda *a, **kw: iter(procs))
+
+        processes = SystemAPI().get_top_processes(by=ProcessSortBy.CPU, limit=2)
+
+        assert [p.name for p in processes] == ["pid 1", "python"]
@@ -2,11 +2,21 @@
 Tests for DiskScanner - disk usage visualization backend.
 """
 
+import io
 import subprocess
 from unittest.mock import MagicMock, patch
 
 from upkeep.core.disk_scanner import DiskScanner
 
+_REAL_POPEN = subprocess.Popen
+
+
+def _fake_du(stdout: bytes, stderr: bytes = b"") -> MagicMock:
+    """Build a finished Popen stand-in whose pipes replay the given du output."""
+    proc = MagicMock(returncode=0, stdout=io.BytesIO(stdout), stderr=io.BytesIO(stderr))
+    proc.wait.return_value = 0
+    return proc
+
 
 class TestDiskScanner:
     """Test suite for DiskScanner class."""
@@ -23,20 +33,30 @@ class TestDiskScanner:
         assert scanner.max_depth == 5
         assert scanner.min_size_kb == 512
 
-    @patch("subprocess.run")
-    def test_scan_parses_du_output(self, mock_run):
+    def test_exclude_patterns_passed_to_du(self):
+        """Exclude patterns become du -I masks on macOS and --exclude elsewhere."""
+        scanner = DiskScanner(max_depth=2, exclude=["node_modules", ".Trash"])
+
+        with patch("sys.platform", "darwin"):
+            args = scanner._du_args("/test")
+        assert args[-5:] == ["-I", "node_modules", "-I", ".Trash", "/test"]
+
+        with patch("sys.platform", "linux"):
+            args = scanner._du_args("/test")
+        assert args[-3:] == ["--exclude=node_modules", "--exclude=.Trash", "/test"]
+
+        assert DiskScanner()._du_args("/test") == ["du", "-k", "-P", "-d", "3", "/test"]
+
+    @patch("subprocess.Popen")
+    def test_scan_parses_du_output(self, mock_popen):
         """Scanner parses du output into hierarchical structure."""
         # Simulate du -k -d 2 output (kilobytes, depth 2)
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="""1000\t/test/a
+        mock_popen.return_value = _fake_du(b"""1000\t/test/a
 2000\t/test/b
 500\t/test/a/sub1
 300\t/test/a/sub2
 3500\t/test
-""",
-            stderr="",
-        )
+""")
 
         scanner = DiskScanner(max_depth=2, min_size_kb=0)
         result = scanner.scan("/test")
@@ -48,17 +68,13 @@ class TestDiskScanner:
         assert "a" in names
         assert "b" in names
 
-    @patch("subprocess.run")
-    def test_scan_filters_small_items(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_scan_filters_small_items(self, mock_popen):
         """Scanner filters out items below min_size_kb."""
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="""100\t/test/tiny
+        mock_popen.return_value = _fake_du(b"""100\t/test/tiny
 5000\t/test/big
 5100\t/test
-""",
-            stderr="",
-        )
+""")
 
         scanner = DiskScanner(max_depth=2, min_size_kb=1000)
         result = scanner.scan("/test")
@@ -68,13 +84,11 @@ class TestDiskScanner:
         assert "big" in child_names
         assert "tiny" not in child_names
 
-    @patch("subprocess.run")
-    def test_scan_handles_permission_denied(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_scan_handles_permission_denied(self, mock_popen):
         """Scanner handles permission denied gracefully."""
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="1000\t/test\n",
-            stderr="du: /test/restricted: Permission denied\n",
+        mock_popen.return_value = _fake_du(
+            b"1000\t/test\n", b"du: /test/restricted: Permission denied\n"
         )
 
         scanner = DiskScanner()
@@ -86,10 +100,10 @@ class TestDiskScanner:
         assert "warnings" in result
         assert len(result["warnings"]) > 0
 
-    @patch("subprocess.run")
-    def test_scan_error_returns_error_structure(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_scan_error_returns_error_structure(self, mock_popen):
         """Scanner returns error structure on complete failure."""
-        mock_run.side_effect = subprocess.SubprocessError("Command failed")
+        mock_popen.side_effect = subprocess.SubprocessError("Command failed")
 
         scanner = DiskScanner()
         result = scanner.scan("/nonexistent")
@@ -97,6 +111,17 @@ class TestDiskScanner:
         assert "error" in result
         assert result["error"] is not None
 
+    @patch("subprocess.Popen")
+    def test_scan_kills_du_after_timeout(self, mock_popen):
+        """Scanner kills a du that runs past SCAN_TIMEOUT and reports an error."""
+        mock_popen.side_effect = lambda *args, **kwargs: _REAL_POPEN(["sleep", "5"], **kwargs)
+
+        scanner = DiskScanner()
+        scanner.SCAN_TIMEOUT = 0.1
+        result = scanner.scan("/test")
+
+        assert "timed out" in result["error"]
+
     def test_format_size_human_readable(self):
         """Scanner formats sizes for human display."""
         scanner = DiskScanner()
@@ -107,14 +132,10 @@ class TestDiskScanner:
         assert scanner.format_size(1048576) == "1.0 GB"
         assert scanner.format_size(1572864) == "1.5 GB"
 
-    @patch("subprocess.run")
-    def test_scan_includes_metadata(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_scan_includes_metadata(self, mock_popen):
         """Scanner includes useful metadata in response."""
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="5000\t/test\n",
-            stderr="",
-        )
+        mock_popen.return_value = _fake_du(b"5000\t/test\n")
 
         scanner = DiskScanner()
         result = scanner.scan("/test")
@@ -124,17 +145,13 @@ class TestDiskScanner:
         assert "path" in result
         assert result["path"] == "/test"
 
-    @patch("subprocess.run")
-    def test_scan_calculates_percentages(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_scan_calculates_percentages(self, mock_popen):
         """Scanner calculates percentage of parent for each item."""
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="""2500\t/test/a
+        mock_popen.return_value = _fake_du(b"""2500\t/test/a
 2500\t/test/b
 5000\t/test
-""",
-            stderr="",
-        )
+""")
 
         scanner = DiskScanner(max_depth=2, min_size_kb=0)
         result = scanner.scan("/test")
@@ -161,3 +178,59 @@ class TestDiskScanner:
 
         assert tree["name"] == "test"
         assert len(tree["children"]) == 2  # a and b
+
+    def test_build_tree_drops_subtrees_of_filtered_nodes(self):
+        """Children of a node below min_size_kb are not promoted into the tree."""
+        scanner = DiskScanner(min_size_kb=250)
+
+        entries = [
+            ("/test/a/x", 100),
+            ("/test/a/y", 260),
+            ("/test/b/big", 900),
+            ("/test/b", 200),
+            ("/test/a", 360),
+            ("/test", 1460),
+        ]
+
+        tree = scanner._build_tree(entries, "/test/")
+
+        assert [c["name"] for c in tree["children"]] == ["a"]
+        assert [c["name"] for c in tree["children"][0]["children"]] == ["y"]
+
+    def test_build_tree_for_filesystem_root(self):
+        """Scanning "/" attaches top-level directories to the root node."""
+        scanner = DiskScanner(min_size_kb=0)
+
+        tree = scanner._build_tree([("/Users", 10), ("/Library", 20), ("/", 30)], "/")
+
+        assert tree["path"] == "/"
+        assert [c["name"] for c in tree["children"]] == ["Library", "Users"]
+
+    def test_build_tree_sets_percentage_of_parent(self):
+        """Each child's percentage is relative to its own parent, not the root."""
+        scanner = DiskScanner(min_size_kb=0)
+
+        tree = scanner._build_tree(
+            [("/test/a/x", 100), ("/test/a", 400), ("/test/b", 0), ("/test", 800)], "/test"
+        )
+
+        a, b = tree["children"]
+        assert (a["percentage"], b["percentage"]) == (50.0, 0)
+        assert a["children"][0]["percentage"] == 25.0
+
+    def test_build_tree_deduplicates_repeated_paths(self):
+        """A path du reports twice becomes one node holding the last size."""
+        scanner = DiskScanner(min_size_kb=100)
+
+        tree = scanner._build_tree(
+            [
+                ("/test/a", 500),
+                ("/test/b", 300),
+                ("/test/a", 700),
+                ("/test/b", 10),
+                ("/test", 1000),
+            ],
+            "/test",
+        )
+
+        assert [(c["name"], c["value"]) for c in tree["children"]] == [("a", 700)]
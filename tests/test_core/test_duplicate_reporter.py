@@ -1,6 +1,9 @@
 """Tests for DuplicateReporter."""
 
+import csv
+import io
 import json
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -160,6 +163,30 @@ class TestDuplicateReporter:
         # Both should be valid JSON
         assert json.loads(compact) == json.loads(pretty)
 
+    def test_to_dict_matches_json(self, sample_scan_result: ScanResult):
+        """to_dict is the structure to_json serializes."""
+        reporter = DuplicateReporter()
+        data = reporter.to_dict(sample_scan_result)
+
+        assert json.loads(reporter.to_json(sample_scan_result)) == data
+        assert data["duplicate_groups"][0]["files"][0]["mtime"].startswith("2023-11-")
+
+    def test_streams_match_string_output(self, sample_scan_result: ScanResult):
+        """The *_stream writers produce the same report as the string methods."""
+        reporter = DuplicateReporter()
+
+        text_out = io.StringIO()
+        reporter.to_text_stream(sample_scan_result, text_out)
+        assert text_out.getvalue() == reporter.to_text(sample_scan_result) + "\n"
+
+        csv_out = io.StringIO()
+        reporter.to_csv_stream(sample_scan_result, csv_out)
+        assert csv_out.getvalue() == reporter.to_csv(sample_scan_result)
+
+        json_out = io.StringIO()
+        reporter.to_json_stream(sample_scan_result, json_out)
+        assert json.loads(json_out.getvalue()) == reporter.to_dict(sample_scan_result)
+
     def test_to_json_empty_result(self, empty_scan_result: ScanResult):
         """Test JSON output with no duplicates."""
         reporter = DuplicateReporter()
@@ -227,6 +254,35 @@ class TestDuplicateReporter:
         # Header + 5 files = 6 lines
         assert len(lines) == 6
 
+    def test_to_csv_matches_csv_writer(self, tmp_path: Path):
+        """Hand-built rows equal csv.writer output, including paths needing quotes."""
+        files = [
+            FileInfo(path=tmp_path / 'a, "b"', size_bytes=2048, mtime=1700000000.0),
+            FileInfo(path=tmp_path / "plain.bin", size_bytes=2048),
+            FileInfo(path=tmp_path / "line\nbreak", size_bytes=2048),
+        ]
+        group = DuplicateGroup(hash="f" * 64, size_bytes=2048, files=files)
+        result = ScanResult(
+            duplicate_groups=[group],
+            total_files_scanned=3,
+            total_duplicates=3,
+            total_wasted_bytes=group.potential_savings,
+            scan_duration_seconds=0.1,
+            errors=[],
+        )
+
+        expected = io.StringIO()
+        writer = csv.writer(expected)
+        writer.writerow(
+            ["Group", "Hash", "Size (bytes)", "Size", "File Path", "Modified", "Potential Savings"]
+        )
+        modified = datetime.fromtimestamp(1700000000.0).strftime("%Y-%m-%d %H:%M:%S")
+        writer.writerow([1, "f" * 16, 2048, "2.0 KB", str(files[0].path), modified, "4.0 KB"])
+        writer.writerow([1, "f" * 16, 2048, "2.0 KB", str(files[1].path), "", ""])
+        writer.writerow([1, "f" * 16, 2048, "2.0 KB", str(files[2].path), "", ""])
+
+        assert DuplicateReporter().to_csv(result) == expected.getvalue()
+
     def test_to_csv_empty_result(self, empty_scan_result: ScanResult):
         """Test CSV output with no duplicates."""
         reporter = DuplicateReporter()
@@ -248,6 +304,14 @@ class TestDuplicateReporter:
         assert "top_savings" in summary
         assert len(summary["top_savings"]) <= 5
 
+    def test_summary_counts_omitted_groups(self, sample_scan_result: ScanResult):
+        """Groups dropped by a top-N scan still count towards the summary."""
+        sample_scan_result.omitted_groups = 3
+        summary = DuplicateReporter().summary(sample_scan_result)
+
+        assert summary["groups"] == 5
+        assert len(summary["top_savings"]) == 2
+
     def test_summary_empty(self, empty_scan_result: ScanResult):
         """Test summary with empty result."""
         reporter = DuplicateReporter()
@@ -5,17 +5,25 @@ TDD: Tests written before implementation.
 """
 
 import hashlib
+import os
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
+from upkeep.core import duplicate_scanner
 from upkeep.core.duplicate_scanner import (
+    PARTIAL_HASH_SIZE,
     DuplicateGroup,
     DuplicateScanner,
     FileInfo,
     HashAlgorithm,
     ScanConfig,
     ScanResult,
+    _hasher_factory,
+    _throttle,
 )
 
 
@@ -30,6 +38,11 @@ class TestDataClasses:
         assert info.partial_hash is None
         assert info.full_hash is None
 
+    def test_file_info_uses_slots(self):
+        """FileInfo has no per-instance __dict__ (one is kept per candidate file)."""
+        info = FileInfo(path=Path("/test/file.txt"), size_bytes=1000)
+        assert not hasattr(info, "__dict__")
+
     def test_duplicate_group_potential_savings(self):
         """DuplicateGroup calculates potential space savings."""
         files = [
@@ -42,6 +55,15 @@ class TestDataClasses:
         # 3 files @ 1000 bytes each = 2000 bytes recoverable (keep 1)
         assert group.potential_savings == 2000
 
+    def test_duplicate_group_formatted_sizes(self):
+        """DuplicateGroup exposes human-readable sizes, computed once."""
+        files = [FileInfo(path=Path(f"/{d}/file.bin"), size_bytes=2048) for d in "abc"]
+        group = DuplicateGroup(hash="abc123", size_bytes=2048, files=files)
+
+        assert group.size_formatted == "2.0 KB"
+        assert group.potential_savings_formatted == "4.0 KB"
+        assert "size_formatted" in vars(group)
+
     def test_scan_config_defaults(self):
         """ScanConfig has sensible defaults."""
         config = ScanConfig(paths=[Path("/test")])
@@ -49,7 +71,7 @@ class TestDataClasses:
         assert config.max_size_bytes is None
         assert config.include_hidden is False
         assert config.follow_symlinks is False
-        assert config.hash_algorithm == HashAlgorithm.SHA256
+        assert config.hash_algorithm == HashAlgorithm.BLAKE3
 
 
 class TestDuplicateScannerInit:
@@ -90,6 +112,10 @@ class TestSizeGrouping:
             five_byte_group = size_groups.get(5, [])
             assert len(five_byte_group) == 2
 
+            # Unique sizes can't have duplicates and are dropped, but counted
+            assert list(size_groups) == [5]
+            assert scanner._files_scanned == 3
+
     def test_skips_files_below_min_size(self):
         """Scanner ignores files smaller than min_size_bytes."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -103,6 +129,48 @@ class TestSizeGrouping:
             # 2-byte file should be excluded
             assert 2 not in size_groups
 
+    def test_skips_files_above_max_size(self):
+        """Scanner ignores files larger than max_size_bytes (bounds inclusive)."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "edge1.bin").write_bytes(b"x" * 100)
+            (Path(tmpdir) / "edge2.bin").write_bytes(b"y" * 100)
+            (Path(tmpdir) / "big1.bin").write_bytes(b"x" * 101)
+            (Path(tmpdir) / "big2.bin").write_bytes(b"y" * 101)
+
+            config = ScanConfig(paths=[Path(tmpdir)], min_size_bytes=0, max_size_bytes=100)
+            size_groups = DuplicateScanner(config)._group_by_size()
+
+            assert set(size_groups) == {100}
+
+
+class TestParallelHashing:
+    """Test that hashing stages run on a thread pool for larger batches."""
+
+    def test_parallel_hashing_keeps_groups_and_errors(self):
+        """Pooled hashing groups like serial hashing and records per-file errors."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = []
+            for i in range(DuplicateScanner.MIN_PARALLEL_FILES * 2):
+                path = Path(tmpdir) / f"file{i}.txt"
+                path.write_text(f"content {i // 2}")  # Pairs of identical files
+                files.append(FileInfo(path=path, size_bytes=path.stat().st_size))
+            broken = files[0].path
+
+            scanner = DuplicateScanner(ScanConfig(paths=[Path(tmpdir)]))
+            real_compute = scanner._compute_hash
+
+            def compute(path, full=False):
+                if path == broken:
+                    raise PermissionError("denied")
+                return real_compute(path, full=full)
+
+            with patch.object(scanner, "_compute_hash", side_effect=compute):
+                partial_groups = scanner._group_by_partial_hash({files[0].size_bytes: files})
+
+            sizes = sorted(len(group) for group in partial_groups.values())
+            assert sizes == [1] + [2] * (len(files) // 2 - 1)
+            assert scanner._errors == [f"Error hashing {broken}: denied"]
+
 
 class TestPartialHashing:
     """Test Stage 2: Partial hash (first 64KB)."""
@@ -181,6 +249,110 @@ class TestFullHashing:
             group = list(full_groups.values())[0]
             assert len(group) == 2
 
+    def test_small_files_are_not_read_twice(self):
+        """Files that fit in the partial hash skip the full-hash read."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("small1.bin", "small2.bin"):
+                (Path(tmpdir) / name).write_bytes(b"s" * 2048)
+            for name in ("large1.bin", "large2.bin"):
+                (Path(tmpdir) / name).write_bytes(b"L" * (PARTIAL_HASH_SIZE + 1))
+
+            scanner = DuplicateScanner(ScanConfig(paths=[Path(tmpdir)]))
+            with patch.object(
+                scanner, "_progressive_group", wraps=scanner._progressive_group
+            ) as progressive:
+                result = scanner.scan()
+
+            read_in_full = {f.path.name for c in progressive.call_args_list for f in c.args[0]}
+            assert read_in_full == {"large1.bin", "large2.bin"}
+            assert len(result.duplicate_groups) == 2
+            # The reused partial hash is the same digest a full read would give
+            small_group = next(g for g in result.duplicate_groups if g.size_bytes == 2048)
+            small_path = small_group.files[0].path
+            assert small_group.hash == scanner._compute_hash(small_path, full=True)
+
+
+class TestProgressiveComparison:
+    """Test Stage 3's block-by-block comparison of candidate groups."""
+
+    @pytest.fixture
+    def small_blocks(self, monkeypatch):
+        monkeypatch.setattr(duplicate_scanner, "FULL_HASH_CHUNK_SIZE", 1024)
+
+    def test_splits_on_late_difference_and_keeps_full_hash(self, small_blocks):
+        """Files differing after the first block are split; survivors get the full hash."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            content = bytes(range(256)) * 20
+            late_diff = content[:3000] + b"!" + content[3001:]
+            paths = [Path(tmpdir) / name for name in ("a.bin", "b.bin", "c.bin")]
+            for path, data in zip(paths, (content, content, late_diff), strict=True):
+                path.write_bytes(data)
+
+            config = ScanConfig(paths=[Path(tmpdir)], hash_algorithm=HashAlgorithm.SHA256)
+            scanner = DuplicateScanner(config)
+            files = [FileInfo(path=p, size_bytes=len(content)) for p in paths]
+            full_groups = scanner._group_by_full_hash({"partial": files})
+
+            expected = hashlib.sha256(content).hexdigest()
+            assert list(full_groups) == [expected]
+            assert [f.path.name for f in full_groups[expected]] == ["a.bin", "b.bin"]
+            assert all(f.full_hash == expected for f in full_groups[expected])
+
+    def test_prefix_file_is_not_a_duplicate(self, small_blocks):
+        """A file that is a strict prefix of another is told apart at EOF."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            short, long = Path(tmpdir) / "short.bin", Path(tmpdir) / "long.bin"
+            short.write_bytes(b"p" * 2048)
+            long.write_bytes(b"p" * 4096)
+
+            scanner = DuplicateScanner(ScanConfig(paths=[Path(tmpdir)]))
+            files = [FileInfo(path=short, size_bytes=2048), FileInfo(path=long, size_bytes=4096)]
+
+            assert scanner._group_by_full_hash({"partial": files}) == {}
+
+    def test_pooled_groups_record_open_errors(self):
+        """Groups compared on the pool still group and report unreadable files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            partial_groups = {}
+            for i in range(DuplicateScanner.MIN_PARALLEL_FILES):
+                pair = []
+                for copy in range(2):
+                    path = Path(tmpdir) / f"file{i}-{copy}.bin"
+                    path.write_bytes(bytes([i]) * (PARTIAL_HASH_SIZE + 1))
+                    pair.append(FileInfo(path=path, size_bytes=PARTIAL_HASH_SIZE + 1))
+                partial_groups[f"partial{i}"] = pair
+            broken = partial_groups["partial0"][0].path
+
+            real_open = open
+
+            def fake_open(path, *args, **kwargs):
+                if path == broken:
+                    raise PermissionError("denied")
+                return real_open(path, *args, **kwargs)
+
+            scanner = DuplicateScanner(ScanConfig(paths=[Path(tmpdir)]))
+            with patch("upkeep.core.duplicate_scanner.open", fake_open, create=True):
+                full_groups = scanner._group_by_full_hash(partial_groups)
+
+            assert sorted(len(group) for group in full_groups.values()) == [2] * 7
+            assert scanner._errors == [f"Error hashing {broken}: denied"]
+
+    def test_oversized_groups_hash_file_by_file(self):
+        """Groups too large to keep open fall back to per-file full hashes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = []
+            for i in range(DuplicateScanner.MAX_PROGRESSIVE_GROUP + 1):
+                path = Path(tmpdir) / f"copy{i}.bin"
+                path.write_bytes(b"z" * (PARTIAL_HASH_SIZE + 1))
+                files.append(FileInfo(path=path, size_bytes=PARTIAL_HASH_SIZE + 1))
+
+            scanner = DuplicateScanner(ScanConfig(paths=[Path(tmpdir)]))
+            with patch.object(scanner, "_progressive_group") as progressive:
+                full_groups = scanner._group_by_full_hash({"partial": files})
+
+            progressive.assert_not_called()
+            assert [len(group) for group in full_groups.values()] == [len(files)]
+
 
 class TestFullScan:
     """Test complete scan pipeline."""
@@ -242,6 +414,37 @@ class TestFullScan:
             stages = [call[0] for call in progress_calls]
             assert "size_grouping" in stages or "scanning" in stages
 
+    def test_scan_reports_per_file_hashing_progress(self):
+        """Hashing stages report files done against a file total."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(3):
+                (Path(tmpdir) / f"copy{i}.bin").write_bytes(b"d" * 2048)
+
+            progress_calls = []
+            scanner = DuplicateScanner(ScanConfig(paths=[Path(tmpdir)]))
+            scanner.scan(progress_callback=lambda *call: progress_calls.append(call))
+
+            partial = [call for call in progress_calls if call[0] == "partial_hashing"]
+            assert partial[0] == ("partial_hashing", 0, 3)
+            assert partial[-1] == ("partial_hashing", 3, 3)
+            full = [call for call in progress_calls if call[0] == "full_hashing"]
+            assert full[0] == ("full_hashing", 0, 3)
+            assert full[-1] == ("full_hashing", 3, 3)
+
+    def test_throttle_limits_rate_but_delivers_completion(self, monkeypatch):
+        """Throttled callbacks drop rapid updates yet always pass stage completion."""
+        clock = iter([0.0, 0.01, 0.02, 0.5, 0.51])
+        monkeypatch.setattr(duplicate_scanner.time, "monotonic", lambda: next(clock))
+        calls = []
+        throttled = _throttle(lambda *call: calls.append(call), min_interval=0.1)
+
+        throttled("full_hashing", 1, 4)  # t=0.01, too soon after creation
+        throttled("full_hashing", 2, 4)  # t=0.02, too soon
+        throttled("full_hashing", 3, 4)  # t=0.5, interval elapsed
+        throttled("full_hashing", 4, 4)  # t=0.51, completion always passes
+
+        assert calls == [("full_hashing", 3, 4), ("full_hashing", 4, 4)]
+
     def test_scan_calculates_wasted_bytes(self):
         """Scan calculates total wasted space."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -256,6 +459,21 @@ class TestFullScan:
             # 3 copies of 1000 bytes = 2000 bytes wasted (keep 1)
             assert result.total_wasted_bytes == 2000
 
+    def test_scan_top_n_only_keeps_largest_groups(self):
+        """top_n_only keeps the biggest groups while totals cover all of them."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for size in (1000, 3000, 2000):
+                for copy in range(2):
+                    (Path(tmpdir) / f"{size}-{copy}.bin").write_bytes(b"t" * size)
+
+            config = ScanConfig(paths=[Path(tmpdir)], min_size_bytes=0)
+            result = DuplicateScanner(config).scan(top_n_only=2)
+
+            assert [g.size_bytes for g in result.duplicate_groups] == [3000, 2000]
+            assert result.omitted_groups == 1
+            assert result.group_count == 3
+            assert result.total_wasted_bytes == 6000
+
 
 class TestExcludePatterns:
     """Test file exclusion patterns."""
@@ -322,6 +540,36 @@ class TestExcludePatterns:
             # .git file should be excluded even though include_hidden=True
             assert len(result.duplicate_groups) == 0
 
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/Users/me/Apps/Foo.app/Contents/Info.plist",
+            "/Users/me/project/node_modules/pkg/index.js",
+            "/Users/me/repo/.git/HEAD",
+            "/Users/me/disk.vmdk",
+            "/Users/me/ubuntu.iso",
+            "/Users/me/notes.txt",
+            "/Users/me/iso/readme.md",
+            "node_modules/x",
+        ],
+    )
+    def test_compiled_patterns_match_fnmatch(self, path):
+        """The combined exclude regex agrees with per-pattern fnmatch."""
+        import fnmatch
+
+        config = ScanConfig(paths=[Path("/")])
+        expected = any(
+            fnmatch.fnmatch(path, f"*/{pattern}") or fnmatch.fnmatch(path, pattern)
+            for pattern in config.exclude_patterns
+        )
+
+        assert DuplicateScanner(config)._matches_exclude_pattern(path) is expected
+
+    def test_no_exclude_patterns_excludes_nothing(self):
+        """An empty exclude list never matches."""
+        config = ScanConfig(paths=[Path("/")], exclude_patterns=[])
+        assert DuplicateScanner(config)._matches_exclude_pattern("/a/b.iso") is False
+
 
 class TestErrorHandling:
     """Test error handling and edge cases."""
@@ -355,6 +603,20 @@ class TestErrorHandling:
         assert isinstance(result, ScanResult)
         assert len(result.errors) > 0 or result.total_files_scanned == 0
 
+    def test_multiple_roots_merge_in_config_order(self):
+        """Roots walked concurrently find cross-root duplicates; errors keep root order."""
+        with tempfile.TemporaryDirectory() as dir_a, tempfile.TemporaryDirectory() as dir_b:
+            (Path(dir_a) / "one.bin").write_bytes(b"m" * 2048)
+            (Path(dir_b) / "two.bin").write_bytes(b"m" * 2048)
+            missing = [Path(dir_a) / "missing1", Path(dir_b) / "missing2"]
+
+            config = ScanConfig(paths=[missing[0], Path(dir_a), Path(dir_b), missing[1]])
+            result = DuplicateScanner(config).scan()
+
+            assert result.total_files_scanned == 2
+            assert result.total_duplicates == 2
+            assert result.errors == [f"Path does not exist: {path}" for path in missing]
+
     def test_handles_empty_directory(self):
         """Scanner handles empty directories."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -365,6 +627,25 @@ class TestErrorHandling:
             assert result.total_files_scanned == 0
             assert len(result.duplicate_groups) == 0
 
+    def test_handles_trees_deeper_than_recursion_limit(self):
+        """Scanner walks nesting deeper than the recursion limit."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            deep = Path(tmpdir).joinpath(*["d"] * 200)
+            deep.mkdir(parents=True)
+            (deep / "a.bin").write_bytes(b"x" * 2048)
+            (Path(tmpdir) / "b.bin").write_bytes(b"x" * 2048)
+
+            scanner = DuplicateScanner(ScanConfig(paths=[Path(tmpdir)]))
+            limit = sys.getrecursionlimit()
+            sys.setrecursionlimit(150)
+            try:
+                result = scanner.scan()
+            finally:
+                sys.setrecursionlimit(limit)
+
+            assert result.total_duplicates == 2
+            assert result.errors == []
+
 
 class TestHashAlgorithm:
     """Test different hash algorithms."""
@@ -385,3 +666,69 @@ class TestHashAlgorithm:
 
             expected = hashlib.sha256(content.encode()).hexdigest()
             assert computed == expected
+
+    @pytest.mark.parametrize("algorithm", [HashAlgorithm.BLAKE3, HashAlgorithm.XXHASH])
+    def test_fast_hash_falls_back_to_sha256_without_package(self, algorithm, monkeypatch):
+        """BLAKE3/xxHash fall back to SHA256 when their optional package is missing."""
+        monkeypatch.setitem(sys.modules, "blake3", None)
+        monkeypatch.setitem(sys.modules, "xxhash", None)
+        _hasher_factory.cache_clear()
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                file1 = Path(tmpdir) / "file.txt"
+                file1.write_text("test content")
+
+                config = ScanConfig(paths=[Path(tmpdir)], hash_algorithm=algorithm)
+                computed = DuplicateScanner(config)._compute_hash(file1, full=True)
+
+                assert computed == hashlib.sha256(b"test content").hexdigest()
+        finally:
+            _hasher_factory.cache_clear()
+
+    def test_full_hash_spans_multiple_chunks(self):
+        """Full hash covers files larger than one read chunk."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file1 = Path(tmpdir) / "big.bin"
+            content = bytes(range(256)) * 4097  # Just over 1MB
+            file1.write_bytes(content)
+
+            config = ScanConfig(paths=[Path(tmpdir)], hash_algorithm=HashAlgorithm.SHA256)
+            computed = DuplicateScanner(config)._compute_hash(file1, full=True)
+
+            assert computed == hashlib.sha256(content).hexdigest()
+
+    def test_full_hash_advises_sequential_then_dontneed(self, monkeypatch):
+        """Full hashes hint sequential access and drop the pages afterwards."""
+        advice = []
+        monkeypatch.setattr(os, "POSIX_FADV_SEQUENTIAL", 2, raising=False)
+        monkeypatch.setattr(os, "POSIX_FADV_DONTNEED", 4, raising=False)
+        monkeypatch.setattr(
+            os, "posix_fadvise", lambda fd, off, n, a: advice.append(a), raising=False
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file1 = Path(tmpdir) / "file.bin"
+            file1.write_bytes(b"x" * 4096)
+            scanner = DuplicateScanner(ScanConfig(paths=[Path(tmpdir)]))
+
+            scanner._compute_hash(file1, full=False)
+            assert advice == []
+
+            scanner._compute_hash(file1, full=True)
+            assert advice == [2, 4]
+
+    @pytest.mark.parametrize("has_file_digest", [True, False])
+    def test_full_hash_with_and_without_file_digest(self, has_file_digest, monkeypatch):
+        """Full hashes are the same whether or not hashlib.file_digest exists."""
+        if not has_file_digest:
+            monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file1 = Path(tmpdir) / "big.bin"
+            content = bytes(range(256)) * 4097  # Just over 1MB
+            file1.write_bytes(content)
+
+            for algorithm in HashAlgorithm:
+                config = ScanConfig(paths=[Path(tmpdir)], hash_algorithm=algorithm)
+                computed = DuplicateScanner(config)._compute_hash(file1, full=True)
+                expected = _hasher_factory(algorithm)(True)
+                expected.update(content)
+                assert computed == expected.hexdigest()
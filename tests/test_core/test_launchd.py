@@ -4,8 +4,13 @@ TDD approach: These tests define the expected behavior of LaunchdGenerator
 before implementation.
 """
 
+import asyncio
+import fcntl
+import os
 import plistlib
 import tempfile
+import threading
+import time
 from datetime import time as time_type
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -17,6 +22,7 @@ from upkeep.api.models.schedule import (
     ScheduleConfig,
     ScheduleFrequency,
 )
+from upkeep.core import launchd
 from upkeep.core.launchd import LaunchdGenerator
 
 
@@ -171,6 +177,24 @@ class TestLaunchdGenerator:
         assert "Disabled" in plist_content
         assert plist_content["Disabled"] is True
 
+    def test_runner_script_checked_once_per_generator(
+        self, generator, daily_schedule, tmp_path, monkeypatch
+    ):
+        """The runner script is written/verified once, then served from cache."""
+        monkeypatch.setattr(launchd, "_home", lambda: tmp_path)
+        runner = tmp_path / ".upkeep" / "bin" / "upkeep-run-schedule"
+        runner.parent.mkdir(parents=True)
+        runner.write_text("stale")
+
+        first = generator.generate_plist(daily_schedule)["ProgramArguments"][0]
+        assert first == str(runner)
+        assert runner.read_text().startswith("#!/bin/bash")
+
+        runner.unlink()
+        second = generator.generate_plist(daily_schedule)["ProgramArguments"][0]
+        assert second == first
+        assert not runner.exists()  # No disk access on the cached path
+
     def test_save_plist(self, generator, daily_schedule, temp_plist_dir):
         """Should save plist to file."""
         plist_path = generator.save_plist(daily_schedule)
@@ -185,6 +209,50 @@ class TestLaunchdGenerator:
             plist_data = plistlib.load(f)
             assert "Label" in plist_data
 
+    def test_save_plist_replaces_atomically(
+        self, generator, daily_schedule, temp_plist_dir, monkeypatch
+    ):
+        """Should swap in the new plist whole and leave no temp file behind."""
+        plist_path = generator.save_plist(daily_schedule)
+        original = plist_path.read_bytes()
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(launchd.os, "replace", failing_replace)
+        daily_schedule.time_of_day = time_type(4, 30, 0)
+        with pytest.raises(OSError):
+            generator.save_plist(daily_schedule)
+
+        # Old plist untouched, temp file cleaned up
+        assert plist_path.read_bytes() == original
+        assert [p.name for p in temp_plist_dir.iterdir()] == [plist_path.name]
+
+        monkeypatch.undo()
+        generator.save_plist(daily_schedule)
+        assert plist_path.read_bytes() != original
+        assert [p.name for p in temp_plist_dir.iterdir()] == [plist_path.name]
+
+    def test_save_plist_skips_mkdir(self, generator, daily_schedule, monkeypatch):
+        """Should not re-create directories __init__ already made."""
+        calls = []
+        monkeypatch.setattr(launchd.os, "makedirs", lambda *a, **k: calls.append(a))
+
+        generator.save_plist(daily_schedule)
+        generator.save_plist(daily_schedule)
+
+        assert calls == []
+
+    def test_save_plist_recreates_removed_directory(
+        self, generator, daily_schedule, temp_plist_dir
+    ):
+        """Should recover when the plist directory disappears after init."""
+        temp_plist_dir.rmdir()
+
+        plist_path = generator.save_plist(daily_schedule)
+
+        assert plist_path.exists()
+
     def test_save_plist_creates_directory(self, daily_schedule):
         """Should create plist directory if it doesn't exist."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -242,6 +310,157 @@ class TestLaunchdGenerator:
 
         assert result is False
 
+    @patch("subprocess.run")
+    def test_register_schedules_batches_launchctl(
+        self, mock_run, generator, daily_schedule, weekly_schedule
+    ):
+        """Several schedules are booted out and bootstrapped in one launchctl call each."""
+        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+        paths = [str(generator.save_plist(s)) for s in (daily_schedule, weekly_schedule)]
+
+        results = generator.register_schedules([daily_schedule.id, weekly_schedule.id])
+
+        assert results == {daily_schedule.id: True, weekly_schedule.id: True}
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        assert [cmd[1] for cmd in commands] == ["bootout", "bootstrap"]
+        assert commands[1][3:] == paths
+
+    @patch("subprocess.run")
+    def test_register_schedules_maps_batch_failure_to_ids(
+        self, mock_run, generator, daily_schedule, weekly_schedule
+    ):
+        """A failed batch is retried per schedule so each ID gets its own result."""
+        daily_path = str(generator.save_plist(daily_schedule))
+        generator.save_plist(weekly_schedule)
+
+        def run(cmd, **kwargs):
+            ok = cmd[1] == "bootout" or (cmd[1] == "bootstrap" and cmd[-1] == daily_path)
+            return Mock(returncode=0 if ok else 1, stdout="", stderr="" if ok else "denied")
+
+        mock_run.side_effect = run
+        results = generator.register_schedules(
+            [daily_schedule.id, weekly_schedule.id, "schedule-../evil"]
+        )
+
+        assert results == {
+            daily_schedule.id: True,
+            weekly_schedule.id: False,
+            "schedule-../evil": False,
+        }
+
+    def test_save_plist_skips_unchanged_content(self, generator, daily_schedule):
+        """Should not rewrite a plist whose content is identical."""
+        plist_path = generator.save_plist(daily_schedule)
+        inode = plist_path.stat().st_ino
+
+        generator.save_plist(daily_schedule)
+        assert plist_path.stat().st_ino == inode  # No temp-file swap
+
+        daily_schedule.time_of_day = time_type(4, 30, 0)
+        generator.save_plist(daily_schedule)
+        assert plist_path.stat().st_ino != inode
+
+    @staticmethod
+    def _launchd(loaded_labels):
+        """Fake subprocess.run: launchctl print lists loaded_labels, the rest succeed."""
+
+        def run(cmd, **kwargs):
+            stdout = ""
+            if cmd[1] == "print":
+                stdout = "services = {\n" + "".join(f"\t0\t-\t{x}\n" for x in loaded_labels)
+                stdout += "}\n"
+            return Mock(returncode=0, stdout=stdout, stderr="")
+
+        return run
+
+    @patch("subprocess.run")
+    def test_register_skips_unchanged_loaded_schedule(
+        self, mock_run, temp_plist_dir, daily_schedule
+    ):
+        """An unchanged plist whose job launchd has loaded is not reloaded.
+
+        Uses a fresh generator per save/register, like the server endpoints.
+        """
+        label = f"com.upkeep.schedule.{daily_schedule.id}"
+        mock_run.side_effect = self._launchd([label])
+        LaunchdGenerator(plist_dir=temp_plist_dir).save_plist(daily_schedule)
+
+        generator = LaunchdGenerator(plist_dir=temp_plist_dir)
+        generator.save_plist(daily_schedule)
+        mock_run.reset_mock()
+        assert generator.register_schedule(daily_schedule.id) is True
+
+        commands = [c[0][0][1] for c in mock_run.call_args_list]
+        assert commands == ["print"]
+
+        # A content change must reload
+        daily_schedule.time_of_day = time_type(4, 30, 0)
+        generator.save_plist(daily_schedule)
+        mock_run.reset_mock()
+        assert generator.register_schedule(daily_schedule.id) is True
+        assert "bootstrap" in [c[0][0][1] for c in mock_run.call_args_list]
+
+    @patch("subprocess.run")
+    def test_register_reloads_unchanged_schedule_not_loaded(
+        self, mock_run, temp_plist_dir, daily_schedule
+    ):
+        """A job booted out outside the generator is bootstrapped again."""
+        mock_run.side_effect = self._launchd([])
+        LaunchdGenerator(plist_dir=temp_plist_dir).save_plist(daily_schedule)
+
+        generator = LaunchdGenerator(plist_dir=temp_plist_dir)
+        generator.save_plist(daily_schedule)
+        assert generator.register_schedule(daily_schedule.id) is True
+
+        assert "bootstrap" in [c[0][0][1] for c in mock_run.call_args_list]
+
+    @patch("subprocess.run", side_effect=FileNotFoundError("launchctl"))
+    def test_register_unchanged_without_launchctl_state(self, mock_run, generator, daily_schedule):
+        """Without launchd state the skip is not taken."""
+        generator.save_plist(daily_schedule)
+        generator.save_plist(daily_schedule)
+
+        generator.register_schedule(daily_schedule.id)
+
+        assert "bootstrap" in [c[0][0][1] for c in mock_run.call_args_list]
+
+    @patch("subprocess.run")
+    def test_register_after_unregister_reloads(self, mock_run, generator, daily_schedule):
+        """An unregistered schedule is bootstrapped again even if its plist is unchanged."""
+        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+        generator.save_plist(daily_schedule)
+        generator.register_schedule(daily_schedule.id)
+
+        generator.unregister_schedule(daily_schedule.id)
+        generator.save_plist(daily_schedule)
+        mock_run.reset_mock()
+        assert generator.register_schedule(daily_schedule.id) is True
+
+        commands = [c[0][0][1] for c in mock_run.call_args_list]
+        assert "bootstrap" in commands
+
+    @patch("subprocess.run")
+    def test_gui_domain_resolved_once(self, mock_run, generator, daily_schedule, monkeypatch):
+        """register/unregister should look the UID up once per process."""
+        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+        calls = []
+
+        def getuid():
+            calls.append(1)
+            return 501
+
+        launchd._gui_domain.cache_clear()
+        monkeypatch.setattr(launchd.os, "getuid", getuid)
+        try:
+            generator.save_plist(daily_schedule)
+            generator.register_schedule(daily_schedule.id)
+            generator.unregister_schedule(daily_schedule.id)
+        finally:
+            launchd._gui_domain.cache_clear()
+
+        assert len(calls) == 1
+        assert all(c[0][0][2] == "gui/501" for c in mock_run.call_args_list)
+
     @patch("subprocess.run")
     def test_unregister_schedule(self, mock_run, generator, daily_schedule):
         """Should unregister schedule with launchctl."""
@@ -271,6 +490,10 @@ class TestLaunchdGenerator:
 
         assert not plist_path.exists()
 
+    def test_remove_missing_plist(self, generator, daily_schedule):
+        """Removing a plist that is already gone should succeed."""
+        assert generator.remove_plist(daily_schedule.id) is True
+
     def test_get_plist_path(self, generator, daily_schedule):
         """Should return correct plist path for schedule ID."""
         path = generator.get_plist_path(daily_schedule.id)
@@ -287,9 +510,107 @@ class TestLaunchdGenerator:
         generator.save_plist(daily_schedule)
 
         # Still not registered (plist exists but not loaded)
-        # In real implementation, this would check launchctl list
-        # For now, just check plist exists
-        assert generator.get_plist_path(daily_schedule.id).exists()
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="services = {\n}\n", stderr="")
+            assert generator.is_registered(daily_schedule.id) is False
+
+    @patch("subprocess.run")
+    def test_is_registered_checks_launchd_once(self, mock_run, generator, daily_schedule):
+        """Should answer many lookups from one launchctl print of the domain."""
+        label = f"com.upkeep.schedule.{daily_schedule.id}"
+        mock_run.return_value = Mock(
+            returncode=0,
+            stdout=f"services = {{\n\t0\t-\t{label}\n\t0\t-\tcom.apple.other\n}}\n",
+            stderr="",
+        )
+        generator.save_plist(daily_schedule)
+        (generator.plist_dir / "com.upkeep.schedule.schedule-unloaded.plist").write_bytes(b"")
+
+        for _ in range(5):
+            assert generator.is_registered(daily_schedule.id) is True
+            assert generator.is_registered("schedule-unloaded") is False
+            assert generator.is_registered("schedule-missing") is False
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0][:2] == ["launchctl", "print"]
+
+    @patch("subprocess.run")
+    def test_is_registered_refreshes_after_ttl(
+        self, mock_run, generator, daily_schedule, monkeypatch
+    ):
+        """Should re-read launchd state once the TTL expires or after registering."""
+        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+        generator.save_plist(daily_schedule)
+        assert generator.is_registered(daily_schedule.id) is False
+
+        now = launchd.time.monotonic()
+        monkeypatch.setattr(launchd.time, "monotonic", lambda: now + launchd._LOADED_LABELS_TTL)
+        assert generator.is_registered(daily_schedule.id) is False
+        assert mock_run.call_count == 2
+
+        generator.register_schedule(daily_schedule.id)
+        mock_run.reset_mock()
+        generator.is_registered(daily_schedule.id)
+        assert mock_run.call_args[0][0][:2] == ["launchctl", "print"]
+
+    @patch("subprocess.run", side_effect=FileNotFoundError("launchctl"))
+    def test_is_registered_without_launchctl(self, mock_run, generator, daily_schedule):
+        """Should fall back to plist presence when launchctl is unavailable."""
+        generator.save_plist(daily_schedule)
+
+        assert generator.is_registered(daily_schedule.id) is True
+        assert generator.is_registered(daily_schedule.id) is True
+        mock_run.assert_called_once()
+
+    def test_is_registered_reuses_listing(self, generator, daily_schedule, monkeypatch):
+        """Should list the plist dir once while its mtime is unchanged."""
+        monkeypatch.setattr(generator, "_loaded_labels", lambda: None)
+        generator.save_plist(daily_schedule)
+        calls = []
+        original = generator.list_registered_schedules
+
+        def counting():
+            calls.append(1)
+            return original()
+
+        monkeypatch.setattr(generator, "list_registered_schedules", counting)
+
+        for _ in range(5):
+            assert generator.is_registered(daily_schedule.id) is True
+        assert generator.is_registered("schedule-other") is False
+        assert len(calls) == 1
+
+    def test_is_registered_sees_external_changes(self, generator, daily_schedule, monkeypatch):
+        """Should rebuild the listing when the plist dir changes behind its back."""
+        monkeypatch.setattr(generator, "_loaded_labels", lambda: None)
+        assert generator.is_registered(daily_schedule.id) is False
+
+        # Written by another process: only the dir mtime signals the change
+        plist_path = generator.get_plist_path(daily_schedule.id)
+        plist_path.write_bytes(b"")
+        os.utime(generator.plist_dir, ns=(0, generator._cache_mtime + 1))
+        assert generator.is_registered(daily_schedule.id) is True
+
+        plist_path.unlink()
+        os.utime(generator.plist_dir, ns=(0, generator._cache_mtime + 1))
+        assert generator.is_registered(daily_schedule.id) is False
+
+    def test_is_registered_invalidated_by_save_and_remove(
+        self, generator, daily_schedule, monkeypatch
+    ):
+        """Should not answer from a stale listing after save_plist/remove_plist."""
+        monkeypatch.setattr(generator, "_loaded_labels", lambda: None)
+        assert generator.is_registered(daily_schedule.id) is False
+        mtime = generator._cache_mtime
+
+        generator.save_plist(daily_schedule)
+        # Pin the mtime so only the explicit invalidation can refresh the cache
+        os.utime(generator.plist_dir, ns=(0, mtime))
+        assert generator.is_registered(daily_schedule.id) is True
+
+        generator.remove_plist(daily_schedule.id)
+        os.utime(generator.plist_dir, ns=(0, mtime))
+        assert generator.is_registered(daily_schedule.id) is False
 
     def test_validate_schedule_id(self, generator):
         """Should validate schedule ID format."""
@@ -303,6 +624,7 @@ class TestLaunchdGenerator:
         assert generator.validate_schedule_id("invalid") is False
         assert generator.validate_schedule_id("../etc/passwd") is False
         assert generator.validate_schedule_id("schedule; rm -rf /") is False
+        assert generator.validate_schedule_id("schedule-abc123\n") is False
 
     def test_list_registered_schedules(self, generator, daily_schedule, weekly_schedule):
         """Should list all registered schedule IDs."""
@@ -317,6 +639,71 @@ class TestLaunchdGenerator:
         assert daily_schedule.id in schedule_ids
         assert weekly_schedule.id in schedule_ids
 
+    def test_list_registered_schedules_ignores_other_entries(self, generator, temp_plist_dir):
+        """Only com.upkeep.schedule.<id>.plist files are listed."""
+        (temp_plist_dir / "com.upkeep.schedule.schedule-abc.plist").write_bytes(b"")
+        (temp_plist_dir / "com.upkeep.schedule..plist").write_bytes(b"")
+        (temp_plist_dir / "com.other.agent.plist").write_bytes(b"")
+        (temp_plist_dir / "com.upkeep.schedule.schedule-dir.plist").mkdir()
+
+        assert generator.list_registered_schedules() == ["schedule-abc"]
+
+    def test_list_registered_schedules_missing_dir(self, generator, temp_plist_dir):
+        """A missing plist directory means nothing is registered."""
+        temp_plist_dir.rmdir()
+        assert generator.list_registered_schedules() == []
+
+
+class TestSchedulerLock:
+    """Test waiting for the global scheduler lock."""
+
+    @pytest.fixture
+    def lock_path(self, tmp_path):
+        return tmp_path / "scheduler.lock"
+
+    def test_acquires_free_lock(self, lock_path):
+        """Should take an uncontended lock immediately."""
+        with open(lock_path, "w") as fh:
+            assert asyncio.run(launchd._wait_for_flock(fh, 0)) is True
+
+    def test_times_out_while_held(self, lock_path):
+        """Should give up after the timeout without polling."""
+        with open(lock_path, "w") as holder:
+            fcntl.flock(holder, fcntl.LOCK_EX)
+            fh = open(lock_path, "w")
+
+            start = time.monotonic()
+            assert asyncio.run(launchd._wait_for_flock(fh, 0.2)) is False
+            assert time.monotonic() - start < 1
+
+    def test_wakes_when_released(self, lock_path):
+        """Should get the lock as soon as the holder releases it."""
+        holder = open(lock_path, "w")
+        fcntl.flock(holder, fcntl.LOCK_EX)
+        threading.Timer(0.1, holder.close).start()
+
+        with open(lock_path, "w") as fh:
+            start = time.monotonic()
+            assert asyncio.run(launchd._wait_for_flock(fh, 10)) is True
+            assert time.monotonic() - start < 1
+
+    def test_abandoned_wait_releases_lock(self, lock_path):
+        """A timed-out waiter should not keep the lock once it is granted."""
+        holder = open(lock_path, "w")
+        fcntl.flock(holder, fcntl.LOCK_EX)
+        fh = open(lock_path, "w")
+        assert asyncio.run(launchd._wait_for_flock(fh, 0)) is False
+        holder.close()
+
+        # The waiter thread gets the lock, then must drop it and close fh
+        with open(lock_path, "w") as other:
+            assert asyncio.run(launchd._wait_for_flock(other, 5)) is True
+        for _ in range(100):
+            if fh.closed:
+                break
+            time.sleep(0.01)
+        assert fh.closed
+
 
 class TestSchedulerEntryPoint:
     """Test the scheduler entry point script that executes scheduled tasks."""